@@ -44,7 +44,9 @@ from app.models.carepack import Carepack
 from app.models.sales_entry import SalesEntry
 from app.models.activity_log import ActivityLog
 from app.models.notification import Notification
-from app.models.file_upload import FileUpload
+from app.models.file_upload import FileBlob, FileUpload
+from app.models.dashboard_rollup import PipelineRollup, SalesDailyRollup
+from app.models.user_hierarchy_closure import UserHierarchyClosure
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,69 @@
+"""Add binary file storage columns and file_blobs table
+
+Moves the file storage schema out of the startup DDL in app.utils.storage:
+``file_uploads`` gains the storage backend / key / hash / size columns and
+its legacy base64 ``data`` becomes nullable, and ``file_blobs`` holds the
+content-addressed bytes of the ``db`` backend.  ``content`` uses EXTERNAL
+(uncompressed TOAST) storage so ranged reads can slice it without
+detoasting the whole value.
+
+Databases that already ran the startup DDL have all of this, so every
+statement is written to be a no-op on them.
+
+Revision ID: add_file_storage
+Revises: add_search_trgm_indexes
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+revision = 'add_file_storage'
+down_revision = 'add_search_trgm_indexes'
+branch_labels = None
+depends_on = None
+
+UPGRADE_SQL = [
+    # Normally created by the startup schema check in app.main
+    """
+    CREATE TABLE IF NOT EXISTS file_uploads (
+        id SERIAL PRIMARY KEY,
+        filename VARCHAR(255) NOT NULL,
+        original_filename VARCHAR(255) NOT NULL,
+        content_type VARCHAR(100) NOT NULL,
+        data TEXT,
+        created_at TIMESTAMPTZ DEFAULT NOW(),
+        updated_at TIMESTAMPTZ DEFAULT NOW()
+    )
+    """,
+    "ALTER TABLE file_uploads ALTER COLUMN data DROP NOT NULL",
+    "ALTER TABLE file_uploads ADD COLUMN IF NOT EXISTS storage_backend VARCHAR(20) "
+    "NOT NULL DEFAULT 'base64'",
+    "ALTER TABLE file_uploads ADD COLUMN IF NOT EXISTS storage_key VARCHAR(255)",
+    "ALTER TABLE file_uploads ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)",
+    "ALTER TABLE file_uploads ADD COLUMN IF NOT EXISTS size_bytes BIGINT",
+    "CREATE INDEX IF NOT EXISTS ix_file_uploads_storage_key ON file_uploads (storage_key)",
+    """
+    CREATE TABLE IF NOT EXISTS file_blobs (
+        content_hash VARCHAR(64) PRIMARY KEY,
+        size_bytes BIGINT NOT NULL,
+        content BYTEA NOT NULL,
+        created_at TIMESTAMPTZ DEFAULT NOW(),
+        last_used_at TIMESTAMPTZ DEFAULT NOW()
+    )
+    """,
+    "ALTER TABLE file_blobs ADD COLUMN IF NOT EXISTS last_used_at TIMESTAMPTZ DEFAULT NOW()",
+    "ALTER TABLE file_blobs ALTER COLUMN content SET STORAGE EXTERNAL",
+]
+
+
+def upgrade() -> None:
+    for statement in UPGRADE_SQL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    # data stays nullable: rows stored by the db / fs backends have no base64
+    # content to put back
+    op.drop_table('file_blobs')
+    op.drop_index('ix_file_uploads_storage_key', table_name='file_uploads')
+    for column in ('size_bytes', 'content_hash', 'storage_key', 'storage_backend'):
+        op.drop_column('file_uploads', column)
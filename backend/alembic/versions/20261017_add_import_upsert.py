@@ -0,0 +1,52 @@
+"""Add bulk import upsert support
+
+Adds mode / dry_run and update / conflict counters to import_jobs, and
+expression indexes on the natural keys bulk import upserts match on
+(BulkImportService.NATURAL_KEYS).  The indexes are not unique: existing
+data may already hold duplicates, and the CRM forms do not forbid them.
+
+Revision ID: add_import_upsert
+Revises: create_import_jobs
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'add_import_upsert'
+down_revision = 'create_import_jobs'
+branch_labels = None
+depends_on = None
+
+NATURAL_KEY_INDEXES = {
+    "ix_accounts_import_key": ("accounts", "lower(name), coalesce(gstin_no, '')"),
+    "ix_contacts_import_key": ("contacts", "lower(email)"),
+    "ix_partners_import_key": ("partners", "lower(company_name), coalesce(gst_number, '')"),
+    "ix_sales_entries_import_key": ("sales_entries", "po_number"),
+    "ix_products_import_key": ("products", "lower(name)"),
+}
+
+
+def upgrade() -> None:
+    op.add_column(
+        "import_jobs", sa.Column("mode", sa.String(20), server_default="insert")
+    )
+    op.add_column(
+        "import_jobs", sa.Column("dry_run", sa.Boolean, server_default="false")
+    )
+    op.add_column(
+        "import_jobs", sa.Column("rows_updated", sa.Integer, server_default="0")
+    )
+    op.add_column(
+        "import_jobs", sa.Column("conflict_count", sa.Integer, server_default="0")
+    )
+    for name, (table, expressions) in NATURAL_KEY_INDEXES.items():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({expressions})")
+
+
+def downgrade() -> None:
+    for name in NATURAL_KEY_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.drop_column("import_jobs", "conflict_count")
+    op.drop_column("import_jobs", "rows_updated")
+    op.drop_column("import_jobs", "dry_run")
+    op.drop_column("import_jobs", "mode")
@@ -0,0 +1,49 @@
+"""Add keyset pagination indexes
+
+Composite indexes matching the sort key of every paginated list
+(app.utils.pagination.Keyset), so both the first page and a cursor page
+(``WHERE (created_at, id) < (...) ORDER BY created_at DESC, id DESC``) are
+answered by a backward index scan instead of a sort.  The single-column
+activity_logs.created_at index is a prefix of the new one and is dropped.
+
+Revision ID: add_keyset_indexes
+Revises: add_import_upsert
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+revision = 'add_keyset_indexes'
+down_revision = 'add_import_upsert'
+branch_labels = None
+depends_on = None
+
+KEYSET_INDEXES = {
+    "ix_accounts_created_at_id": ("accounts", ["created_at", "id"]),
+    "ix_activity_logs_created_at_id": ("activity_logs", ["created_at", "id"]),
+    "ix_calendar_events_start_time_id": ("calendar_events", ["start_time", "id"]),
+    "ix_carepacks_created_at_id": ("carepacks", ["created_at", "id"]),
+    "ix_contacts_created_at_id": ("contacts", ["created_at", "id"]),
+    "ix_deals_created_at_id": ("deals", ["created_at", "id"]),
+    "ix_email_templates_created_at_id": ("email_templates", ["created_at", "id"]),
+    "ix_emails_created_at_id": ("emails", ["created_at", "id"]),
+    "ix_leads_created_at_id": ("leads", ["created_at", "id"]),
+    "ix_partners_created_at_id": ("partners", ["created_at", "id"]),
+    "ix_quotes_created_at_id": ("quotes", ["created_at", "id"]),
+    "ix_sales_entries_sale_date_created_at_id": (
+        "sales_entries", ["sale_date", "created_at", "id"]
+    ),
+    "ix_tasks_created_at_id": ("tasks", ["created_at", "id"]),
+    "ix_users_created_at_id": ("users", ["created_at", "id"]),
+}
+
+
+def upgrade() -> None:
+    for name, (table, columns) in KEYSET_INDEXES.items():
+        op.create_index(name, table, columns)
+    op.drop_index('ix_activity_logs_created_at', table_name='activity_logs')
+
+
+def downgrade() -> None:
+    op.create_index('ix_activity_logs_created_at', 'activity_logs', ['created_at'])
+    for name, (table, _columns) in KEYSET_INDEXES.items():
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,101 @@
+"""Add composite and partial indexes for the hot query shapes
+
+Every scoped list filters on its owner column (``assigned_to``, ``owner_id``
+or ``salesperson_id``) and orders by the keyset sort key, the kanban board
+pages one stage by ``kanban_order``, and the stats / my-summary queries
+filter on the owner plus ``stage`` / ``status`` / ``closing_date`` /
+``due_date``.  These indexes put the owner column in front of the sort key
+(or the grouped stage), so a single-owner scope reads one ordered range
+instead of filtering the global keyset index or sorting.
+
+The partial indexes only cover open deals / incomplete tasks: the
+my-summary lists and counts never look at closed rows, which are the bulk
+of a mature table.
+
+The single-column owner indexes and the (stage, kanban_order) indexes are
+prefixes of the new ones and are dropped.
+
+``scripts/explain_hot_queries.py`` replays the repository statements with
+``EXPLAIN (ANALYZE, BUFFERS)`` to check which index each one uses.
+
+Revision ID: add_query_indexes
+Revises: add_keyset_indexes
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'add_query_indexes'
+down_revision = 'add_keyset_indexes'
+branch_labels = None
+depends_on = None
+
+OPEN_DEAL = "stage NOT IN ('Closed Won', 'Closed Lost')"
+
+# name -> (table, columns, extra create_index keyword arguments)
+QUERY_INDEXES = {
+    # Scoped lists: owner column + keyset sort key
+    "ix_accounts_owner_id_created_at_id": ("accounts", ["owner_id", "created_at", "id"], {}),
+    "ix_calendar_events_owner_id_start_time_id": (
+        "calendar_events", ["owner_id", "start_time", "id"], {}
+    ),
+    "ix_contacts_owner_id_created_at_id": ("contacts", ["owner_id", "created_at", "id"], {}),
+    "ix_deals_owner_id_created_at_id": ("deals", ["owner_id", "created_at", "id"], {}),
+    "ix_emails_owner_id_created_at_id": ("emails", ["owner_id", "created_at", "id"], {}),
+    "ix_leads_assigned_to_created_at_id": ("leads", ["assigned_to", "created_at", "id"], {}),
+    "ix_partners_assigned_to_created_at_id": (
+        "partners", ["assigned_to", "created_at", "id"], {}
+    ),
+    "ix_sales_entries_salesperson_id_sale_date_created_at_id": (
+        "sales_entries", ["salesperson_id", "sale_date", "created_at", "id"], {}
+    ),
+    "ix_tasks_assigned_to_created_at_id": ("tasks", ["assigned_to", "created_at", "id"], {}),
+    # Kanban pages: WHERE stage = ? ORDER BY kanban_order, created_at DESC
+    "ix_leads_stage_kanban_order_created_at": (
+        "leads", ["stage", "kanban_order", sa.text("created_at DESC")], {}
+    ),
+    "ix_deals_stage_kanban_order_created_at": (
+        "deals", ["stage", "kanban_order", sa.text("created_at DESC")], {}
+    ),
+    # Per-stage stats (stage_totals) of one owner
+    "ix_leads_assigned_to_stage": ("leads", ["assigned_to", "stage"], {}),
+    "ix_deals_owner_id_stage": (
+        "deals", ["owner_id", "stage"], {"postgresql_include": ["value"]}
+    ),
+    "ix_sales_entries_salesperson_id_payment_status": (
+        "sales_entries", ["salesperson_id", "payment_status"],
+        {"postgresql_include": ["amount", "commission_amount"]},
+    ),
+    # My summary: open deals closing this month, open tasks by due date
+    "ix_deals_owner_id_closing_date_open": (
+        "deals", ["owner_id", "closing_date"],
+        {"postgresql_where": sa.text(OPEN_DEAL), "postgresql_include": ["stage", "value"]},
+    ),
+    "ix_tasks_assigned_to_due_date_open": (
+        "tasks", ["assigned_to", "due_date"],
+        {"postgresql_where": sa.text("status <> 'completed'")},
+    ),
+}
+
+# Superseded indexes: name -> (table, columns)
+DROPPED_INDEXES = {
+    "ix_deals_owner_id": ("deals", ["owner_id"]),
+    "ix_deals_stage_kanban_order": ("deals", ["stage", "kanban_order"]),
+    "ix_leads_assigned_to": ("leads", ["assigned_to"]),
+    "ix_leads_stage_kanban_order": ("leads", ["stage", "kanban_order"]),
+    "ix_tasks_assigned_to": ("tasks", ["assigned_to"]),
+}
+
+
+def upgrade() -> None:
+    for name, (table, columns, kwargs) in QUERY_INDEXES.items():
+        op.create_index(name, table, columns, **kwargs)
+    for name, (table, _columns) in DROPPED_INDEXES.items():
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for name, (table, columns) in DROPPED_INDEXES.items():
+        op.create_index(name, table, columns)
+    for name, (table, _columns, _kwargs) in QUERY_INDEXES.items():
+        op.drop_index(name, table_name=table)
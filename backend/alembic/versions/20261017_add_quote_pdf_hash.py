@@ -0,0 +1,25 @@
+"""Add quotes.pdf_hash
+
+Fingerprint of the inputs the stored PDF was rendered from.  A quote whose
+current fingerprint matches reuses its PDF; any other value (including
+NULL for PDFs rendered before this column) triggers a re-render.
+
+Revision ID: add_quote_pdf_hash
+Revises: add_quote_pdf_status
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'add_quote_pdf_hash'
+down_revision = 'add_quote_pdf_status'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("quotes", sa.Column("pdf_hash", sa.String(64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("quotes", "pdf_hash")
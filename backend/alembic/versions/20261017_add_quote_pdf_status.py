@@ -0,0 +1,26 @@
+"""Add quotes.pdf_status
+
+Quote PDFs are rendered in the background after the quote is saved;
+pdf_status tracks the render (pending / ready / failed).  Quotes that
+already have a PDF are backfilled as ready.
+
+Revision ID: add_quote_pdf_status
+Revises: create_user_hierarchy_closure
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'add_quote_pdf_status'
+down_revision = 'create_user_hierarchy_closure'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("quotes", sa.Column("pdf_status", sa.String(20), nullable=True))
+    op.execute("UPDATE quotes SET pdf_status = 'ready' WHERE pdf_url IS NOT NULL")
+
+
+def downgrade() -> None:
+    op.drop_column("quotes", "pdf_status")
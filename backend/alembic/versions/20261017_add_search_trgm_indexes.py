@@ -0,0 +1,45 @@
+"""Add trigram search indexes
+
+Enables pg_trgm and adds GIN trigram indexes on the searched name columns.
+Postgres answers ``column ILIKE '%term%'`` from them with a bitmap index
+scan instead of a sequential scan, both for the global ``/search`` endpoint
+and for the existing ``search`` filters of the list endpoints.  The indexes
+are maintained by Postgres on every write.
+
+Revision ID: add_search_trgm_indexes
+Revises: add_query_indexes
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+revision = 'add_search_trgm_indexes'
+down_revision = 'add_query_indexes'
+branch_labels = None
+depends_on = None
+
+TRGM_INDEXES = {
+    "ix_accounts_name_trgm": ("accounts", "name"),
+    "ix_contacts_first_name_trgm": ("contacts", "first_name"),
+    "ix_contacts_last_name_trgm": ("contacts", "last_name"),
+    "ix_deals_title_trgm": ("deals", "title"),
+    "ix_leads_company_name_trgm": ("leads", "company_name"),
+    "ix_sales_entries_customer_name_trgm": ("sales_entries", "customer_name"),
+}
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, (table, column) in TRGM_INDEXES.items():
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for name, (table, _column) in TRGM_INDEXES.items():
+        op.drop_index(name, table_name=table)
+    # The extension is kept: other objects may depend on it
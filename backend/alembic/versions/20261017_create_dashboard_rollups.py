@@ -0,0 +1,84 @@
+"""Create dashboard rollup tables (sales_daily_rollups, pipeline_rollups)
+
+The dashboard reads its sales and pipeline aggregates from these tables
+instead of scanning sales_entries / leads / deals on every page load.
+They are backfilled here and kept current by DashboardRollupService.
+
+Revision ID: create_dashboard_rollups
+Revises: 2a29ace8ebc7
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = 'create_dashboard_rollups'
+down_revision = '2a29ace8ebc7'
+branch_labels = None
+depends_on = None
+
+NIL = "'00000000-0000-0000-0000-000000000000'::uuid"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sales_daily_rollups",
+        sa.Column("sale_date", sa.Date, primary_key=True),
+        sa.Column("salesperson_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("partner_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("product_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("entry_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("total_amount", sa.Numeric(15, 2), nullable=False, server_default="0"),
+        sa.Column("pending_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index(
+        "ix_sales_daily_rollups_salesperson_date",
+        "sales_daily_rollups",
+        ["salesperson_id", "sale_date"],
+    )
+
+    op.create_table(
+        "pipeline_rollups",
+        sa.Column("entity", sa.String(20), primary_key=True),
+        sa.Column("owner_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("stage", sa.String(50), primary_key=True),
+        sa.Column("record_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("total_value", sa.Numeric(15, 2), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+
+    # Backfill from the raw tables
+    op.execute(f"""
+        INSERT INTO sales_daily_rollups
+            (sale_date, salesperson_id, partner_id, product_id,
+             entry_count, total_amount, pending_count)
+        SELECT sale_date, salesperson_id,
+               COALESCE(partner_id, {NIL}), COALESCE(product_id, {NIL}),
+               count(*), COALESCE(sum(amount), 0),
+               count(*) FILTER (WHERE payment_status = 'pending')
+        FROM sales_entries
+        GROUP BY 1, 2, 3, 4
+    """)
+    op.execute(f"""
+        INSERT INTO pipeline_rollups (entity, owner_id, stage, record_count, total_value)
+        SELECT 'lead', COALESCE(assigned_to, {NIL}), COALESCE(stage, ''),
+               count(*), COALESCE(sum(estimated_value), 0)
+        FROM leads
+        GROUP BY 2, 3
+    """)
+    op.execute(f"""
+        INSERT INTO pipeline_rollups (entity, owner_id, stage, record_count, total_value)
+        SELECT 'deal', COALESCE(owner_id, {NIL}), COALESCE(stage, ''),
+               count(*), COALESCE(sum(value), 0)
+        FROM deals
+        GROUP BY 2, 3
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("pipeline_rollups")
+    op.drop_index("ix_sales_daily_rollups_salesperson_date", table_name="sales_daily_rollups")
+    op.drop_table("sales_daily_rollups")
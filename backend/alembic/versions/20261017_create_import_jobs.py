@@ -0,0 +1,69 @@
+"""Create import_jobs and import_job_errors tables
+
+Background CSV imports record their progress in import_jobs after every
+committed batch so an interrupted job can resume from its last committed
+row.  Rejected rows go to import_job_errors until the job writes its error
+file.
+
+Revision ID: create_import_jobs
+Revises: add_quote_pdf_hash
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = 'create_import_jobs'
+down_revision = 'add_quote_pdf_hash'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "import_jobs",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa.text("uuid_generate_v4()"),
+        ),
+        sa.Column("entity", sa.String(50), nullable=False),
+        sa.Column("filename", sa.String(255), nullable=True),
+        sa.Column("file_url", sa.Text, nullable=True),
+        sa.Column("status", sa.String(20), server_default="queued"),
+        sa.Column("rows_processed", sa.Integer, server_default="0"),
+        sa.Column("rows_imported", sa.Integer, server_default="0"),
+        sa.Column("error_count", sa.Integer, server_default="0"),
+        sa.Column("last_row", sa.Integer, server_default="1"),
+        sa.Column("error_file_url", sa.Text, nullable=True),
+        sa.Column("message", sa.Text, nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index(
+        "ix_import_jobs_status_updated", "import_jobs", ["status", "updated_at"]
+    )
+    op.create_table(
+        "import_job_errors",
+        sa.Column("id", sa.BigInteger, primary_key=True, autoincrement=True),
+        sa.Column(
+            "job_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("import_jobs.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("row", sa.Integer, nullable=False),
+        sa.Column("field", sa.String(100), nullable=True),
+        sa.Column("message", sa.Text, nullable=False),
+    )
+    op.create_index("ix_import_job_errors_job_id", "import_job_errors", ["job_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_import_job_errors_job_id", table_name="import_job_errors")
+    op.drop_table("import_job_errors")
+    op.drop_index("ix_import_jobs_status_updated", table_name="import_jobs")
+    op.drop_table("import_jobs")
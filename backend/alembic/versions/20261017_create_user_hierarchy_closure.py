@@ -0,0 +1,65 @@
+"""Create user_hierarchy_closure table
+
+Materialises the manager_id tree as (ancestor, descendant, depth) rows so
+record scoping can semi-join against it instead of binding a list of
+subordinate ids.  Backfilled here and maintained by UserHierarchyService.
+
+Revision ID: create_user_hierarchy_closure
+Revises: create_dashboard_rollups
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = 'create_user_hierarchy_closure'
+down_revision = 'create_dashboard_rollups'
+branch_labels = None
+depends_on = None
+
+# Matches UserHierarchyService.rebuild(); the depth cap stops the walk if
+# existing data contains a manager_id cycle.
+BACKFILL_SQL = """
+    INSERT INTO user_hierarchy_closure (ancestor_id, descendant_id, depth)
+    WITH RECURSIVE tree(ancestor_id, descendant_id, depth) AS (
+        SELECT id, id, 0 FROM users
+        UNION ALL
+        SELECT t.ancestor_id, u.id, t.depth + 1
+        FROM tree t
+        JOIN users u ON u.manager_id = t.descendant_id
+        WHERE t.depth < 64
+    )
+    SELECT ancestor_id, descendant_id, min(depth)
+    FROM tree
+    GROUP BY ancestor_id, descendant_id
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_hierarchy_closure",
+        sa.Column(
+            "ancestor_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "descendant_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("depth", sa.Integer, nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "ix_user_hierarchy_closure_descendant",
+        "user_hierarchy_closure",
+        ["descendant_id"],
+    )
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_hierarchy_closure_descendant", table_name="user_hierarchy_closure")
+    op.drop_table("user_hierarchy_closure")
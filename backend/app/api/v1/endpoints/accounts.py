@@ -36,6 +36,8 @@ router = APIRouter()
 async def list_accounts(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=1000, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    count: str = Query("exact", description="Total count: exact, estimated or none"),
     status: Optional[str] = Query(None, description="Filter by status"),
     industry: Optional[str] = Query(None, description="Filter by industry"),
     search: Optional[str] = Query(None, description="Search by account name"),
@@ -68,6 +70,8 @@ async def list_accounts(
         account_type=account_type,
         tag=tag,
         type_filter=type,
+        cursor=cursor,
+        count=count,
     )
 
     data = filter_fields(result["data"], fields) if fields else result["data"]
@@ -76,6 +80,8 @@ async def list_accounts(
         page=page,
         limit=limit,
         total=result["pagination"]["total"],
+        next_cursor=result["pagination"]["nextCursor"],
+        total_estimated=result["pagination"]["totalEstimated"],
         message="Accounts retrieved successfully",
     )
 
@@ -205,6 +211,8 @@ async def list_account_contacts(
     account_id: str,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    count: str = Query("exact", description="Total count: exact, estimated or none"),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> Dict[str, Any]:
@@ -221,7 +229,7 @@ async def list_account_contacts(
     """
     service = AccountService(db)
     result = await service.list_account_contacts(
-        account_id=account_id, page=page, limit=limit, user=user
+        account_id=account_id, page=page, limit=limit, user=user, cursor=cursor, count=count
     )
 
     return paginated_response(
@@ -229,6 +237,8 @@ async def list_account_contacts(
         page=page,
         limit=limit,
         total=result["pagination"]["total"],
+        next_cursor=result["pagination"]["nextCursor"],
+        total_estimated=result["pagination"]["totalEstimated"],
         message="Account contacts retrieved successfully",
     )
 
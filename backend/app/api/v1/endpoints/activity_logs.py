@@ -44,6 +44,8 @@ async def create_activity_log(
 async def list_activity_logs(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    count: str = Query("exact", description="Total count: exact, estimated or none"),
     user_id: Optional[str] = None,
     entity_type: Optional[str] = None,
     action: Optional[str] = None,
@@ -66,6 +68,8 @@ async def list_activity_logs(
     result = await service.list_activity_logs(
         page, limit, user_id, entity_type, action, date_from, date_to,
         current_user=user,
+        cursor=cursor,
+        count=count,
     )
     return success_response(
         result["data"],
@@ -19,6 +19,8 @@ router = APIRouter()
 async def list_users(
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    count: str = Query("exact", description="Total count: exact, estimated or none"),
     role: Optional[str] = None,
     is_active: Optional[bool] = None,
     admin: User = Depends(require_admin()),
@@ -31,7 +33,7 @@ async def list_users(
         Paginated list of users with manager names
     """
     service = AdminService(db)
-    result = await service.list_users(page, limit, role, is_active)
+    result = await service.list_users(page, limit, role, is_active, cursor=cursor, count=count)
     return success_response(
         result["data"],
         "Users retrieved successfully",
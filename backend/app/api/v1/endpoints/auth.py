@@ -14,6 +14,7 @@ from app.schemas.user_schema import (
     UserOut,
 )
 from app.services.auth_service import AuthService
+from app.utils.cache import principal_cache
 
 router = APIRouter()
 
@@ -67,8 +68,10 @@ async def update_dashboard_preferences(
 ):
     """Update current user's dashboard layout preferences"""
     user_repo = UserRepository(db)
-    # Update the dashboard_preferences field
-    user.dashboard_preferences = preferences.model_dump()
+    # get_current_user may return a cached, detached copy; update the row
+    db_user = await user_repo.get_by_id(user.id)
+    db_user.dashboard_preferences = preferences.model_dump()
+    principal_cache.invalidate_after_commit(db, user.id)
     await db.commit()
-    await db.refresh(user)
-    return DashboardPreferences.model_validate(user.dashboard_preferences)
+    await db.refresh(db_user)
+    return DashboardPreferences.model_validate(db_user.dashboard_preferences)
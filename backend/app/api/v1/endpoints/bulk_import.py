@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from fastapi import APIRouter, Depends, File, UploadFile
+from fastapi import APIRouter, Depends, File, Query, UploadFile
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -39,18 +39,89 @@ async def download_template(
 async def bulk_import(
     entity: str,
     file: UploadFile = File(...),
+    mode: str = Query("insert", description="insert, or upsert by the entity's natural key"),
+    dry_run: bool = Query(False, alias="dryRun"),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> Dict[str, Any]:
     """
     Accept a CSV file, validate each row, and bulk-insert valid records.
 
+    The file is processed in batches of IMPORT_BATCH_SIZE rows, so large
+    uploads are never held in memory as a whole.  With mode=upsert, rows
+    whose natural key matches an existing record update it; with dryRun the
+    counts are reported and nothing is written.
+
     Returns:
-        Dictionary with total, imported count, and errors
+        Dictionary with total, imported/inserted/updated counts, errors and
+        conflicts (capped at IMPORT_MAX_ERRORS), errorCount and conflictCount
     """
     service = BulkImportService(db)
-    result = await service.import_data(entity, file, user)
+    result = await service.import_data(entity, file, user, mode=mode, dry_run=dry_run)
+    verb = "Would import" if dry_run else "Imported"
     return success_response(
         result,
-        f"Imported {result['imported']} of {result['total']} {entity} records",
+        f"{verb} {result['imported']} of {result['total']} {entity} records",
     )
+
+
+@router.post("/jobs/{entity}", status_code=202)
+async def create_import_job(
+    entity: str,
+    file: UploadFile = File(...),
+    mode: str = Query("insert", description="insert, or upsert by the entity's natural key"),
+    dry_run: bool = Query(False, alias="dryRun"),
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Dict[str, Any]:
+    """
+    Queue a CSV file as a background import job.
+
+    Takes the same mode/dryRun options as /import/{entity}.  Poll
+    GET /jobs/{job_id} for progress; rejected and conflicting rows are
+    collected in an error file linked from the job when it completes.
+
+    Jobs run in the background of the worker process and are disabled
+    (400) where there is none that outlives the request, e.g. on Vercel;
+    see IMPORT_JOBS_ENABLED.
+
+    Returns:
+        The queued job
+    """
+    service = BulkImportService(db)
+    job = await service.create_job(entity, file, user, mode=mode, dry_run=dry_run)
+    return success_response(data=job, message="Import job queued", code=202)
+
+
+@router.get("/jobs/{job_id}")
+async def get_import_job(
+    job_id: str,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Dict[str, Any]:
+    """
+    Get the status and progress of an import job.
+
+    Returns:
+        The job with rows processed/imported, error count and error file URL
+    """
+    service = BulkImportService(db)
+    job = await service.get_job(job_id, user)
+    return success_response(data=job, message="Import job retrieved successfully")
+
+
+@router.post("/jobs/{job_id}/resume")
+async def resume_import_job(
+    job_id: str,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Dict[str, Any]:
+    """
+    Resume a failed or stalled import job from its last committed batch.
+
+    Returns:
+        The re-queued job
+    """
+    service = BulkImportService(db)
+    job = await service.resume_job(job_id, user)
+    return success_response(data=job, message="Import job resumed")
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -28,6 +28,8 @@ router = APIRouter()
 async def list_calendar_events(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    count: str = Query("exact", description="Total count: exact, estimated or none"),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> Dict[str, Any]:
@@ -43,13 +45,17 @@ async def list_calendar_events(
     }
     """
     service = CalendarEventService(db)
-    result = await service.list_calendar_events(page=page, limit=limit, user=user)
+    result = await service.list_calendar_events(
+        page=page, limit=limit, user=user, cursor=cursor, count=count
+    )
 
     return paginated_response(
         data=result["data"],
         page=page,
         limit=limit,
         total=result["pagination"]["total"],
+        next_cursor=result["pagination"]["nextCursor"],
+        total_estimated=result["pagination"]["totalEstimated"],
         message="Calendar events retrieved successfully",
     )
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -24,6 +24,8 @@ router = APIRouter()
 async def list_carepacks(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    count: str = Query("exact", description="Total count: exact, estimated or none"),
     status: str = Query(None, description="Filter by status"),
     partner_id: str = Query(None, description="Filter by partner ID"),
     user: User = Depends(get_current_user),
@@ -45,7 +47,7 @@ async def list_carepacks(
     """
     service = CarepackService(db)
     result = await service.list_carepacks(
-        page=page, limit=limit, status=status, partner_id=partner_id
+        page=page, limit=limit, status=status, partner_id=partner_id, cursor=cursor, count=count
     )
 
     return paginated_response(
@@ -53,6 +55,8 @@ async def list_carepacks(
         page=page,
         limit=limit,
         total=result["pagination"]["total"],
+        next_cursor=result["pagination"]["nextCursor"],
+        total_estimated=result["pagination"]["totalEstimated"],
         message="Carepacks retrieved successfully",
     )
 
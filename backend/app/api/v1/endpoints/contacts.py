@@ -36,6 +36,8 @@ router = APIRouter()
 async def list_contacts(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    count: str = Query("exact", description="Total count: exact, estimated or none"),
     account_id: Optional[str] = Query(None, description="Filter by account"),
     status: Optional[str] = Query(None, description="Filter by status"),
     type: Optional[str] = Query(None, description="Filter by type"),
@@ -64,6 +66,8 @@ async def list_contacts(
         status=status,
         type=type,
         search=search,
+        cursor=cursor,
+        count=count,
     )
 
     data = filter_fields(result["data"], fields) if fields else result["data"]
@@ -72,6 +76,8 @@ async def list_contacts(
         page=page,
         limit=limit,
         total=result["pagination"]["total"],
+        next_cursor=result["pagination"]["nextCursor"],
+        total_estimated=result["pagination"]["totalEstimated"],
         message="Contacts retrieved successfully",
     )
 
@@ -4,14 +4,21 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.middleware.rbac import require_admin
 from app.middleware.security import get_current_user
 from app.models.user import User
 from app.services.dashboard_service import DashboardService
+from app.utils.cache import DASHBOARD_CACHE, payload_cache
 from app.utils.response_utils import success_response
 
 router = APIRouter()
 
 
+def _scope_key(view: str, user: User, *parts: str) -> str:
+    """Cache key for a dashboard payload as seen by ``user``'s scope."""
+    return ":".join([view, str(user.id), user.role, *parts])
+
+
 @router.get("/")
 async def dashboard_stats(
     user: User = Depends(get_current_user),
@@ -73,7 +80,9 @@ async def dashboard_all(
         Comprehensive dashboard data including stats, growth, monthly data, lead/deal/task stats, breakdown, and assignee summary
     """
     service = DashboardService(db)
-    data = await service.get_dashboard_all(user)
+    data = await payload_cache.get_or_compute(
+        DASHBOARD_CACHE, _scope_key("all", user), lambda: service.get_dashboard_all(user)
+    )
     return success_response(data, "Dashboard data retrieved successfully")
 
 
@@ -88,7 +97,9 @@ async def my_summary(
     and sales user targets.
     """
     service = DashboardService(db)
-    data = await service.get_my_summary(user)
+    data = await payload_cache.get_or_compute(
+        DASHBOARD_CACHE, _scope_key("my-summary", user), lambda: service.get_my_summary(user)
+    )
     return success_response(data, "My summary retrieved successfully")
 
 
@@ -105,5 +116,25 @@ async def assignee_detail(
         Detailed analytics including sales, leads, deals, and tasks for the specified user
     """
     service = DashboardService(db)
-    data = await service.get_assignee_detail(user_id, user)
+    data = await payload_cache.get_or_compute(
+        DASHBOARD_CACHE,
+        _scope_key("assignee", user, user_id),
+        lambda: service.get_assignee_detail(user_id, user),
+    )
     return success_response(data, "Assignee details retrieved successfully")
+
+
+@router.get("/cache-stats")
+async def cache_stats(
+    admin: User = Depends(require_admin()),
+):
+    """
+    Hit/miss counters of the dashboard payload cache for this worker.
+
+    Returns:
+        Backend name, hits, misses, hit rate and invalidation count of the
+        dashboard namespace (other namespaces share the cache but not these counters)
+    """
+    return success_response(
+        payload_cache.stats(DASHBOARD_CACHE), "Cache statistics retrieved successfully"
+    )
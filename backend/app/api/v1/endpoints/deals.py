@@ -40,6 +40,8 @@ router = APIRouter()
 async def list_deals(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    count: str = Query("exact", description="Total count: exact, estimated or none"),
     stage: Optional[str] = Query(None, description="Filter by stage"),
     account_id: Optional[str] = Query(None, description="Filter by account"),
     owner: Optional[str] = Query(None, description="Filter by owner"),
@@ -66,6 +68,8 @@ async def list_deals(
         stage=stage,
         account_id=account_id,
         owner=owner,
+        cursor=cursor,
+        count=count,
     )
 
     data = filter_fields(result["data"], fields) if fields else result["data"]
@@ -74,6 +78,8 @@ async def list_deals(
         page=page,
         limit=limit,
         total=result["pagination"]["total"],
+        next_cursor=result["pagination"]["nextCursor"],
+        total_estimated=result["pagination"]["totalEstimated"],
         message="Deals retrieved successfully",
     )
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -27,6 +27,8 @@ router = APIRouter()
 async def list_email_templates(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    count: str = Query("exact", description="Total count: exact, estimated or none"),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> Dict[str, Any]:
@@ -42,13 +44,17 @@ async def list_email_templates(
     }
     """
     service = EmailTemplateService(db)
-    result = await service.list_email_templates(page=page, limit=limit, user=user)
+    result = await service.list_email_templates(
+        page=page, limit=limit, user=user, cursor=cursor, count=count
+    )
 
     return paginated_response(
         data=result["data"],
         page=page,
         limit=limit,
         total=result["pagination"]["total"],
+        next_cursor=result["pagination"]["nextCursor"],
+        total_estimated=result["pagination"]["totalEstimated"],
         message="Email templates retrieved successfully",
     )
 
@@ -35,6 +35,8 @@ router = APIRouter()
 async def list_emails(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    count: str = Query("exact", description="Total count: exact, estimated or none"),
     status: Optional[str] = Query(None, description="Filter by status"),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
@@ -51,13 +53,17 @@ async def list_emails(
     }
     """
     service = EmailService(db)
-    result = await service.list_emails(page=page, limit=limit, user=user, status=status)
+    result = await service.list_emails(
+        page=page, limit=limit, user=user, status=status, cursor=cursor, count=count
+    )
 
     return paginated_response(
         data=result["data"],
         page=page,
         limit=limit,
         total=result["pagination"]["total"],
+        next_cursor=result["pagination"]["nextCursor"],
+        total_estimated=result["pagination"]["totalEstimated"],
         message="Emails retrieved successfully",
     )
 
@@ -41,6 +41,8 @@ router = APIRouter()
 async def list_leads(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    count: str = Query("exact", description="Total count: exact, estimated or none"),
     stage: Optional[str] = Query(None, description="Filter by stage"),
     priority: Optional[str] = Query(None, description="Filter by priority"),
     assigned_to: Optional[str] = Query(None, description="Filter by assigned user"),
@@ -69,6 +71,8 @@ async def list_leads(
         priority=priority,
         assigned_to=assigned_to,
         source=source,
+        cursor=cursor,
+        count=count,
     )
 
     data = filter_fields(result["data"], fields) if fields else result["data"]
@@ -77,6 +81,8 @@ async def list_leads(
         page=page,
         limit=limit,
         total=result["pagination"]["total"],
+        next_cursor=result["pagination"]["nextCursor"],
+        total_estimated=result["pagination"]["totalEstimated"],
         message="Leads retrieved successfully",
     )
 
@@ -78,6 +78,8 @@ async def save_targets(
 async def list_partners(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    count: str = Query("exact", description="Total count: exact, estimated or none"),
     status: Optional[str] = Query(None, description="Filter by status"),
     tier: Optional[str] = Query(None, description="Filter by tier"),
     city: Optional[str] = Query(None, description="Filter by city"),
@@ -105,6 +107,8 @@ async def list_partners(
         tier=tier,
         city=city,
         assigned_to=assigned_to,
+        cursor=cursor,
+        count=count,
     )
 
     return paginated_response(
@@ -112,6 +116,8 @@ async def list_partners(
         page=page,
         limit=limit,
         total=result["pagination"]["total"],
+        next_cursor=result["pagination"]["nextCursor"],
+        total_estimated=result["pagination"]["totalEstimated"],
         message="Partners retrieved successfully",
     )
 
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+from datetime import date
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -24,6 +27,8 @@ router = APIRouter()
 async def list_quotes(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    count: str = Query("exact", description="Total count: exact, estimated or none"),
     status: str = Query(None, description="Filter by status"),
     lead_id: str = Query(None, description="Filter by lead ID"),
     deal_id: str = Query(None, description="Filter by deal ID"),
@@ -47,7 +52,13 @@ async def list_quotes(
     """
     service = QuoteService(db)
     result = await service.list_quotes(
-        page=page, limit=limit, status=status, lead_id=lead_id, deal_id=deal_id
+        page=page,
+        limit=limit,
+        status=status,
+        lead_id=lead_id,
+        deal_id=deal_id,
+        cursor=cursor,
+        count=count,
     )
 
     return paginated_response(
@@ -55,10 +66,46 @@ async def list_quotes(
         page=page,
         limit=limit,
         total=result["pagination"]["total"],
+        next_cursor=result["pagination"]["nextCursor"],
+        total_estimated=result["pagination"]["totalEstimated"],
         message="Quotes retrieved successfully",
     )
 
 
+@router.get("/export/pdf")
+async def export_quote_pdfs(
+    partner_id: str = Query(None, description="Filter by partner ID"),
+    month: str = Query(
+        None, pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="Created in month (YYYY-MM)"
+    ),
+    status: str = Query(None, description="Filter by status"),
+    user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    Download the PDFs of all matching quotes as a ZIP archive.
+
+    The archive is streamed as PDFs become ready; missing or outdated PDFs
+    are rendered in parallel on the render pool.
+
+    Args:
+        partner_id: Filter by partner ID
+        month: Filter by creation month (YYYY-MM)
+        status: Filter by status
+        user: Current user
+
+    Returns:
+        Streamed ZIP archive
+    """
+    filename = f"quotes-{month or date.today().isoformat()}.zip"
+    return StreamingResponse(
+        QuoteService.export_pdf_archive(
+            partner_id=partner_id, month=month, status=status
+        ),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/{quote_id}", response_model=Dict[str, Any])
 async def get_quote(
     quote_id: str,
@@ -97,7 +144,7 @@ async def create_quote(
         db: Database session
 
     Returns:
-        Created quote with line items and PDF URL
+        Created quote with line items (PDF renders in the background, see pdfStatus)
     """
     service = QuoteService(db)
     quote = await service.create_quote(quote_data=body, user=user)
@@ -122,7 +169,7 @@ async def update_quote(
         db: Database session
 
     Returns:
-        Updated quote with line items and PDF URL
+        Updated quote with line items (PDF re-renders in the background, see pdfStatus)
     """
     service = QuoteService(db)
     quote = await service.update_quote(quote_id=quote_id, quote_data=body)
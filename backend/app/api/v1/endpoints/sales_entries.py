@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -25,6 +25,8 @@ router = APIRouter()
 async def list_sales_entries(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    count: str = Query("exact", description="Total count: exact, estimated or none"),
     partner_id: str = Query(None, description="Filter by partner ID"),
     product_id: str = Query(None, description="Filter by product ID"),
     salesperson_id: str = Query(None, description="Filter by salesperson ID"),
@@ -57,6 +59,8 @@ async def list_sales_entries(
         vertical_id=vertical_id,
         deal_id=deal_id,
         search=search,
+        cursor=cursor,
+        count=count,
     )
 
     data = filter_fields(result["data"], fields) if fields else result["data"]
@@ -65,6 +69,8 @@ async def list_sales_entries(
         page=page,
         limit=limit,
         total=result["pagination"]["total"],
+        next_cursor=result["pagination"]["nextCursor"],
+        total_estimated=result["pagination"]["totalEstimated"],
         message="Sales entries retrieved successfully",
     )
 
@@ -0,0 +1,43 @@
+"""
+Search API Endpoints
+
+Global search across leads, deals, accounts, contacts and sales entries.
+Controllers are thin and delegate business logic to the SearchService.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.middleware.security import get_current_user
+from app.models.user import User
+from app.services.search_service import SearchService
+from app.utils.response_utils import success_response
+
+router = APIRouter()
+
+
+@router.get("/")
+async def search(
+    q: str = Query(..., description="Search term (at least 3 characters)"),
+    types: Optional[str] = Query(
+        None, description="Comma-separated types: lead, deal, account, contact, sales_entry"
+    ),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of hits"),
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Dict[str, Any]:
+    """
+    Search the user's records by name, best matches first.
+
+    Returns:
+        List of hits with type, id, title, subtitle and score
+    """
+    service = SearchService(db)
+    type_list = [t.strip() for t in types.split(",") if t.strip()] if types else None
+    data = await service.search(q, user, types=type_list, limit=limit)
+    return success_response(data, "Search results retrieved successfully")
@@ -35,6 +35,8 @@ router = APIRouter()
 async def list_tasks(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    count: str = Query("exact", description="Total count: exact, estimated or none"),
     status: Optional[str] = Query(None, description="Filter by status"),
     priority: Optional[str] = Query(None, description="Filter by priority"),
     type: Optional[str] = Query(None, description="Filter by type"),
@@ -62,6 +64,8 @@ async def list_tasks(
         priority=priority,
         type=type,
         assigned_to=assigned_to,
+        cursor=cursor,
+        count=count,
     )
 
     return paginated_response(
@@ -69,6 +73,8 @@ async def list_tasks(
         page=page,
         limit=limit,
         total=result["pagination"]["total"],
+        next_cursor=result["pagination"]["nextCursor"],
+        total_estimated=result["pagination"]["totalEstimated"],
         message="Tasks retrieved successfully",
     )
 
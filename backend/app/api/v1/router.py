@@ -22,6 +22,7 @@ from app.api.v1.endpoints import (
     quotes,
     roles,
     sales_entries,
+    search,
     settings,
     tasks,
     uploads,
@@ -53,3 +54,4 @@ api_router.include_router(activity_logs.router, prefix="/admin/activity-logs", t
 api_router.include_router(roles.router, prefix="/admin/roles", tags=["Roles"])
 api_router.include_router(bulk_import.router, prefix="/bulk", tags=["Bulk Import"])
 api_router.include_router(uploads.router, prefix="/uploads", tags=["Uploads"])
+api_router.include_router(search.router, prefix="/search", tags=["Search"])
@@ -1,5 +1,7 @@
+import os
 from typing import List, Optional
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -9,16 +11,56 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "postgresql+asyncpg://localhost:5432/comprint_crm"
     SECRET_KEY: str = "change-me-in-production"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 525600  # 1 year — effectively never expires
+
+    # Password hashing (bcrypt runs on a dedicated thread pool, off the event loop)
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 128  # queued + running; beyond this → 503
     # Allow configuration via environment variable (comma-separated URLs)
     # Default includes localhost and common Vercel pattern
     CORS_ORIGINS_STR: Optional[str] = None
     DEBUG: bool = False
     API_PREFIX: str = "/api"
 
-    # File storage config
+    # File storage config (STORAGE_BACKEND: db = BYTEA column, fs = files under UPLOAD_DIR)
+    STORAGE_BACKEND: str = "db"
+    STORAGE_CHUNK_SIZE: int = 256 * 1024
+    MAX_UPLOAD_SIZE_BYTES: int = 25 * 1024 * 1024
     UPLOAD_DIR: str = "uploads"
+    STORAGE_GC_GRACE_SECONDS: int = 3600  # unreferenced blobs used more recently are kept
     BASE_URL: str = "http://localhost:8080"
 
+    # Quote PDF rendering (PDF_RENDER_WORKERS processes; 0 = one thread, for hosts without fork/spawn)
+    PDF_RENDER_WORKERS: int = 2
+    PDF_RENDER_WAIT_SECONDS: int = 20  # how long GET /quotes/{id}/pdf waits on a pending render
+
+    # CSV bulk import (IMPORT_INSERT_METHOD: copy = PostgreSQL COPY, insert = multi-row INSERT)
+    IMPORT_BATCH_SIZE: int = 2000
+    IMPORT_INSERT_METHOD: str = "copy"
+    IMPORT_MAX_ERRORS: int = 1000  # row errors returned; the rest are only counted
+    IMPORT_JOB_CONCURRENCY: int = 2  # background import jobs run at once per worker
+    IMPORT_JOB_STALE_SECONDS: int = 300  # running job without progress this long is resumable
+    # Import jobs run as tasks of the worker process, so they need one that outlives the
+    # request; off by default on Vercel, whose functions are frozen after responding
+    IMPORT_JOBS_ENABLED: bool = Field(default_factory=lambda: not os.getenv("VERCEL"))
+
+    # Payload cache config (memory = per-process, redis = shared via CACHE_URL)
+    CACHE_BACKEND: str = "memory"
+    CACHE_URL: Optional[str] = None
+    CACHE_MAX_ENTRIES: int = 2048
+    DASHBOARD_CACHE_TTL_SECONDS: int = 60
+    # Dashboard query groups run at once, counting the request's own connection
+    # (1 = sequential; always sequential under NullPool, i.e. on Supabase)
+    DASHBOARD_QUERY_CONCURRENCY: int = 4
+    AUTH_USER_CACHE_TTL_SECONDS: int = 30  # 0 disables the get_current_user cache
+
+    # Paginated list totals (?count=estimated counts exactly below the threshold)
+    COUNT_CACHE_TTL_SECONDS: int = 30
+    COUNT_EXACT_THRESHOLD: int = 10000
+
+    # Org hierarchy index used for record scoping (reloaded at least this often)
+    ORG_INDEX_TTL_SECONDS: int = 300
+
     @property
     def CORS_ORIGINS(self) -> List[str]:
         """Parse CORS origins from environment variable or use defaults"""
@@ -34,6 +34,16 @@ class ConflictException(CRMException):
         super().__init__(detail=detail, status_code=409)
 
 
+class PayloadTooLargeException(CRMException):
+    def __init__(self, detail: str = "Payload too large"):
+        super().__init__(detail=detail, status_code=413)
+
+
+class ServiceUnavailableException(CRMException):
+    def __init__(self, detail: str = "Service temporarily unavailable"):
+        super().__init__(detail=detail, status_code=503)
+
+
 async def crm_exception_handler(request: Request, exc: CRMException) -> JSONResponse:
     return JSONResponse(
         status_code=exc.status_code,
@@ -10,6 +10,8 @@ from app.api.v1.router import api_router
 from app.config import settings
 from app.database import engine
 from app.exceptions import CRMException, crm_exception_handler, generic_exception_handler
+from app.services.bulk_import_service import BulkImportService, import_jobs
+from app.utils.pdf_jobs import pdf_jobs, shutdown_render_pool
 
 
 _schema_ensured = False
@@ -161,7 +163,18 @@ async def _ensure_schema() -> None:
 async def lifespan(app: FastAPI):
     """Run schema migrations on startup (works locally, not on Vercel)."""
     await _ensure_schema()
+    # Picks up import jobs left behind by a crashed or restarted worker
+    import_watcher = None
+    if settings.IMPORT_JOBS_ENABLED:
+        import_watcher = asyncio.create_task(BulkImportService.watch_interrupted_jobs())
     yield
+    if import_watcher is not None:
+        import_watcher.cancel()
+    # Let in-flight quote PDF renders finish before the worker exits; import
+    # jobs still running afterwards resume from their last committed batch
+    await pdf_jobs.drain(timeout=settings.PDF_RENDER_WAIT_SECONDS)
+    await import_jobs.drain(timeout=settings.PDF_RENDER_WAIT_SECONDS)
+    shutdown_render_pool()
 
 
 app = FastAPI(
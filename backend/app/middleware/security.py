@@ -9,6 +9,7 @@ from app.exceptions import UnauthorizedException
 from app.models.user import User
 from app.repositories.user_repository import UserRepository
 from app.services.auth_service import AuthService
+from app.utils.cache import principal_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
 
@@ -24,9 +25,13 @@ async def get_current_user(
     auth_service = AuthService(user_repo)
     payload = auth_service.verify_token(token)
 
-    user = await user_repo.get_by_id(payload.get("sub"))
-    if not user:
-        raise UnauthorizedException("User not found")
+    # Cached users are detached copies; re-fetch before modifying them
+    user = await principal_cache.get(payload["sub"])
+    if user is None:
+        user = await user_repo.get_by_id(payload.get("sub"))
+        if not user:
+            raise UnauthorizedException("User not found")
+        await principal_cache.put(user)
     if not user.is_active:
         raise UnauthorizedException("Account is deactivated")
     return user
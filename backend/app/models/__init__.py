@@ -24,6 +24,9 @@ from app.models.activity_log import ActivityLog
 from app.models.role import Role
 from app.models.role_permission import RolePermission
 from app.models.master_dropdown import MasterDropdown
+from app.models.dashboard_rollup import PipelineRollup, SalesDailyRollup
+from app.models.user_hierarchy_closure import UserHierarchyClosure
+from app.models.import_job import ImportJob, ImportJobError
 
 __all__ = [
     "Base",
@@ -53,4 +56,9 @@ __all__ = [
     "Role",
     "RolePermission",
     "MasterDropdown",
+    "SalesDailyRollup",
+    "PipelineRollup",
+    "UserHierarchyClosure",
+    "ImportJob",
+    "ImportJobError",
 ]
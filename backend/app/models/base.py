@@ -1,7 +1,7 @@
 from typing import Optional
 from datetime import datetime
 
-from sqlalchemy import func
+from sqlalchemy import DateTime, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -11,9 +11,11 @@ class Base(DeclarativeBase):
 
 class TimestampMixin:
     created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
         server_default=func.now(),
     )
     updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
         server_default=func.now(),
         onupdate=func.now(),
     )
@@ -0,0 +1,43 @@
+import uuid
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, Integer, Numeric, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, TimestampMixin
+
+# Rollup keys are part of the primary key, so missing partner/product/owner
+# references are stored as the nil UUID instead of NULL.
+NIL_UUID = uuid.UUID(int=0)
+
+
+class SalesDailyRollup(TimestampMixin, Base):
+    """Per-day x salesperson x partner x product aggregate of sales_entries."""
+
+    __tablename__ = "sales_daily_rollups"
+
+    sale_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    salesperson_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    partner_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    product_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    entry_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    total_amount: Mapped[Decimal] = mapped_column(
+        Numeric(15, 2), nullable=False, server_default="0"
+    )
+    pending_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+
+
+class PipelineRollup(TimestampMixin, Base):
+    """Per-assignee x stage counters for leads and deals."""
+
+    __tablename__ = "pipeline_rollups"
+
+    entity: Mapped[str] = mapped_column(String(20), primary_key=True)  # lead / deal
+    owner_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    stage: Mapped[str] = mapped_column(String(50), primary_key=True)
+    record_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    total_value: Mapped[Decimal] = mapped_column(
+        Numeric(15, 2), nullable=False, server_default="0"
+    )
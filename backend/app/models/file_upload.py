@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from sqlalchemy import Integer, String, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, Integer, LargeBinary, String, Text, func
+from sqlalchemy.orm import Mapped, deferred, mapped_column
 
 from app.models.base import Base, TimestampMixin
 
@@ -13,4 +16,31 @@ class FileUpload(Base, TimestampMixin):
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
     original_filename: Mapped[str] = mapped_column(String(255), nullable=False)
     content_type: Mapped[str] = mapped_column(String(100), nullable=False)
-    data: Mapped[str] = mapped_column(Text, nullable=False)  # base64-encoded
+    storage_backend: Mapped[str] = mapped_column(
+        String(20), nullable=False, server_default="base64"
+    )  # Options: db, fs, base64 (legacy)
+    storage_key: Mapped[Optional[str]] = mapped_column(
+        String(255), nullable=True, index=True
+    )  # content hash of the blob / file
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)  # sha256 hex
+    size_bytes: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    data: Mapped[Optional[str]] = deferred(
+        mapped_column(Text, nullable=True)
+    )  # legacy base64-encoded content
+
+
+class FileBlob(Base):
+    """Content-addressed file bytes for the ``db`` storage backend."""
+
+    __tablename__ = "file_blobs"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    content: Mapped[bytes] = deferred(mapped_column(LargeBinary, nullable=False))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    # Refreshed on every dedup hit; garbage collection keeps recently used blobs
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
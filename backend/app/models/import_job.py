@@ -0,0 +1,67 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, TimestampMixin
+
+
+class ImportJob(TimestampMixin, Base):
+    """A background CSV import.
+
+    Batches commit together with the job's counters, so ``last_row`` is
+    always the last CSV line whose rows are in the database and a resumed
+    job continues from the line after it.
+    """
+
+    __tablename__ = "import_jobs"
+    __table_args__ = (
+        Index("ix_import_jobs_status_updated", "status", "updated_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v4()")
+    )
+    entity: Mapped[str] = mapped_column(String(50), nullable=False)
+    filename: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    file_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # uploaded CSV
+    mode: Mapped[str] = mapped_column(String(20), server_default="insert")  # insert, upsert
+    dry_run: Mapped[bool] = mapped_column(Boolean, server_default="false")
+    status: Mapped[str] = mapped_column(
+        String(20), server_default="queued"
+    )  # Options: queued, running, completed, failed
+    rows_processed: Mapped[int] = mapped_column(Integer, server_default="0")
+    rows_imported: Mapped[int] = mapped_column(Integer, server_default="0")  # inserted + updated
+    rows_updated: Mapped[int] = mapped_column(Integer, server_default="0")
+    error_count: Mapped[int] = mapped_column(Integer, server_default="0")
+    conflict_count: Mapped[int] = mapped_column(Integer, server_default="0")
+    last_row: Mapped[int] = mapped_column(Integer, server_default="1")  # line 1 is the header
+    error_file_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
+class ImportJobError(Base):
+    """A rejected or conflicting row of an import job.
+
+    Turned into the job's error file when the job finishes.
+    """
+
+    __tablename__ = "import_job_errors"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    job_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("import_jobs.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    row: Mapped[int] = mapped_column(Integer, nullable=False)
+    field: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
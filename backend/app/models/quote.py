@@ -31,4 +31,6 @@ class Quote(TimestampMixin, Base):
     terms: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     pdf_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    pdf_status: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    pdf_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     created_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
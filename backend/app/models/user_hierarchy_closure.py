@@ -0,0 +1,28 @@
+import uuid
+
+from sqlalchemy import ForeignKey, Index, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class UserHierarchyClosure(Base):
+    """Transitive closure of ``users.manager_id``.
+
+    One row per (ancestor, descendant) pair, including a depth-0 row for
+    every user, so "everyone under X" is ``WHERE ancestor_id = X``.
+    """
+
+    __tablename__ = "user_hierarchy_closure"
+    __table_args__ = (
+        Index("ix_user_hierarchy_closure_descendant", "descendant_id"),
+    )
+
+    ancestor_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    descendant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    depth: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
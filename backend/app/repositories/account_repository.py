@@ -6,6 +6,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.account import Account
 from app.models.user import User
 from app.repositories.base import BaseRepository
+from app.utils.pagination import Keyset, count_rows
+
+
+# Sort key of the paginated list (newest first)
+LIST_KEYSET = Keyset(Account.created_at, Account.id)
 
 
 class AccountRepository(BaseRepository[Account]):
@@ -17,6 +22,8 @@ class AccountRepository(BaseRepository[Account]):
         page: int = 1,
         limit: int = 20,
         filters: list | None = None,
+        cursor: str | None = None,
+        count: str = "exact",
     ) -> dict:
         stmt = (
             select(Account, User.name.label("owner_name"))
@@ -29,12 +36,10 @@ class AccountRepository(BaseRepository[Account]):
                 stmt = stmt.where(f)
                 count_stmt = count_stmt.where(f)
 
-        stmt = stmt.order_by(Account.created_at.desc())
-        offset = (page - 1) * limit
-        stmt = stmt.offset(offset).limit(limit)
+        stmt = LIST_KEYSET.paginate(stmt, page, limit, cursor)
 
         result = await self.db.execute(stmt)
-        rows = result.all()
+        rows, next_cursor = LIST_KEYSET.split(result.all(), limit)
 
         items = []
         for row in rows:
@@ -43,9 +48,8 @@ class AccountRepository(BaseRepository[Account]):
                 "owner_name": row[1],
             })
 
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-        total_pages = (total + limit - 1) // limit
+        total, estimated = await count_rows(self.db, count_stmt, count)
+        total_pages = (total + limit - 1) // limit if total is not None else None
 
         return {
             "data": items,
@@ -54,6 +58,8 @@ class AccountRepository(BaseRepository[Account]):
                 "limit": limit,
                 "total": total,
                 "totalPages": total_pages,
+                "nextCursor": next_cursor,
+                "totalEstimated": estimated,
             },
         }
 
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import Any, Generic, TypeVar, Sequence
 
-from sqlalchemy import func, select, delete as sql_delete, update as sql_update
+from sqlalchemy import (
+    column,
+    func,
+    insert,
+    inspect,
+    select,
+    values,
+    delete as sql_delete,
+    update as sql_update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.utils.pagination import Keyset, count_rows, invalidate_counts_after_commit
 
 ModelType = TypeVar("ModelType")
 
+# Bind parameters per statement stay well under PostgreSQL's 32767 limit
+_MAX_PARAMS = 30000
+
 
 class BaseRepository(Generic[ModelType]):
     """
@@ -20,17 +36,23 @@ class BaseRepository(Generic[ModelType]):
         self.db = db
         self.model = model
 
-    async def get_by_id(self, id: Any) -> ModelType | None:
+    async def get_by_id(self, id: Any, for_update: bool = False) -> ModelType | None:
         """
         Get a single entity by ID.
 
         Args:
             id: Entity ID
+            for_update: Lock the row (SELECT ... FOR UPDATE) until the
+                transaction ends and reload it, so values read from it stay
+                current for the rest of the transaction
 
         Returns:
             Entity instance or None if not found
         """
-        result = await self.db.execute(select(self.model).where(self.model.id == id))
+        stmt = select(self.model).where(self.model.id == id)
+        if for_update:
+            stmt = stmt.with_for_update().execution_options(populate_existing=True)
+        result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
     async def get_by_ids(self, ids: Sequence[Any]) -> list[ModelType]:
@@ -148,16 +170,23 @@ class BaseRepository(Generic[ModelType]):
         order_by: str = "created_at",
         descending: bool = True,
         filters: list | None = None,
+        cursor: str | None = None,
+        count: str = "exact",
     ) -> dict:
         """
         Get paginated results with total count.
 
+        Descending orders are broken by id, and can be paged with ``cursor``
+        (the ``nextCursor`` of the previous page) instead of ``page``.
+
         Args:
             page: Page number (1-based)
             limit: Number of items per page
             order_by: Column name to order by
             descending: Sort in descending order
             filters: List of SQLAlchemy filter expressions
+            cursor: Keyset cursor of the previous page
+            count: Total count mode ("exact", "estimated" or "none")
 
         Returns:
             Dictionary with 'data' and 'pagination' keys
@@ -171,18 +200,20 @@ class BaseRepository(Generic[ModelType]):
                 count_stmt = count_stmt.where(f)
 
         col = getattr(self.model, order_by, None)
-        if col is not None:
-            stmt = stmt.order_by(col.desc() if descending else col)
-
-        offset = (page - 1) * limit
-        stmt = stmt.offset(offset).limit(limit)
-
-        result = await self.db.execute(stmt)
-        items = list(result.scalars().all())
-
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-        total_pages = (total + limit - 1) // limit
+        next_cursor = None
+        if descending:
+            keys = [col] if col is not None and col.key != "id" else []
+            keyset = Keyset(*keys, self.model.id)
+            stmt = keyset.paginate(stmt, page, limit, cursor)
+            items, next_cursor = keyset.split((await self.db.execute(stmt)).scalars().all(), limit)
+        else:
+            if col is not None:
+                stmt = stmt.order_by(col)
+            stmt = stmt.offset((page - 1) * limit).limit(limit)
+            items = list((await self.db.execute(stmt)).scalars().all())
+
+        total, estimated = await count_rows(self.db, count_stmt, count)
+        total_pages = (total + limit - 1) // limit if total is not None else None
 
         return {
             "data": items,
@@ -191,6 +222,8 @@ class BaseRepository(Generic[ModelType]):
                 "limit": limit,
                 "total": total,
                 "totalPages": total_pages,
+                "nextCursor": next_cursor,
+                "totalEstimated": estimated,
             },
         }
 
@@ -212,25 +245,37 @@ class BaseRepository(Generic[ModelType]):
 
     async def bulk_create(self, items: list[dict]) -> list[ModelType]:
         """
-        Bulk create multiple entities.
+        Bulk create multiple entities with INSERT ... RETURNING.
+
+        Rows go out as multi-row INSERT statements (up to 1000 rows each)
+        that return the created rows, so generated IDs and server defaults
+        come back without a refresh per object.  Items setting different
+        columns are inserted separately so omitted columns keep their
+        defaults.  Items may only set column attributes, not relationships.
 
         Args:
             items: List of dictionaries with entity attributes
 
         Returns:
-            List of created entity instances
+            List of created entity instances, in the order of ``items``
         """
         if not items:
             return []
 
-        db_objs = [self.model(**item) for item in items]
-        self.db.add_all(db_objs)
-        await self.db.flush()
+        groups: dict[tuple, list[int]] = defaultdict(list)
+        for position, item in enumerate(items):
+            groups[tuple(sorted(item))].append(position)
 
-        # Refresh all objects to get generated IDs and defaults
-        for obj in db_objs:
-            await self.db.refresh(obj)
+        db_objs: list[Any] = [None] * len(items)
+        for positions in groups.values():
+            result = await self.db.scalars(
+                insert(self.model).returning(self.model, sort_by_parameter_order=True),
+                [items[position] for position in positions],
+            )
+            for position, obj in zip(positions, result.all()):
+                db_objs[position] = obj
 
+        invalidate_counts_after_commit(self.db, self.model.__tablename__)
         return db_objs
 
     async def update(self, id: Any, obj_data: dict) -> ModelType | None:
@@ -256,7 +301,12 @@ class BaseRepository(Generic[ModelType]):
 
     async def bulk_update(self, updates: list[dict]) -> int:
         """
-        Bulk update multiple entities.
+        Bulk update multiple entities with UPDATE ... FROM (VALUES ...).
+
+        Updates setting the same fields are applied by one statement that
+        joins the table to a VALUES list of (id, new values) rows, instead of
+        one UPDATE per entity.  Entities already loaded in the session get
+        the new values too.
 
         Args:
             updates: List of dicts with 'id' and fields to update
@@ -264,21 +314,48 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Number of entities updated
         """
-        if not updates:
+        groups: dict[tuple, list[tuple[Any, dict]]] = defaultdict(list)
+        for update_data in updates:
+            entity_id = update_data.get("id")
+            fields = {key: value for key, value in update_data.items() if key != "id"}
+            if entity_id and fields:
+                groups[tuple(sorted(fields))].append((entity_id, fields))
+        if not groups:
             return 0
 
+        await self.db.flush()
+        columns = inspect(self.model).columns
+        table = self.model.__table__
         count = 0
-        for update_data in updates:
-            entity_id = update_data.pop("id", None)
-            if entity_id and update_data:
+        for keys, group in groups.items():
+            size = max(1, _MAX_PARAMS // (len(keys) + 1))
+            for start in range(0, len(group), size):
+                chunk = group[start:start + size]
+                data = values(
+                    column("id", table.c.id.type),
+                    *[column(key, columns[key].type) for key in keys],
+                    name="bulk_rows",
+                ).data([(entity_id, *(fields[key] for key in keys)) for entity_id, fields in chunk])
                 result = await self.db.execute(
-                    sql_update(self.model)
-                    .where(self.model.id == entity_id)
-                    .values(**update_data)
+                    sql_update(table)
+                    .where(table.c.id == data.c.id)
+                    .values({columns[key]: data.c[key] for key in keys})
                 )
                 count += result.rowcount
 
-        await self.db.flush()
+        loaded = {
+            str(key[1][0]): obj
+            for key, obj in self.db.identity_map.items()
+            if isinstance(obj, self.model)
+        }
+        if loaded:
+            for group in groups.values():
+                for entity_id, fields in group:
+                    obj = loaded.get(str(entity_id))
+                    if obj is not None:
+                        for key, value in fields.items():
+                            set_committed_value(obj, key, value)
+        invalidate_counts_after_commit(self.db, self.model.__tablename__)
         return count
 
     async def delete(self, id: Any) -> bool:
@@ -315,6 +392,7 @@ class BaseRepository(Generic[ModelType]):
             sql_delete(self.model).where(self.model.id.in_(ids))
         )
         await self.db.flush()
+        invalidate_counts_after_commit(self.db, self.model.__tablename__)
         return result.rowcount
 
     async def soft_delete(self, id: Any) -> bool:
@@ -8,6 +8,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.calendar_event import CalendarEvent
 from app.models.user import User
 from app.repositories.base import BaseRepository
+from app.utils.pagination import Keyset, count_rows
+
+
+# Sort key of the paginated list (newest first)
+LIST_KEYSET = Keyset(CalendarEvent.start_time, CalendarEvent.id)
 
 
 class CalendarEventRepository(BaseRepository[CalendarEvent]):
@@ -19,6 +24,8 @@ class CalendarEventRepository(BaseRepository[CalendarEvent]):
         page: int = 1,
         limit: int = 20,
         filters: list | None = None,
+        cursor: str | None = None,
+        count: str = "exact",
     ) -> dict:
         stmt = (
             select(CalendarEvent, User.name.label("owner_name"))
@@ -31,12 +38,10 @@ class CalendarEventRepository(BaseRepository[CalendarEvent]):
                 stmt = stmt.where(f)
                 count_stmt = count_stmt.where(f)
 
-        stmt = stmt.order_by(CalendarEvent.start_time.desc())
-        offset = (page - 1) * limit
-        stmt = stmt.offset(offset).limit(limit)
+        stmt = LIST_KEYSET.paginate(stmt, page, limit, cursor)
 
         result = await self.db.execute(stmt)
-        rows = result.all()
+        rows, next_cursor = LIST_KEYSET.split(result.all(), limit)
 
         items = []
         for row in rows:
@@ -45,9 +50,8 @@ class CalendarEventRepository(BaseRepository[CalendarEvent]):
                 "owner_name": row[1],
             })
 
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-        total_pages = (total + limit - 1) // limit
+        total, estimated = await count_rows(self.db, count_stmt, count)
+        total_pages = (total + limit - 1) // limit if total is not None else None
 
         return {
             "data": items,
@@ -56,6 +60,8 @@ class CalendarEventRepository(BaseRepository[CalendarEvent]):
                 "limit": limit,
                 "total": total,
                 "totalPages": total_pages,
+                "nextCursor": next_cursor,
+                "totalEstimated": estimated,
             },
         }
 
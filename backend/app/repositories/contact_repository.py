@@ -7,6 +7,11 @@ from app.models.account import Account
 from app.models.contact import Contact
 from app.models.user import User
 from app.repositories.base import BaseRepository
+from app.utils.pagination import Keyset, count_rows
+
+
+# Sort key of the paginated list (newest first)
+LIST_KEYSET = Keyset(Contact.created_at, Contact.id)
 
 
 class ContactRepository(BaseRepository[Contact]):
@@ -18,6 +23,8 @@ class ContactRepository(BaseRepository[Contact]):
         page: int = 1,
         limit: int = 20,
         filters: list | None = None,
+        cursor: str | None = None,
+        count: str = "exact",
     ) -> dict:
         stmt = (
             select(
@@ -35,12 +42,10 @@ class ContactRepository(BaseRepository[Contact]):
                 stmt = stmt.where(f)
                 count_stmt = count_stmt.where(f)
 
-        stmt = stmt.order_by(Contact.created_at.desc())
-        offset = (page - 1) * limit
-        stmt = stmt.offset(offset).limit(limit)
+        stmt = LIST_KEYSET.paginate(stmt, page, limit, cursor)
 
         result = await self.db.execute(stmt)
-        rows = result.all()
+        rows, next_cursor = LIST_KEYSET.split(result.all(), limit)
 
         items = []
         for row in rows:
@@ -50,9 +55,8 @@ class ContactRepository(BaseRepository[Contact]):
                 "owner_name": row[2],
             })
 
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-        total_pages = (total + limit - 1) // limit
+        total, estimated = await count_rows(self.db, count_stmt, count)
+        total_pages = (total + limit - 1) // limit if total is not None else None
 
         return {
             "data": items,
@@ -61,6 +65,8 @@ class ContactRepository(BaseRepository[Contact]):
                 "limit": limit,
                 "total": total,
                 "totalPages": total_pages,
+                "nextCursor": next_cursor,
+                "totalEstimated": estimated,
             },
         }
 
@@ -69,6 +75,8 @@ class ContactRepository(BaseRepository[Contact]):
         account_id,
         page: int = 1,
         limit: int = 20,
+        cursor: str | None = None,
+        count: str = "exact",
     ) -> dict:
         stmt = (
             select(
@@ -86,12 +94,10 @@ class ContactRepository(BaseRepository[Contact]):
             .where(Contact.account_id == account_id)
         )
 
-        stmt = stmt.order_by(Contact.created_at.desc())
-        offset = (page - 1) * limit
-        stmt = stmt.offset(offset).limit(limit)
+        stmt = LIST_KEYSET.paginate(stmt, page, limit, cursor)
 
         result = await self.db.execute(stmt)
-        rows = result.all()
+        rows, next_cursor = LIST_KEYSET.split(result.all(), limit)
 
         items = []
         for row in rows:
@@ -101,9 +107,8 @@ class ContactRepository(BaseRepository[Contact]):
                 "owner_name": row[2],
             })
 
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-        total_pages = (total + limit - 1) // limit
+        total, estimated = await count_rows(self.db, count_stmt, count)
+        total_pages = (total + limit - 1) // limit if total is not None else None
 
         return {
             "data": items,
@@ -112,5 +117,7 @@ class ContactRepository(BaseRepository[Contact]):
                 "limit": limit,
                 "total": total,
                 "totalPages": total_pages,
+                "nextCursor": next_cursor,
+                "totalEstimated": estimated,
             },
         }
@@ -13,6 +13,12 @@ from app.models.deal_activity import DealActivity
 from app.models.deal_line_item import DealLineItem
 from app.models.user import User
 from app.repositories.base import BaseRepository
+from app.utils.aggregation import stage_totals
+from app.utils.pagination import Keyset, count_rows
+
+
+# Sort key of the paginated list (newest first)
+LIST_KEYSET = Keyset(Deal.created_at, Deal.id)
 
 
 class DealRepository(BaseRepository[Deal]):
@@ -24,6 +30,8 @@ class DealRepository(BaseRepository[Deal]):
         page: int = 1,
         limit: int = 20,
         filters: list | None = None,
+        cursor: str | None = None,
+        count: str = "exact",
     ) -> dict:
         stmt = (
             select(
@@ -43,12 +51,10 @@ class DealRepository(BaseRepository[Deal]):
                 stmt = stmt.where(f)
                 count_stmt = count_stmt.where(f)
 
-        stmt = stmt.order_by(Deal.created_at.desc())
-        offset = (page - 1) * limit
-        stmt = stmt.offset(offset).limit(limit)
+        stmt = LIST_KEYSET.paginate(stmt, page, limit, cursor)
 
         result = await self.db.execute(stmt)
-        rows = result.all()
+        rows, next_cursor = LIST_KEYSET.split(result.all(), limit)
 
         items = []
         for row in rows:
@@ -59,9 +65,8 @@ class DealRepository(BaseRepository[Deal]):
                 "owner_name": row[3],
             })
 
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-        total_pages = (total + limit - 1) // limit
+        total, estimated = await count_rows(self.db, count_stmt, count)
+        total_pages = (total + limit - 1) // limit if total is not None else None
 
         return {
             "data": items,
@@ -70,39 +75,16 @@ class DealRepository(BaseRepository[Deal]):
                 "limit": limit,
                 "total": total,
                 "totalPages": total_pages,
+                "nextCursor": next_cursor,
+                "totalEstimated": estimated,
             },
         }
 
     async def get_pipeline_stats(self, filters: list | None = None) -> dict:
-        stages = [
-            "New", "Cold", "Proposal", "Negotiation",
-            "Closed Won", "Closed Lost",
-        ]
-        stats = {}
-        for stage in stages:
-            count_stmt = (
-                select(func.count())
-                .select_from(Deal)
-                .where(Deal.stage == stage)
-            )
-            value_stmt = (
-                select(func.coalesce(func.sum(Deal.value), 0))
-                .select_from(Deal)
-                .where(Deal.stage == stage)
-            )
-            if filters:
-                for f in filters:
-                    count_stmt = count_stmt.where(f)
-                    value_stmt = value_stmt.where(f)
-
-            count_result = await self.db.execute(count_stmt)
-            value_result = await self.db.execute(value_stmt)
-
-            stats[stage] = {
-                "count": count_result.scalar_one(),
-                "value": float(value_result.scalar_one()),
-            }
-        return stats
+        by_stage, _overall = await stage_totals(
+            self.db, Deal.stage, sums={"value": Deal.value}, filters=filters
+        )
+        return by_stage
 
     async def get_by_account(self, account_id) -> list:
         stmt = (
@@ -7,6 +7,11 @@ from app.models.email import Email
 from app.models.email_template import EmailTemplate
 from app.models.user import User
 from app.repositories.base import BaseRepository
+from app.utils.pagination import Keyset, count_rows
+
+
+# Sort key of the paginated list (newest first)
+LIST_KEYSET = Keyset(Email.created_at, Email.id)
 
 
 class EmailRepository(BaseRepository[Email]):
@@ -18,6 +23,8 @@ class EmailRepository(BaseRepository[Email]):
         page: int = 1,
         limit: int = 20,
         filters: list | None = None,
+        cursor: str | None = None,
+        count: str = "exact",
     ) -> dict:
         stmt = (
             select(
@@ -35,12 +42,10 @@ class EmailRepository(BaseRepository[Email]):
                 stmt = stmt.where(f)
                 count_stmt = count_stmt.where(f)
 
-        stmt = stmt.order_by(Email.created_at.desc())
-        offset = (page - 1) * limit
-        stmt = stmt.offset(offset).limit(limit)
+        stmt = LIST_KEYSET.paginate(stmt, page, limit, cursor)
 
         result = await self.db.execute(stmt)
-        rows = result.all()
+        rows, next_cursor = LIST_KEYSET.split(result.all(), limit)
 
         items = []
         for row in rows:
@@ -50,9 +55,8 @@ class EmailRepository(BaseRepository[Email]):
                 "template_name": row[2],
             })
 
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-        total_pages = (total + limit - 1) // limit
+        total, estimated = await count_rows(self.db, count_stmt, count)
+        total_pages = (total + limit - 1) // limit if total is not None else None
 
         return {
             "data": items,
@@ -61,5 +65,7 @@ class EmailRepository(BaseRepository[Email]):
                 "limit": limit,
                 "total": total,
                 "totalPages": total_pages,
+                "nextCursor": next_cursor,
+                "totalEstimated": estimated,
             },
         }
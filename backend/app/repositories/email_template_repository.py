@@ -6,6 +6,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.email_template import EmailTemplate
 from app.models.user import User
 from app.repositories.base import BaseRepository
+from app.utils.pagination import Keyset, count_rows
+
+
+# Sort key of the paginated list (newest first)
+LIST_KEYSET = Keyset(EmailTemplate.created_at, EmailTemplate.id)
 
 
 class EmailTemplateRepository(BaseRepository[EmailTemplate]):
@@ -17,6 +22,8 @@ class EmailTemplateRepository(BaseRepository[EmailTemplate]):
         page: int = 1,
         limit: int = 20,
         filters: list | None = None,
+        cursor: str | None = None,
+        count: str = "exact",
     ) -> dict:
         stmt = (
             select(EmailTemplate, User.name.label("owner_name"))
@@ -29,12 +36,10 @@ class EmailTemplateRepository(BaseRepository[EmailTemplate]):
                 stmt = stmt.where(f)
                 count_stmt = count_stmt.where(f)
 
-        stmt = stmt.order_by(EmailTemplate.created_at.desc())
-        offset = (page - 1) * limit
-        stmt = stmt.offset(offset).limit(limit)
+        stmt = LIST_KEYSET.paginate(stmt, page, limit, cursor)
 
         result = await self.db.execute(stmt)
-        rows = result.all()
+        rows, next_cursor = LIST_KEYSET.split(result.all(), limit)
 
         items = []
         for row in rows:
@@ -43,9 +48,8 @@ class EmailTemplateRepository(BaseRepository[EmailTemplate]):
                 "owner_name": row[1],
             })
 
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-        total_pages = (total + limit - 1) // limit
+        total, estimated = await count_rows(self.db, count_stmt, count)
+        total_pages = (total + limit - 1) // limit if total is not None else None
 
         return {
             "data": items,
@@ -54,5 +58,7 @@ class EmailTemplateRepository(BaseRepository[EmailTemplate]):
                 "limit": limit,
                 "total": total,
                 "totalPages": total_pages,
+                "nextCursor": next_cursor,
+                "totalEstimated": estimated,
             },
         }
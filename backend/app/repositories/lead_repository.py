@@ -9,6 +9,12 @@ from app.models.lead import Lead
 from app.models.lead_activity import LeadActivity
 from app.models.user import User
 from app.repositories.base import BaseRepository
+from app.utils.aggregation import stage_totals
+from app.utils.pagination import Keyset, count_rows
+
+
+# Sort key of the paginated list (newest first)
+LIST_KEYSET = Keyset(Lead.created_at, Lead.id)
 
 
 class LeadRepository(BaseRepository[Lead]):
@@ -20,6 +26,8 @@ class LeadRepository(BaseRepository[Lead]):
         page: int = 1,
         limit: int = 20,
         filters: list | None = None,
+        cursor: str | None = None,
+        count: str = "exact",
     ) -> dict:
         stmt = (
             select(Lead, User.name.label("assigned_to_name"))
@@ -32,12 +40,10 @@ class LeadRepository(BaseRepository[Lead]):
                 stmt = stmt.where(f)
                 count_stmt = count_stmt.where(f)
 
-        stmt = stmt.order_by(Lead.created_at.desc())
-        offset = (page - 1) * limit
-        stmt = stmt.offset(offset).limit(limit)
+        stmt = LIST_KEYSET.paginate(stmt, page, limit, cursor)
 
         result = await self.db.execute(stmt)
-        rows = result.all()
+        rows, next_cursor = LIST_KEYSET.split(result.all(), limit)
 
         items = []
         for row in rows:
@@ -46,9 +52,8 @@ class LeadRepository(BaseRepository[Lead]):
                 "assigned_to_name": row[1],
             })
 
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-        total_pages = (total + limit - 1) // limit
+        total, estimated = await count_rows(self.db, count_stmt, count)
+        total_pages = (total + limit - 1) // limit if total is not None else None
 
         return {
             "data": items,
@@ -57,20 +62,14 @@ class LeadRepository(BaseRepository[Lead]):
                 "limit": limit,
                 "total": total,
                 "totalPages": total_pages,
+                "nextCursor": next_cursor,
+                "totalEstimated": estimated,
             },
         }
 
     async def get_stats(self, filters: list | None = None) -> dict:
-        stages = ["New", "Cold", "Proposal", "Negotiation", "Closed Won", "Closed Lost"]
-        stats = {}
-        for stage in stages:
-            stmt = select(func.count()).select_from(Lead).where(Lead.stage == stage)
-            if filters:
-                for f in filters:
-                    stmt = stmt.where(f)
-            result = await self.db.execute(stmt)
-            stats[stage] = result.scalar_one()
-        return stats
+        by_stage, _overall = await stage_totals(self.db, Lead.stage, filters=filters)
+        return {stage: totals["count"] for stage, totals in by_stage.items()}
 
     async def get_activities(self, lead_id) -> list:
         stmt = (
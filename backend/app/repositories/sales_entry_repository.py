@@ -11,6 +11,12 @@ from app.models.partner import Partner
 from app.models.product import Product
 from app.models.user import User
 from app.repositories.base import BaseRepository
+from app.utils.aggregation import stage_totals
+from app.utils.pagination import Keyset, count_rows
+
+
+# Sort key of the paginated list (newest first)
+LIST_KEYSET = Keyset(SalesEntry.sale_date, SalesEntry.created_at, SalesEntry.id)
 
 
 class SalesEntryRepository(BaseRepository[SalesEntry]):
@@ -22,6 +28,8 @@ class SalesEntryRepository(BaseRepository[SalesEntry]):
         page: int = 1,
         limit: int = 20,
         filters: list | None = None,
+        cursor: str | None = None,
+        count: str = "exact",
     ) -> dict:
         stmt = (
             select(
@@ -41,12 +49,10 @@ class SalesEntryRepository(BaseRepository[SalesEntry]):
                 stmt = stmt.where(f)
                 count_stmt = count_stmt.where(f)
 
-        stmt = stmt.order_by(SalesEntry.sale_date.desc(), SalesEntry.created_at.desc())
-        offset = (page - 1) * limit
-        stmt = stmt.offset(offset).limit(limit)
+        stmt = LIST_KEYSET.paginate(stmt, page, limit, cursor)
 
         result = await self.db.execute(stmt)
-        rows = result.all()
+        rows, next_cursor = LIST_KEYSET.split(result.all(), limit)
 
         # Collect all product_ids from entries that have them
         all_product_ids: set[str] = set()
@@ -84,9 +90,8 @@ class SalesEntryRepository(BaseRepository[SalesEntry]):
                 "salesperson_name": row[3],
             })
 
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-        total_pages = (total + limit - 1) // limit
+        total, estimated = await count_rows(self.db, count_stmt, count)
+        total_pages = (total + limit - 1) // limit if total is not None else None
 
         return {
             "data": items,
@@ -95,43 +100,24 @@ class SalesEntryRepository(BaseRepository[SalesEntry]):
                 "limit": limit,
                 "total": total,
                 "totalPages": total_pages,
+                "nextCursor": next_cursor,
+                "totalEstimated": estimated,
             },
         }
 
     async def get_summary(self, filters: list | None = None) -> dict:
-        stmt = select(
-            func.coalesce(func.sum(SalesEntry.amount), 0).label("total_amount"),
-            func.count().label("total_count"),
-            func.coalesce(func.sum(SalesEntry.commission_amount), 0).label("total_commission"),
-        )
-        if filters:
-            for f in filters:
-                stmt = stmt.where(f)
-
-        result = await self.db.execute(stmt)
-        row = result.one()
-
-        # Pending payments count
-        pending_stmt = select(func.count()).select_from(SalesEntry).where(
-            SalesEntry.payment_status == "pending"
+        by_status, overall = await stage_totals(
+            self.db,
+            SalesEntry.payment_status,
+            sums={"amount": SalesEntry.amount, "commission": SalesEntry.commission_amount},
+            filters=filters,
         )
-        paid_stmt = select(func.count()).select_from(SalesEntry).where(
-            SalesEntry.payment_status == "paid"
-        )
-        if filters:
-            for f in filters:
-                pending_stmt = pending_stmt.where(f)
-                paid_stmt = paid_stmt.where(f)
-
-        pending_result = await self.db.execute(pending_stmt)
-        paid_result = await self.db.execute(paid_stmt)
-
         return {
-            "total_amount": float(row.total_amount),
-            "total_count": row.total_count,
-            "total_commission": float(row.total_commission),
-            "pending_payments": pending_result.scalar_one(),
-            "paid_count": paid_result.scalar_one(),
+            "total_amount": overall["amount"],
+            "total_count": overall["count"],
+            "total_commission": overall["commission"],
+            "pending_payments": by_status["pending"]["count"],
+            "paid_count": by_status["paid"]["count"],
         }
 
     async def get_breakdown(self, filters: list | None = None) -> dict:
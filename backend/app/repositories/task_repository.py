@@ -7,6 +7,12 @@ from sqlalchemy.orm import aliased
 from app.models.task import Task
 from app.models.user import User
 from app.repositories.base import BaseRepository
+from app.utils.aggregation import stage_totals
+from app.utils.pagination import Keyset, count_rows
+
+
+# Sort key of the paginated list (newest first)
+LIST_KEYSET = Keyset(Task.created_at, Task.id)
 
 
 class TaskRepository(BaseRepository[Task]):
@@ -18,6 +24,8 @@ class TaskRepository(BaseRepository[Task]):
         page: int = 1,
         limit: int = 20,
         filters: list | None = None,
+        cursor: str | None = None,
+        count: str = "exact",
     ) -> dict:
         CreatorUser = aliased(User)
 
@@ -37,12 +45,10 @@ class TaskRepository(BaseRepository[Task]):
                 stmt = stmt.where(f)
                 count_stmt = count_stmt.where(f)
 
-        stmt = stmt.order_by(Task.created_at.desc())
-        offset = (page - 1) * limit
-        stmt = stmt.offset(offset).limit(limit)
+        stmt = LIST_KEYSET.paginate(stmt, page, limit, cursor)
 
         result = await self.db.execute(stmt)
-        rows = result.all()
+        rows, next_cursor = LIST_KEYSET.split(result.all(), limit)
 
         items = []
         for row in rows:
@@ -52,9 +58,8 @@ class TaskRepository(BaseRepository[Task]):
                 "created_by_name": row[2],
             })
 
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-        total_pages = (total + limit - 1) // limit
+        total, estimated = await count_rows(self.db, count_stmt, count)
+        total_pages = (total + limit - 1) // limit if total is not None else None
 
         return {
             "data": items,
@@ -63,17 +68,11 @@ class TaskRepository(BaseRepository[Task]):
                 "limit": limit,
                 "total": total,
                 "totalPages": total_pages,
+                "nextCursor": next_cursor,
+                "totalEstimated": estimated,
             },
         }
 
     async def get_stats(self, filters: list | None = None) -> dict:
-        statuses = ["pending", "in_progress", "completed"]
-        stats = {}
-        for status in statuses:
-            stmt = select(func.count()).select_from(Task).where(Task.status == status)
-            if filters:
-                for f in filters:
-                    stmt = stmt.where(f)
-            result = await self.db.execute(stmt)
-            stats[status] = result.scalar_one()
-        return stats
+        by_status, _overall = await stage_totals(self.db, Task.status, filters=filters)
+        return {status: totals["count"] for status, totals in by_status.items()}
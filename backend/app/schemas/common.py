@@ -31,8 +31,10 @@ class PaginationMeta(BaseModel):
 
     page: int
     limit: int
-    total: int
-    total_pages: int
+    total: Optional[int]  # None with ?count=none
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None  # pass back as ?cursor= for the next page
+    total_estimated: bool = False  # total is a planner estimate (?count=estimated)
 
     model_config = ConfigDict(
         alias_generator=to_camel,
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from app.schemas.common import CamelModel
+
+
+class ImportJobOut(CamelModel):
+    id: UUID
+    entity: str
+    filename: Optional[str] = None
+    mode: str = "insert"
+    dry_run: bool = False
+    status: str = "queued"
+    rows_processed: int = 0
+    rows_imported: int = 0
+    rows_updated: int = 0
+    error_count: int = 0
+    conflict_count: int = 0
+    error_file_url: Optional[str] = None
+    message: Optional[str] = None
+    created_by: Optional[UUID] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
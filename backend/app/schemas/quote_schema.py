@@ -52,6 +52,7 @@ class QuoteOut(CamelModel):
     partner_name: Optional[str] = None
     line_items: Optional[list[QuoteLineItemOut]] = None
     pdf_url: Optional[str] = None
+    pdf_status: Optional[str] = None
     selected_term_ids: Optional[list[UUID]] = None
 
 
@@ -17,10 +17,14 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
+from sqlalchemy import literal_column, select
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.exceptions import NotFoundException
 from app.models.account import Account
+from app.models.deal import Deal
+from app.models.sales_entry import SalesEntry
 from app.models.user import User
 from app.repositories.account_repository import AccountRepository
 from app.repositories.contact_repository import ContactRepository
@@ -28,8 +32,19 @@ from app.repositories.deal_repository import DealRepository
 from app.schemas.account_schema import AccountCreate, AccountOut, AccountUpdate
 from app.schemas.contact_schema import ContactOut
 from app.schemas.deal_schema import DealOut
+from app.services.dashboard_rollup_service import (
+    DashboardRollupService,
+    deal_snapshot,
+    sales_snapshot,
+)
 from app.utils.activity_logger import compute_changes, log_activity, model_to_dict
-from app.utils.scoping import enforce_scope, get_scoped_user_ids
+from app.utils.cache import DASHBOARD_CACHE, payload_cache
+from app.utils.pagination import invalidate_counts_after_commit
+from app.utils.scoping import enforce_scope, scope_filter
+
+# sales_entries.account_id exists in the schema (ON DELETE CASCADE) but is not
+# mapped on SalesEntry
+_SALES_ENTRY_ACCOUNT_ID = literal_column("sales_entries.account_id", PG_UUID(as_uuid=True))
 
 
 class AccountService:
@@ -40,6 +55,7 @@ class AccountService:
         self.account_repo = AccountRepository(db)
         self.contact_repo = ContactRepository(db)
         self.deal_repo = DealRepository(db)
+        self.rollups = DashboardRollupService(db)
 
     async def list_accounts(
         self,
@@ -52,6 +68,8 @@ class AccountService:
         account_type: Optional[str] = None,
         tag: Optional[str] = None,
         type_filter: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count: str = "exact",
     ) -> Dict[str, Any]:
         """
         List accounts with filtering and pagination.
@@ -66,6 +84,8 @@ class AccountService:
             account_type: Optional account type filter (Channel Partner/End Customer)
             tag: Optional tag filter (Digital Account/Existing Account)
             type_filter: Optional type filter (Hunting/Farming/Cold)
+            cursor: Keyset cursor (``nextCursor`` of the previous page)
+            count: Total count mode ("exact", "estimated" or "none")
 
         Returns:
             Dictionary with 'data' (list of accounts) and 'pagination' metadata
@@ -86,13 +106,13 @@ class AccountService:
             filters.append(Account.type == type_filter)
 
         # Apply access control: non-admin users only see their team's accounts
-        scoped_ids = await get_scoped_user_ids(user, self.db)
-        if scoped_ids is not None:
-            filters.append(Account.owner_id.in_(scoped_ids))
+        scope = scope_filter(Account.owner_id, user)
+        if scope is not None:
+            filters.append(scope)
 
         # Fetch from repository
         result = await self.account_repo.get_with_owner(
-            page=page, limit=limit, filters=filters or None
+            page=page, limit=limit, cursor=cursor, count=count, filters=filters or None
         )
 
         # Transform data
@@ -256,16 +276,41 @@ class AccountService:
         # Store name before deletion
         account_name = account.name
 
+        # Deals and sales entries go with the account (ON DELETE CASCADE):
+        # lock them and take them out of the dashboard rollups
+        deals = await self.db.execute(
+            select(Deal).where(Deal.account_id == account.id).with_for_update()
+        )
+        entries = await self.db.execute(
+            select(SalesEntry).where(_SALES_ENTRY_ACCOUNT_ID == account.id).with_for_update()
+        )
+        deal_before = [deal_snapshot(deal) for deal in deals.scalars()]
+        sales_before = [sales_snapshot(entry) for entry in entries.scalars()]
+
         # Delete account
         await self.account_repo.delete(account_id)
 
+        await self.rollups.record_pipeline(before=deal_before)
+        await self.rollups.record_sales(before=sales_before)
+        if deal_before:
+            invalidate_counts_after_commit(self.db, Deal.__tablename__)
+        if sales_before:
+            invalidate_counts_after_commit(self.db, SalesEntry.__tablename__)
+
         # Log activity
         await log_activity(self.db, user, "delete", "account", account_id, account_name)
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         return True
 
     async def list_account_contacts(
-        self, account_id: str, page: int, limit: int, user: User
+        self,
+        account_id: str,
+        page: int,
+        limit: int,
+        user: User,
+        cursor: Optional[str] = None,
+        count: str = "exact",
     ) -> Dict[str, Any]:
         """
         List all contacts for a specific account.
@@ -275,12 +320,14 @@ class AccountService:
             page: Page number
             limit: Items per page
             user: Current authenticated user
+            cursor: Keyset cursor (``nextCursor`` of the previous page)
+            count: Total count mode ("exact", "estimated" or "none")
 
         Returns:
             Dictionary with 'data' and 'pagination'
         """
         result = await self.contact_repo.get_by_account(
-            account_id=account_id, page=page, limit=limit
+            account_id=account_id, page=page, limit=limit, cursor=cursor, count=count
         )
 
         # Transform data
@@ -18,11 +18,14 @@ from app.models.activity_log import ActivityLog
 from app.models.user import User
 from app.schemas.activity_log_schema import ActivityLogOut
 from app.utils.activity_logger import log_activity
+from app.utils.pagination import Keyset, count_rows
 
 # Roles that can see all activity logs
 _ADMIN_ROLES = {"admin", "superadmin"}
 # Roles that can see their own + their team's activity logs
 _MANAGER_ROLES = {"manager", "businesshead", "productmanager"}
+# Sort key of the paginated list (newest first)
+LIST_KEYSET = Keyset(ActivityLog.created_at, ActivityLog.id)
 
 
 class ActivityLogService:
@@ -70,6 +73,8 @@ class ActivityLogService:
         date_from: Optional[str] = None,
         date_to: Optional[str] = None,
         current_user: Optional[User] = None,
+        cursor: Optional[str] = None,
+        count: str = "exact",
     ) -> Dict[str, Any]:
         """
         List activity logs with pagination and filtering.
@@ -88,6 +93,8 @@ class ActivityLogService:
             date_from: Filter by start date (ISO format)
             date_to: Filter by end date (ISO format)
             current_user: The authenticated user (for role-based filtering)
+            cursor: Keyset cursor (``nextCursor`` of the previous page)
+            count: Total count mode ("exact", "estimated" or "none")
 
         Returns:
             Dictionary with data and pagination
@@ -138,23 +145,17 @@ class ActivityLogService:
         for cond in conditions:
             count_stmt = count_stmt.where(cond)
 
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar() or 0
-        total_pages = max(1, math.ceil(total / limit))
+        total, estimated = await count_rows(self.db, count_stmt, count)
+        total_pages = max(1, math.ceil(total / limit)) if total is not None else None
 
         # Get paginated data
-        offset = (page - 1) * limit
-        query = (
-            select(ActivityLog)
-            .order_by(ActivityLog.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-        )
+        query = select(ActivityLog)
         for cond in conditions:
             query = query.where(cond)
+        query = LIST_KEYSET.paginate(query, page, limit, cursor)
 
         result = await self.db.execute(query)
-        rows = result.scalars().all()
+        rows, next_cursor = LIST_KEYSET.split(result.scalars().all(), limit)
 
         data = [
             ActivityLogOut.model_validate(row).model_dump(by_alias=True)
@@ -168,6 +169,8 @@ class ActivityLogService:
                 "limit": limit,
                 "total": total,
                 "totalPages": total_pages,
+                "nextCursor": next_cursor,
+                "totalEstimated": estimated,
             },
         }
 
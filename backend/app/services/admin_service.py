@@ -16,7 +16,10 @@ from app.models.user import User
 from app.repositories.user_repository import UserRepository
 from app.schemas.user_schema import UserCreate, UserOut, UserUpdate
 from app.services.auth_service import AuthService
+from app.services.user_hierarchy_service import UserHierarchyService
 from app.utils.activity_logger import compute_changes, log_activity, model_to_dict
+from app.utils.cache import DASHBOARD_CACHE, payload_cache, principal_cache
+from app.utils.scoping import org_index
 
 
 class AdminService:
@@ -25,6 +28,7 @@ class AdminService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.user_repo = UserRepository(db)
+        self.hierarchy = UserHierarchyService(db)
 
     async def list_users(
         self,
@@ -32,6 +36,8 @@ class AdminService:
         limit: int,
         role: Optional[str] = None,
         is_active: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        count: str = "exact",
     ) -> Dict[str, Any]:
         """
         List users with pagination and filtering.
@@ -41,6 +47,8 @@ class AdminService:
             limit: Items per page
             role: Filter by role
             is_active: Filter by active status
+            cursor: Keyset cursor (``nextCursor`` of the previous page)
+            count: Total count mode ("exact", "estimated" or "none")
 
         Returns:
             Dictionary with data and pagination
@@ -52,7 +60,7 @@ class AdminService:
             filters.append(User.is_active == is_active)
 
         result = await self.user_repo.get_paginated(
-            page=page, limit=limit, filters=filters or None
+            page=page, limit=limit, cursor=cursor, count=count, filters=filters or None
         )
 
         users_list = result["data"]
@@ -101,12 +109,16 @@ class AdminService:
             raise BadRequestException("A user with this email already exists")
 
         data = user_data.model_dump(exclude_unset=True)
-        data["password_hash"] = AuthService.hash_password(data.pop("password"))
+        data["password_hash"] = await AuthService.hash_password(data.pop("password"))
 
         user = await self.user_repo.create(data)
+        await self.hierarchy.add_user(user.id, user.manager_id)
+        if user.manager_id:
+            org_index.invalidate_after_commit(self.db)
         await log_activity(
             self.db, admin, "create", "user", str(user.id), user.name or user.email
         )
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         return UserOut.model_validate(user).model_dump(by_alias=True)
 
@@ -126,6 +138,7 @@ class AdminService:
 
         Raises:
             NotFoundException: If user not found
+            BadRequestException: If the new manager reports to this user
         """
         old = await self.user_repo.get_by_id(user_id)
         if not old:
@@ -136,6 +149,14 @@ class AdminService:
             user_id, user_data.model_dump(exclude_unset=True)
         )
         changes = compute_changes(old_data, model_to_dict(user))
+        changed_fields = {c["field"] for c in changes}
+        if "manager_id" in changed_fields:
+            await self.hierarchy.move_user(user.id, user.manager_id)
+        # Reporting lines or role changed: rebuild the scoping index
+        if changed_fields & {"manager_id", "role"}:
+            org_index.invalidate_after_commit(self.db)
+        # Deactivation, role and profile changes must reach get_current_user
+        principal_cache.invalidate_after_commit(self.db, user.id)
         await log_activity(
             self.db,
             admin,
@@ -145,6 +166,7 @@ class AdminService:
             user.name or user.email,
             changes,
         )
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         return UserOut.model_validate(user).model_dump(by_alias=True)
 
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Any, Callable
 
 import bcrypt
 from jose import JWTError, jwt
 
 from app.config import settings
-from app.exceptions import BadRequestException, UnauthorizedException
+from app.exceptions import (
+    BadRequestException,
+    ServiceUnavailableException,
+    UnauthorizedException,
+)
 from app.repositories.user_repository import UserRepository
+from app.utils.cache import principal_cache
 
 ALGORITHM = "HS256"
 
@@ -15,7 +23,8 @@ ALGORITHM = "HS256"
 def _hash_password(password: str) -> str:
     """Hash a password using bcrypt. Truncates to 72 bytes (bcrypt limit)."""
     password_bytes = password.encode("utf-8")[:72]
-    return bcrypt.hashpw(password_bytes, bcrypt.gensalt()).decode("utf-8")
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password_bytes, salt).decode("utf-8")
 
 
 def _verify_password(password: str, password_hash: str) -> bool:
@@ -24,6 +33,37 @@ def _verify_password(password: str, password_hash: str) -> bool:
     return bcrypt.checkpw(password_bytes, password_hash.encode("utf-8"))
 
 
+# bcrypt releases the GIL, so a small thread pool hashes in parallel while
+# the event loop keeps serving other requests.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt"
+)
+_hash_pending = 0
+
+
+async def _run_in_hash_pool(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a bcrypt call on the hashing pool, shedding load past the pending limit."""
+    global _hash_pending
+    if _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        raise ServiceUnavailableException("Too many sign-in attempts in progress, please retry")
+    _hash_pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, fn, *args)
+    finally:
+        _hash_pending -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the hashing pool."""
+    return await _run_in_hash_pool(_hash_password, password)
+
+
+async def verify_password_async(password: str, password_hash: str) -> bool:
+    """Verify a password on the hashing pool."""
+    return await _run_in_hash_pool(_verify_password, password, password_hash)
+
+
 class AuthService:
     def __init__(self, user_repo: UserRepository):
         self.user_repo = user_repo
@@ -33,7 +73,7 @@ class AuthService:
         if not user:
             raise UnauthorizedException("Invalid email or password")
 
-        if not _verify_password(password, user.password_hash):
+        if not await verify_password_async(password, user.password_hash):
             raise UnauthorizedException("Invalid email or password")
 
         if not user.is_active:
@@ -51,12 +91,13 @@ class AuthService:
         if not user:
             raise BadRequestException("User not found")
 
-        if not _verify_password(current_password, user.password_hash):
+        if not await verify_password_async(current_password, user.password_hash):
             raise BadRequestException("Current password is incorrect")
 
-        user.password_hash = _hash_password(new_password)
+        user.password_hash = await hash_password_async(new_password)
         user.must_change_password = False
         await self.user_repo.db.flush()
+        principal_cache.invalidate_after_commit(self.user_repo.db, user.id)
         return True
 
     async def reset_password(self, user_id: str, new_password: str) -> bool:
@@ -64,9 +105,10 @@ class AuthService:
         if not user:
             raise BadRequestException("User not found")
 
-        user.password_hash = _hash_password(new_password)
+        user.password_hash = await hash_password_async(new_password)
         user.must_change_password = True
         await self.user_repo.db.flush()
+        principal_cache.invalidate_after_commit(self.user_repo.db, user.id)
         return True
 
     def verify_token(self, token: str) -> dict:
@@ -85,5 +127,5 @@ class AuthService:
         return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
 
     @staticmethod
-    def hash_password(password: str) -> str:
-        return _hash_password(password)
+    async def hash_password(password: str) -> str:
+        return await hash_password_async(password)
@@ -3,29 +3,116 @@ Bulk Import Service Layer
 
 This module contains all business logic for bulk CSV import operations.
 Handles validation, type casting, and bulk insertion for multiple entity types.
+
+Imports are streamed: the uploaded file is parsed and validated
+``IMPORT_BATCH_SIZE`` rows at a time on a worker thread, and each batch is
+written with PostgreSQL ``COPY`` (or multi-row ``INSERT ... VALUES`` when
+``IMPORT_INSERT_METHOD`` is ``insert`` or the driver has no COPY support).
+No ORM objects are built, so memory stays flat however large the file is.
+Each batch is validated column by column (``app.utils.column_validation``);
+dropdown-backed columns are checked against ``master_dropdowns``, and
+columns referencing other records accept a name (or email) as well as an id,
+resolved through an index of the referenced table loaded once per import.
+
+``import_data`` runs the whole import in the request, in one transaction.
+Import jobs (``create_job``) store the upload and run it in the background
+instead, committing after every batch together with the job's progress so
+an interrupted job resumes from its last committed row.
 """
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import io
+import logging
+import tempfile
 import uuid
-from datetime import date
-from decimal import Decimal, InvalidOperation
-from typing import Any, Dict, List, Optional
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from fastapi import HTTPException, UploadFile
+from sqlalchemy import (
+    Integer,
+    String,
+    and_,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.database import async_session
+from app.exceptions import BadRequestException, ForbiddenException, NotFoundException
+
 from app.models.account import Account
 from app.models.contact import Contact
 from app.models.deal import Deal
+from app.models.import_job import ImportJob, ImportJobError
 from app.models.lead import Lead
+from app.models.master_dropdown import MasterDropdown
 from app.models.partner import Partner
 from app.models.product import Product
 from app.models.sales_entry import SalesEntry
 from app.models.user import User
+from app.schemas.import_job_schema import ImportJobOut
+from app.services.dashboard_rollup_service import (
+    DashboardRollupService,
+    deal_snapshot,
+    lead_snapshot,
+    sales_snapshot,
+)
 from app.utils.activity_logger import log_activity
+from app.utils.background_jobs import JobQueue
+from app.utils.cache import DASHBOARD_CACHE, payload_cache
+from app.utils.pagination import invalidate_counts_after_commit
+from app.utils.column_validation import (
+    ColumnType,
+    enum_key,
+    enum_type,
+    reference_type,
+    validate_columns,
+)
+from app.utils.scoping import scope_filter
+from app.utils.storage import delete_files, file_id_from_url, get_file, iter_file, upload_stream
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+import_jobs = JobQueue("import")
+_job_slots = asyncio.Semaphore(settings.IMPORT_JOB_CONCURRENCY)
+
+
+def _require_jobs_enabled() -> None:
+    if not settings.IMPORT_JOBS_ENABLED:
+        raise BadRequestException(
+            "Background import jobs are not available on this deployment; "
+            "use POST /bulk/import/{entity} instead"
+        )
 
 # Entity configuration
 ALLOWED_ENTITIES = {
@@ -49,6 +136,7 @@ ENTITY_COLUMNS: Dict[str, List[str]] = {
         "status",
         "location",
         "website",
+        "gstin_no",
     ],
     "leads": [
         "company_name",
@@ -87,6 +175,7 @@ ENTITY_COLUMNS: Dict[str, List[str]] = {
         "state",
         "partner_type",
         "tier",
+        "gst_number",
     ],
     "sales_entries": [
         "partner_id",
@@ -97,6 +186,7 @@ ENTITY_COLUMNS: Dict[str, List[str]] = {
         "quantity",
         "po_number",
         "payment_status",
+        "salesperson_email",
     ],
     "products": [
         "name",
@@ -117,6 +207,7 @@ ENTITY_SAMPLE_ROWS: Dict[str, List[str]] = {
         "active",
         "New York",
         "https://acme.com",
+        "27AAACA1234A1Z5",
     ],
     "leads": [
         "# Beta Inc",
@@ -155,16 +246,18 @@ ENTITY_SAMPLE_ROWS: Dict[str, List[str]] = {
         "Maharashtra",
         "reseller",
         "silver",
+        "27AAGCG5678B1Z2",
     ],
     "sales_entries": [
-        "# <partner-uuid>",
-        "<product-uuid>",
+        "# Gamma Solutions",
+        "Widget Pro",
         "15000.00",
         "2026-01-15",
         "Delta Corp",
         "10",
         "PO-2026-001",
         "pending",
+        "sales1@comprint.com",
     ],
     "products": [
         "# Widget Pro",
@@ -213,6 +306,46 @@ DATE_FIELDS = {
     "closing_date",
 }
 
+# Columns checked against master_dropdowns: entity -> {column: dropdown entity}.
+# Values match case- and punctuation-insensitively and are stored canonically.
+ENUM_FIELDS: Dict[str, Dict[str, str]] = {
+    "leads": {"source": "lead-sources", "priority": "priorities"},
+    "deals": {"type": "deal-types"},
+}
+
+# Columns naming another record: entity -> {column: referenced table}.  A
+# cell holds the record's id or its REFERENCE_SOURCES name (case-insensitive).
+REFERENCE_FIELDS: Dict[str, Dict[str, str]] = {
+    "sales_entries": {
+        "partner_id": "partners",
+        "product_id": "products",
+        "salesperson_email": "users",
+    },
+}
+
+# Referenced table -> (model, name column, label used in error messages)
+REFERENCE_SOURCES: Dict[str, tuple] = {
+    "partners": (Partner, "company_name", "partner"),
+    "products": (Product, "name", "product"),
+    "users": (User, "email", "user"),
+}
+
+COLUMN_TYPES: Dict[str, ColumnType] = {
+    "numeric": ColumnType(Decimal, "Invalid numeric value '{value}'"),
+    "integer": ColumnType(int, "Invalid integer value '{value}'"),
+    "date": ColumnType(
+        date.fromisoformat, "Invalid date format '{value}'. Expected YYYY-MM-DD"
+    ),
+    "uuid": ColumnType(uuid.UUID, "Invalid UUID '{value}'"),
+}
+
+FIELD_KINDS: Dict[str, set] = {
+    "numeric": NUMERIC_FIELDS,
+    "integer": INTEGER_FIELDS,
+    "date": DATE_FIELDS,
+    "uuid": {"partner_id", "product_id"},
+}
+
 DEFAULTS: Dict[str, Dict[str, str]] = {
     "accounts": {"status": "active"},
     "contacts": {"status": "active"},
@@ -222,18 +355,113 @@ DEFAULTS: Dict[str, Dict[str, str]] = {
     "sales_entries": {"payment_status": "pending"},
 }
 
+IMPORT_MODES = ("insert", "upsert")
+
+# Natural keys for upsert mode: entity -> key columns.  Rows with an empty
+# first key column are always inserted; later key columns treat empty and
+# NULL alike.  Columns in CASE_INSENSITIVE_KEYS compare case-insensitively.
+# The expressions match the ix_*_import_key indexes.
+NATURAL_KEYS: Dict[str, Tuple[str, ...]] = {
+    "accounts": ("name", "gstin_no"),
+    "contacts": ("email",),
+    "partners": ("company_name", "gst_number"),
+    "sales_entries": ("po_number",),
+    "products": ("name",),
+}
+
+CASE_INSENSITIVE_KEYS = {"name", "company_name", "email"}
+
+# Bind parameters per statement stay well under PostgreSQL's 32767 limit
+_MAX_PARAMS = 30000
+
+# Maps entity -> (rollup table, snapshot function) for entities the dashboard rolls up.
+ROLLUP_SNAPSHOTS: Dict[str, tuple] = {
+    "sales_entries": ("sales", sales_snapshot),
+    "leads": ("pipeline", lead_snapshot),
+    "deals": ("pipeline", deal_snapshot),
+}
+
 # Maps entity -> list of (csv_field_name, model_field_name) for the current-user id.
+# When csv_field_name is one of the entity's columns, a row naming a user there
+# gets that user instead.
 USER_FIELDS: Dict[str, List[tuple]] = {
     "accounts": [("owner_id", "owner_id")],
     "leads": [("assigned_to", "assigned_to")],
     "contacts": [("owner_id", "owner_id")],
     "deals": [("owner_id", "owner_id")],
     "partners": [("assigned_to", "assigned_to")],
-    "sales_entries": [("salesperson_id", "salesperson_id")],
+    "sales_entries": [("salesperson_email", "salesperson_id")],
     "products": [],
 }
 
 
+class _RowView:
+    """Attribute access over a cleaned row dict, for the rollup snapshot functions."""
+
+    __slots__ = ("_row",)
+
+    def __init__(self, row: Dict[str, Any]):
+        self._row = row
+
+    def __getattr__(self, name: str) -> Any:
+        return self._row.get(name)
+
+
+class _JobTakenOver(Exception):
+    """Another worker claimed the import job this worker was running."""
+
+
+@dataclass
+class _Batch:
+    """One parsed batch: valid rows, row errors and counters."""
+
+    rows: List[Dict[str, Any]]
+    row_numbers: List[int]
+    errors: List[Dict[str, Any]]
+    read: int
+    rejected: int
+    last_row: int  # last CSV line consumed
+    defaults: Dict[str, Any] = field(default_factory=dict)  # for new rows, when not yet applied
+    inserted: int = 0
+    updated: int = 0
+    conflicts: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def _natural_key(entity: str, row: Dict[str, Any]) -> Optional[Tuple[str, ...]]:
+    """The row's natural key in comparison form, or None if it has none."""
+    columns = NATURAL_KEYS[entity]
+    if row.get(columns[0]) is None:
+        return None
+    return tuple(
+        (row.get(col) or "").lower() if col in CASE_INSENSITIVE_KEYS else row.get(col) or ""
+        for col in columns
+    )
+
+
+def _key_expressions(entity: str) -> List[Any]:
+    """SQL expressions comparable with ``_natural_key`` values."""
+    table = ENTITY_MODEL_MAP[entity].__table__
+    expressions = []
+    for position, col in enumerate(NATURAL_KEYS[entity]):
+        expression = table.c[col] if position == 0 else func.coalesce(table.c[col], "")
+        if col in CASE_INSENSITIVE_KEYS:
+            expression = func.lower(expression)
+        expressions.append(expression)
+    return expressions
+
+
+def _chunks(items: List[Any], width: int) -> Iterator[List[Any]]:
+    """Split ``items`` so each chunk binds at most _MAX_PARAMS parameters."""
+    size = max(1, _MAX_PARAMS // max(1, width))
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+async def _read_chunks(file: UploadFile, chunk_size: int) -> AsyncIterator[bytes]:
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
+
 class BulkImportService:
     """Service for bulk CSV import operations."""
 
@@ -248,120 +476,87 @@ class BulkImportService:
                 detail=f"Invalid entity '{entity}'. Allowed: {', '.join(sorted(ALLOWED_ENTITIES))}",
             )
 
-    def _parse_uuid(self, value: str) -> uuid.UUID:
-        """Parse a string as UUID, raising ValueError on failure."""
-        return uuid.UUID(value.strip())
-
-    def _cast_row(
+    def _column_types(
         self,
         entity: str,
-        row: Dict[str, str],
-        row_index: int,
-        errors: List[Dict[str, Any]],
-    ) -> Optional[Dict[str, Any]]:
-        """
-        Validate and type-cast a single CSV row.
+        enums: Dict[str, Dict[str, str]],
+        references: Optional[Dict[str, ColumnType]] = None,
+    ) -> Dict[str, ColumnType]:
+        """Parsers for the entity's typed columns, including its dropdown and reference columns."""
+        types = {
+            col: COLUMN_TYPES[kind]
+            for col in ENTITY_COLUMNS[entity]
+            for kind, fields in FIELD_KINDS.items()
+            if col in fields
+        }
+        for col, choices in enums.items():
+            types[col] = enum_type(choices)
+        types.update(references or {})
+        return types
 
-        Returns the cleaned dict ready for model construction, or None if the
-        row has fatal validation errors.
+    def _enum_lookups(
+        self, entity: str, dropdowns: Dict[str, List[str]]
+    ) -> Dict[str, Dict[str, str]]:
         """
-        data: Dict[str, Any] = {}
-        row_has_error = False
-
-        # Required field check
-        for field in REQUIRED_FIELDS.get(entity, []):
-            value = (row.get(field) or "").strip()
-            if not value:
-                errors.append(
-                    {
-                        "row": row_index,
-                        "field": field,
-                        "message": f"Required field '{field}' is missing or empty",
-                    }
-                )
-                row_has_error = True
-
-        if row_has_error:
-            return None
+        Build column -> {normalised key: value} lookups from dropdown values.
 
-        columns = ENTITY_COLUMNS[entity]
-        for col in columns:
-            raw = (row.get(col) or "").strip()
-            if not raw:
-                continue
-
-            # Numeric (Decimal) fields
-            if col in NUMERIC_FIELDS:
-                try:
-                    data[col] = Decimal(raw)
-                except (InvalidOperation, ValueError):
-                    errors.append(
-                        {
-                            "row": row_index,
-                            "field": col,
-                            "message": f"Invalid numeric value '{raw}'",
-                        }
-                    )
-                    row_has_error = True
-                continue
-
-            # Integer fields
-            if col in INTEGER_FIELDS:
-                try:
-                    data[col] = int(raw)
-                except ValueError:
-                    errors.append(
-                        {
-                            "row": row_index,
-                            "field": col,
-                            "message": f"Invalid integer value '{raw}'",
-                        }
-                    )
-                    row_has_error = True
-                continue
-
-            # Date fields (YYYY-MM-DD)
-            if col in DATE_FIELDS:
-                try:
-                    data[col] = date.fromisoformat(raw)
-                except ValueError:
-                    errors.append(
-                        {
-                            "row": row_index,
-                            "field": col,
-                            "message": f"Invalid date format '{raw}'. Expected YYYY-MM-DD",
-                        }
-                    )
-                    row_has_error = True
-                continue
-
-            # UUID fields (partner_id, product_id in CSV)
-            if col in ("partner_id", "product_id"):
-                try:
-                    data[col] = self._parse_uuid(raw)
-                except ValueError:
-                    errors.append(
-                        {
-                            "row": row_index,
-                            "field": col,
-                            "message": f"Invalid UUID '{raw}'",
-                        }
-                    )
-                    row_has_error = True
-                continue
-
-            # Everything else is a plain string
-            data[col] = raw
+        Columns whose dropdown has no values are left unchecked.
+        """
+        lookups: Dict[str, Dict[str, str]] = {}
+        for col, dropdown in ENUM_FIELDS.get(entity, {}).items():
+            values = dropdowns.get(dropdown)
+            if values:
+                lookups[col] = {enum_key(value): value for value in values}
+        return lookups
 
-        if row_has_error:
-            return None
+    async def _load_enums(self, entity: str) -> Dict[str, Dict[str, str]]:
+        """Load the active master_dropdowns values (and labels) for the entity's enum columns."""
+        dropdowns = sorted(set(ENUM_FIELDS.get(entity, {}).values()))
+        if not dropdowns:
+            return {}
+        result = await self.db.execute(
+            select(MasterDropdown.entity, MasterDropdown.value, MasterDropdown.label)
+            .where(MasterDropdown.entity.in_(dropdowns), MasterDropdown.is_active.is_(True))
+            .order_by(MasterDropdown.sort_order)
+        )
+        values: Dict[str, List[str]] = defaultdict(list)
+        labels: Dict[Tuple[str, str], str] = {}
+        for dropdown, value, label in result:
+            values[dropdown].append(value)
+            labels[(dropdown, value)] = label
+        lookups = self._enum_lookups(entity, values)
+        # Accept labels too, but store the canonical value
+        for col, dropdown in ENUM_FIELDS.get(entity, {}).items():
+            for value in values.get(dropdown, []):
+                lookups[col].setdefault(enum_key(labels[(dropdown, value)]), value)
+        return lookups
 
-        # Apply defaults
-        for field, default in DEFAULTS.get(entity, {}).items():
-            if field not in data:
-                data[field] = default
+    async def _load_references(self, entity: str) -> Dict[str, ColumnType]:
+        """
+        Load an id/name index of every table the entity's columns reference.
 
-        return data
+        Each table is read once per import, so resolving a name costs a dict
+        lookup instead of a query per row.
+        """
+        references: Dict[str, ColumnType] = {}
+        indexes: Dict[str, ColumnType] = {}
+        for col, source in REFERENCE_FIELDS.get(entity, {}).items():
+            if source not in indexes:
+                model, name_column, label = REFERENCE_SOURCES[source]
+                result = await self.db.execute(select(model.id, getattr(model, name_column)))
+                names: Dict[str, List[uuid.UUID]] = defaultdict(list)
+                display: Dict[str, str] = {}
+                ids = set()
+                for record_id, name in result:
+                    ids.add(record_id)
+                    if name:
+                        names[name.lower()].append(record_id)
+                        display.setdefault(name.lower(), name)
+                indexes[source] = reference_type(
+                    label, name_column, dict(names), display, ids, uuid.UUID
+                )
+            references[col] = indexes[source]
+        return references
 
     def get_template(self, entity: str) -> tuple[str, str]:
         """
@@ -390,101 +585,809 @@ class BulkImportService:
         filename = f"{entity}_import_template.csv"
         return output.getvalue(), filename
 
-    async def import_data(
-        self, entity: str, file: UploadFile, user: User
-    ) -> Dict[str, Any]:
+    def _read_batch(
+        self,
+        entity: str,
+        rows: Iterator[Tuple[int, Dict[str, str]]],
+        user_id: uuid.UUID,
+        enums: Optional[Dict[str, Dict[str, str]]] = None,
+        with_defaults: bool = True,
+        references: Optional[Dict[str, ColumnType]] = None,
+    ) -> _Batch:
         """
-        Import CSV data for an entity.
+        Read up to IMPORT_BATCH_SIZE rows and validate them column by column
+        (runs on a worker thread).
 
         Args:
             entity: Entity name
-            file: Uploaded CSV file
+            rows: (CSV line number, row) pairs
+            user_id: Id written to the entity's user fields
+            enums: Dropdown lookups from ``_load_enums``
+            with_defaults: Fill empty columns from DEFAULTS and the user
+                fields (upsert mode applies them to new rows only)
+            references: Reference column types from ``_load_references``
+
+        Returns:
+            The batch's valid rows, errors and counters
+        """
+        raw_rows: List[Dict[str, str]] = []
+        row_numbers: List[int] = []
+        last_row = 0
+        for idx, row in rows:
+            last_row = idx
+            # Skip comment/sample rows
+            first_value = next(iter(row.values()), "") or ""
+            if first_value.strip().startswith("#"):
+                continue
+            raw_rows.append(row)
+            row_numbers.append(idx)
+            if len(raw_rows) >= settings.IMPORT_BATCH_SIZE:
+                break
+
+        # User-related fields are not CSV columns, so they are set on every
+        # row unless the row names its own user
+        defaults = dict(DEFAULTS.get(entity, {}))
+        for _csv_field, model_field in USER_FIELDS.get(entity, []):
+            defaults[model_field] = user_id
+
+        columns = ENTITY_COLUMNS[entity]
+        result = validate_columns(
+            raw_rows,
+            row_numbers,
+            columns,
+            required=REQUIRED_FIELDS.get(entity, []),
+            types=self._column_types(entity, enums or {}, references),
+            defaults=defaults if with_defaults else {},
+        )
+        for csv_field, model_field in USER_FIELDS.get(entity, []):
+            if csv_field != model_field and csv_field in columns:
+                for row in result.rows:
+                    if csv_field in row:
+                        row[model_field] = row.pop(csv_field)
+        return _Batch(
+            result.rows,
+            result.row_numbers,
+            result.errors,
+            len(raw_rows),
+            result.rejected,
+            last_row,
+            defaults={} if with_defaults else defaults,
+        )
+
+    async def _insert_batch(self, entity: str, rows: List[Dict[str, Any]]) -> None:
+        """Write one batch of cleaned rows, grouped by the set of columns present."""
+        table = ENTITY_MODEL_MAP[entity].__table__
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            # Omitted columns keep their server defaults, so rows are only
+            # written together when they set the same columns
+            groups[tuple(sorted(row))].append(row)
+
+        driver = None
+        if settings.IMPORT_INSERT_METHOD == "copy":
+            conn = await self.db.connection()
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            if not hasattr(driver, "copy_records_to_table"):
+                driver = None
+
+        for columns, group in groups.items():
+            if driver is not None:
+                await driver.copy_records_to_table(
+                    table.name,
+                    columns=list(columns),
+                    records=[tuple(row[c] for c in columns) for row in group],
+                )
+            else:
+                await self.db.execute(insert(table), group)
+
+    async def _match_existing(
+        self, entity: str, keyed: List[Tuple[int, Tuple[str, ...]]], user: User
+    ) -> Dict[int, List[Tuple[uuid.UUID, bool]]]:
+        """
+        Find existing records by natural key in one set-based query per chunk.
+
+        Args:
+            entity: Entity name
+            keyed: (position in batch, natural key) pairs
             user: User performing the import
 
         Returns:
-            Dictionary with total, imported count, and errors
+            Position -> (id, within the user's scope) of the records sharing its key
+        """
+        table = ENTITY_MODEL_MAP[entity].__table__
+        expressions = _key_expressions(entity)
+        owner = USER_FIELDS[entity][0][1] if USER_FIELDS[entity] else None
+        in_scope = scope_filter(table.c[owner], user) if owner else None
+        if in_scope is None:
+            in_scope = literal(True)
+        matches: Dict[int, List[Tuple[uuid.UUID, bool]]] = defaultdict(list)
+        for chunk in _chunks(keyed, len(expressions) + 1):
+            keys = values(
+                column("idx", Integer),
+                *[column(f"k{i}", String) for i in range(len(expressions))],
+                name="import_keys",
+            ).data([(idx, *key) for idx, key in chunk])
+            stmt = (
+                select(keys.c.idx, table.c.id, in_scope.label("in_scope"))
+                .select_from(keys)
+                .join(
+                    table,
+                    and_(*(expr == keys.c[f"k{i}"] for i, expr in enumerate(expressions))),
+                )
+            )
+            for idx, record_id, visible in await self.db.execute(stmt):
+                matches[idx].append((record_id, bool(visible)))
+        return matches
 
-        Raises:
-            HTTPException: If entity is invalid, file is not CSV, or import fails
+    async def _update_rows(
+        self, entity: str, rows: List[Tuple[uuid.UUID, Dict[str, Any]]], returning: bool
+    ) -> List[Any]:
         """
-        self._validate_entity(entity)
+        Update existing records with UPDATE ... FROM (VALUES ...), one
+        statement per set of columns.
 
-        # Validate file type
-        if not file.filename or not file.filename.lower().endswith(".csv"):
-            raise HTTPException(status_code=400, detail="Only .csv files are accepted")
+        User fields (owners/assignees) only change when the file names a user.
 
-        # Read and decode CSV
+        Returns:
+            The updated records when ``returning`` is set
+        """
+        table = ENTITY_MODEL_MAP[entity].__table__
+        groups: Dict[Tuple[str, ...], List[Tuple[uuid.UUID, Dict[str, Any]]]] = defaultdict(list)
+        for record_id, row in rows:
+            groups[tuple(sorted(row))].append((record_id, row))
+
+        updated: List[Any] = []
+        for columns, group in groups.items():
+            if not columns:
+                continue
+            for chunk in _chunks(group, len(columns) + 1):
+                data = values(
+                    column("id", table.c.id.type),
+                    *[column(c, table.c[c].type) for c in columns],
+                    name="import_rows",
+                ).data([(record_id, *(row[c] for c in columns)) for record_id, row in chunk])
+                stmt = (
+                    update(table)
+                    .where(table.c.id == data.c.id)
+                    .values({c: data.c[c] for c in columns})
+                )
+                if returning:
+                    updated.extend(await self.db.execute(stmt.returning(*table.c)))
+                else:
+                    await self.db.execute(stmt)
+        return updated
+
+    async def _upsert_batch(
+        self,
+        entity: str,
+        batch: _Batch,
+        seen: Dict[Tuple[str, ...], int],
+        dry_run: bool,
+        user: User,
+    ) -> None:
+        """
+        Insert or update a batch by natural key.
+
+        A key repeated in the file is a conflict: the last occurrence wins and
+        earlier rows in the same batch are dropped.  A key matching more than
+        one existing record, or a record outside the user's scope (owned by
+        someone who is not on their team), is a conflict too, and that row is
+        skipped.
+
+        Args:
+            entity: Entity name
+            batch: Validated batch; its counters and conflicts are filled in
+            seen: Natural key -> row number, for every keyed row so far
+            dry_run: Classify the rows without writing anything
+            user: User performing the import
+        """
+        key_field = "+".join(NATURAL_KEYS[entity])
+        keep = [True] * len(batch.rows)
+        pending: Dict[Tuple[str, ...], int] = {}
+        carried: set = set()  # positions whose key first appeared in an earlier batch
+        for i, (row, row_number) in enumerate(zip(batch.rows, batch.row_numbers)):
+            key = _natural_key(entity, row)
+            if key is None:
+                continue
+            if key in seen:
+                batch.conflicts.append(
+                    {
+                        "row": row_number,
+                        "field": key_field,
+                        "message": f"Same {key_field} as row {seen[key]}; the later row is used",
+                    }
+                )
+                if key in pending:
+                    keep[pending[key]] = False
+                else:
+                    carried.add(i)
+            seen[key] = row_number
+            pending[key] = i
+
+        keyed = [(i, key) for key, i in pending.items()]
+        matches = await self._match_existing(entity, keyed, user) if keyed else {}
+
+        inserts: List[Dict[str, Any]] = []
+        updates: List[Tuple[uuid.UUID, Dict[str, Any]]] = []
+        for i, row in enumerate(batch.rows):
+            if not keep[i]:
+                continue
+            found = matches.get(i, [])
+            if len(found) > 1:
+                batch.conflicts.append(
+                    {
+                        "row": batch.row_numbers[i],
+                        "field": key_field,
+                        "message": f"Matches {len(found)} existing {entity}; row skipped",
+                    }
+                )
+            elif found and not found[0][1]:
+                batch.conflicts.append(
+                    {
+                        "row": batch.row_numbers[i],
+                        "field": key_field,
+                        "message": f"Matches existing {entity} outside your scope; row skipped",
+                    }
+                )
+            elif found:
+                updates.append((found[0][0], row))
+            elif dry_run and i in carried:
+                batch.updated += 1  # would update the row inserted by the earlier occurrence
+            else:
+                for field_name, default in batch.defaults.items():
+                    row.setdefault(field_name, default)
+                inserts.append(row)
+        batch.inserted += len(inserts)
+        batch.updated += len(updates)
+        if dry_run:
+            return
+
+        rollup, snapshot = ROLLUP_SNAPSHOTS.get(entity, (None, None))
+        before: List[Any] = []
+        if snapshot and updates:
+            table = ENTITY_MODEL_MAP[entity].__table__
+            ids = [record_id for record_id, _row in updates]
+            for chunk in _chunks(ids, 1):
+                result = await self.db.execute(
+                    select(table).where(table.c.id.in_(chunk)).with_for_update()
+                )
+                before.extend(snapshot(record) for record in result)
+        after = await self._update_rows(entity, updates, returning=bool(snapshot))
+        if inserts:
+            await self._insert_batch(entity, inserts)
+        if snapshot:
+            after = [snapshot(record) for record in after]
+            after += [snapshot(_RowView(row)) for row in inserts]
+            await self._record_rollup(rollup, before, after)
+
+    async def _record_rollup(self, rollup: str, before: List[Any], after: List[Any]) -> None:
+        rollups = DashboardRollupService(self.db)
+        if rollup == "sales":
+            await rollups.record_sales(before=before, after=after)
+        else:
+            await rollups.record_pipeline(before=before, after=after)
+
+    async def _write_batch(
+        self,
+        entity: str,
+        batch: _Batch,
+        mode: str,
+        dry_run: bool,
+        seen: Dict[Tuple[str, ...], int],
+        user: User,
+    ) -> None:
+        """Write one validated batch (or, on a dry run, only count it)."""
+        if not batch.rows:
+            return
+        if mode == "upsert":
+            if not dry_run:
+                # Serialises upserts of the same entity so two imports cannot
+                # both insert a key that neither of them saw
+                await self.db.execute(
+                    select(func.pg_advisory_xact_lock(func.hashtext(f"bulk_import:{entity}")))
+                )
+            await self._upsert_batch(entity, batch, seen, dry_run, user)
+            return
+
+        batch.inserted = len(batch.rows)
+        if dry_run:
+            return
+        await self._insert_batch(entity, batch.rows)
+        rollup, snapshot = ROLLUP_SNAPSHOTS.get(entity, (None, None))
+        if snapshot:
+            await self._record_rollup(
+                rollup, [], [snapshot(_RowView(row)) for row in batch.rows]
+            )
+
+    async def _import_batches(
+        self,
+        entity: str,
+        text: io.TextIOBase,
+        user: User,
+        on_batch: Callable[[_Batch], Awaitable[None]],
+        after_row: int = 1,
+        mode: str = "insert",
+        dry_run: bool = False,
+    ) -> None:
+        """
+        Read, validate and write a CSV stream batch by batch.
+
+        Each batch's rows are written and its dashboard rollups recorded
+        before ``on_batch`` is awaited; committing is left to the caller.
+
+        Args:
+            entity: Entity name
+            text: Decoded CSV text stream, positioned at the header
+            user: User performing the import; their id is written to the
+                entity's user fields and upserts only update records in their scope
+            on_batch: Awaited after each batch
+            after_row: Skip CSV lines up to and including this one (resume)
+            mode: ``insert`` or ``upsert`` (by NATURAL_KEYS)
+            dry_run: Validate and classify rows without writing them
+
+        Raises:
+            HTTPException: If the file is empty or not valid UTF-8
+        """
+        reader = csv.DictReader(text)
         try:
-            contents = await file.read()
-            text = contents.decode("utf-8-sig")  # handles BOM from Excel exports
+            fieldnames = await asyncio.to_thread(lambda: reader.fieldnames)
         except UnicodeDecodeError:
             raise HTTPException(status_code=400, detail="File is not valid UTF-8 text")
 
-        reader = csv.DictReader(io.StringIO(text))
-
-        if reader.fieldnames is None:
+        if fieldnames is None:
             raise HTTPException(
                 status_code=400,
                 detail="CSV file appears to be empty or has no header row",
             )
 
-        # Process rows
-        errors: List[Dict[str, Any]] = []
-        valid_rows: List[Dict[str, Any]] = []
-        model_cls = ENTITY_MODEL_MAP[entity]
-        user_id = user.id  # UUID of the current user
+        # row 1 is header
+        rows = ((idx, row) for idx, row in enumerate(reader, start=2) if idx > after_row)
+        enums = await self._load_enums(entity)
+        references = await self._load_references(entity)
+        seen: Dict[Tuple[str, ...], int] = {}
+        last_row = after_row
 
-        for idx, row in enumerate(reader, start=2):  # row 1 is header
-            # Skip comment/sample rows
-            first_value = next(iter(row.values()), "") or ""
-            if first_value.strip().startswith("#"):
-                continue
+        while True:
+            try:
+                batch = await asyncio.to_thread(
+                    self._read_batch, entity, rows, user.id, enums, mode == "insert", references
+                )
+            except UnicodeDecodeError:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"File is not valid UTF-8 text (after row {last_row})",
+                )
+            if not batch.read:
+                break
+            last_row = batch.last_row
+            await self._write_batch(entity, batch, mode, dry_run, seen, user)
+            await on_batch(batch)
 
-            cleaned = self._cast_row(entity, row, idx, errors)
-            if cleaned is None:
-                continue
+    async def import_data(
+        self,
+        entity: str,
+        file: UploadFile,
+        user: User,
+        mode: str = "insert",
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Import CSV data for an entity in a single transaction.
 
-            # Inject user-related fields
-            for _csv_field, model_field in USER_FIELDS.get(entity, []):
-                cleaned[model_field] = user_id
+        Args:
+            entity: Entity name
+            file: Uploaded CSV file
+            user: User performing the import
+            mode: ``insert`` adds every valid row; ``upsert`` updates the
+                record with the same natural key (NATURAL_KEYS) instead
+            dry_run: Report what would be inserted/updated without writing
 
-            valid_rows.append(cleaned)
+        Returns:
+            Dictionary with total, imported (inserted + updated), inserted,
+            updated, errors and conflicts (each at most IMPORT_MAX_ERRORS;
+            errorCount/conflictCount have the full numbers)
 
-        # Bulk insert
-        imported_count = 0
-        if valid_rows:
-            try:
-                for row_data in valid_rows:
-                    self.db.add(model_cls(**row_data))
-                await self.db.flush()
-                await self.db.commit()
-                imported_count = len(valid_rows)
-            except Exception as exc:
+        Raises:
+            HTTPException: If entity or mode is invalid, file is not CSV, or import fails
+        """
+        self._validate_entity(entity)
+        self._validate_mode(entity, mode)
+        self._validate_filename(file)
+
+        errors: List[Dict[str, Any]] = []
+        conflicts: List[Dict[str, Any]] = []
+        counts = {"total": 0, "inserted": 0, "updated": 0, "rejected": 0, "conflicts": 0}
+
+        async def on_batch(batch: _Batch) -> None:
+            counts["total"] += batch.read
+            counts["inserted"] += batch.inserted
+            counts["updated"] += batch.updated
+            counts["rejected"] += batch.rejected
+            counts["conflicts"] += len(batch.conflicts)
+            errors.extend(batch.errors[: max(0, settings.IMPORT_MAX_ERRORS - len(errors))])
+            conflicts.extend(
+                batch.conflicts[: max(0, settings.IMPORT_MAX_ERRORS - len(conflicts))]
+            )
+            logger.info(
+                "Bulk import %s (%s%s): %d rows processed, %d inserted, %d updated, %d rejected",
+                entity, mode, ", dry run" if dry_run else "", counts["total"],
+                counts["inserted"], counts["updated"], counts["rejected"],
+            )
+
+        # Decode incrementally; utf-8-sig handles the BOM from Excel exports
+        await file.seek(0)
+        text = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+        try:
+            await self._import_batches(
+                entity, text, user, on_batch, mode=mode, dry_run=dry_run
+            )
+            if dry_run:
                 await self.db.rollback()
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Database error during bulk insert: {str(exc)}",
-                )
+            elif counts["inserted"] or counts["updated"]:
+                payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
+                invalidate_counts_after_commit(self.db, ENTITY_MODEL_MAP[entity].__tablename__)
+                await self.db.commit()
+        except HTTPException:
+            await self.db.rollback()
+            raise
+        except Exception as exc:
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=500,
+                detail=f"Database error during bulk insert: {str(exc)}",
+            )
+        finally:
+            text.detach()
 
+        imported_count = counts["inserted"] + counts["updated"]
         # Log the import activity
-        if imported_count > 0:
-            await log_activity(
-                db=self.db,
-                user=user,
-                action="bulk_import",
-                entity_type=entity,
-                entity_name=f"Imported {imported_count} {entity}",
-                changes=[
-                    {"field": "file", "old": None, "new": file.filename},
-                    {"field": "imported", "old": None, "new": str(imported_count)},
-                    {"field": "errors", "old": None, "new": str(len(errors))},
-                ],
-            )
+        if imported_count > 0 and not dry_run:
+            await self._log_import(user, entity, file.filename, imported_count, counts["rejected"])
             await self.db.commit()
 
-        total = imported_count + len(errors)
         return {
-            "total": total,
+            "total": counts["total"],
             "imported": imported_count,
+            "inserted": counts["inserted"],
+            "updated": counts["updated"],
             "errors": errors,
+            "errorCount": counts["rejected"],
+            "conflicts": conflicts,
+            "conflictCount": counts["conflicts"],
+            "mode": mode,
+            "dryRun": dry_run,
         }
+
+    def _validate_mode(self, entity: str, mode: str) -> None:
+        if mode not in IMPORT_MODES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid mode '{mode}'. Allowed: {', '.join(IMPORT_MODES)}",
+            )
+        if mode == "upsert" and entity not in NATURAL_KEYS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Upsert is not supported for {entity}: it has no natural key. "
+                f"Supported: {', '.join(sorted(NATURAL_KEYS))}",
+            )
+
+    def _validate_filename(self, file: UploadFile) -> None:
+        if not file.filename or not file.filename.lower().endswith(".csv"):
+            raise HTTPException(status_code=400, detail="Only .csv files are accepted")
+
+    async def _log_import(
+        self, user: User, entity: str, filename: Optional[str], imported: int, rejected: int
+    ) -> None:
+        await log_activity(
+            db=self.db,
+            user=user,
+            action="bulk_import",
+            entity_type=entity,
+            entity_name=f"Imported {imported} {entity}",
+            changes=[
+                {"field": "file", "old": None, "new": filename},
+                {"field": "imported", "old": None, "new": str(imported)},
+                {"field": "errors", "old": None, "new": str(rejected)},
+            ],
+        )
+
+    # ------------------------------------------------------------------
+    # Background import jobs
+    # ------------------------------------------------------------------
+
+    async def create_job(
+        self,
+        entity: str,
+        file: UploadFile,
+        user: User,
+        mode: str = "insert",
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Store an uploaded CSV and queue it as a background import job.
+
+        The job starts once this request's transaction commits.
+
+        Args:
+            entity: Entity name
+            file: Uploaded CSV file
+            user: User performing the import
+            mode: ``insert`` or ``upsert`` (see ``import_data``)
+            dry_run: Count inserts/updates/conflicts without writing
+
+        Returns:
+            The queued job
+
+        Raises:
+            BadRequestException: If import jobs are disabled (IMPORT_JOBS_ENABLED)
+            HTTPException: If entity or mode is invalid or file is not CSV
+            PayloadTooLargeException: If the file exceeds MAX_UPLOAD_SIZE_BYTES
+        """
+        _require_jobs_enabled()
+        self._validate_entity(entity)
+        self._validate_mode(entity, mode)
+        self._validate_filename(file)
+
+        await file.seek(0)
+        stored = await upload_stream(
+            _read_chunks(file, settings.STORAGE_CHUNK_SIZE),
+            f"{uuid.uuid4()}.csv",
+            "text/csv",
+            original_filename=file.filename,
+            max_size=settings.MAX_UPLOAD_SIZE_BYTES,
+        )
+        job = ImportJob(
+            entity=entity,
+            filename=file.filename,
+            file_url=stored["url"],
+            mode=mode,
+            dry_run=dry_run,
+            created_by=user.id,
+        )
+        self.db.add(job)
+        await self.db.flush()
+        await self.db.refresh(job)
+        self._schedule_job(job.id)
+        return ImportJobOut.model_validate(job).model_dump(by_alias=True)
+
+    def _schedule_job(self, job_id: uuid.UUID) -> None:
+        import_jobs.schedule_after_commit(
+            self.db, str(job_id), lambda: BulkImportService.run_job(job_id)
+        )
+
+    async def _get_job(self, job_id: str, user: User) -> ImportJob:
+        try:
+            job = await self.db.get(ImportJob, uuid.UUID(job_id))
+        except ValueError:
+            job = None
+        if job is None:
+            raise NotFoundException("Import job not found")
+        if job.created_by != user.id and user.role not in ("admin", "superadmin"):
+            raise ForbiddenException("You do not have access to this import job")
+        return job
+
+    async def get_job(self, job_id: str, user: User) -> Dict[str, Any]:
+        """
+        Get an import job's status and progress.
+
+        Raises:
+            NotFoundException: If the job does not exist
+            ForbiddenException: If the job belongs to another user
+        """
+        job = await self._get_job(job_id, user)
+        return ImportJobOut.model_validate(job).model_dump(by_alias=True)
+
+    async def resume_job(self, job_id: str, user: User) -> Dict[str, Any]:
+        """
+        Re-queue a failed (or abandoned running) job from its last committed row.
+
+        Raises:
+            NotFoundException: If the job does not exist
+            ForbiddenException: If the job belongs to another user
+            BadRequestException: If import jobs are disabled or the job is not
+                failed or stalled
+        """
+        _require_jobs_enabled()
+        job = await self._get_job(job_id, user)
+        result = await self.db.execute(
+            update(ImportJob)
+            .where(ImportJob.id == job.id, _resumable(include_failed=True))
+            .values(status=JOB_QUEUED, message=None, updated_at=func.now())
+            .returning(ImportJob.id)
+        )
+        if result.scalar_one_or_none() is None:
+            raise BadRequestException(f"Import job is {job.status} and cannot be resumed")
+        await self.db.refresh(job)
+        self._schedule_job(job.id)
+        return ImportJobOut.model_validate(job).model_dump(by_alias=True)
+
+    @staticmethod
+    async def resume_interrupted_jobs() -> int:
+        """
+        Restart queued/running jobs that no worker has touched for
+        IMPORT_JOB_STALE_SECONDS, e.g. because the worker running them died.
+
+        Returns:
+            Number of jobs restarted
+        """
+        async with async_session() as session:
+            job_ids = (
+                await session.execute(select(ImportJob.id).where(_resumable()))
+            ).scalars().all()
+        job_ids = [job_id for job_id in job_ids if not import_jobs.is_running(str(job_id))]
+        for job_id in job_ids:
+            import_jobs.submit(str(job_id), lambda job_id=job_id: BulkImportService.run_job(job_id))
+        return len(job_ids)
+
+    @staticmethod
+    async def watch_interrupted_jobs() -> None:
+        """Resume abandoned jobs every IMPORT_JOB_STALE_SECONDS (runs for the app's lifetime)."""
+        while True:
+            try:
+                resumed = await BulkImportService.resume_interrupted_jobs()
+                if resumed:
+                    logger.info("Resumed %d interrupted import jobs", resumed)
+            except Exception:
+                logger.exception("Could not check for interrupted import jobs")
+            await asyncio.sleep(settings.IMPORT_JOB_STALE_SECONDS)
+
+    @staticmethod
+    async def run_job(job_id: uuid.UUID) -> None:
+        """Background job: run (or resume) an import job in its own session."""
+        async with _job_slots, async_session() as session:
+            await BulkImportService(session)._run_job(job_id)
+
+    async def _run_job(self, job_id: uuid.UUID) -> None:
+        # Claim the job: only one worker may run it, and a running job is
+        # only taken over once it has stopped reporting progress
+        claimed = await self.db.execute(
+            update(ImportJob)
+            .where(
+                ImportJob.id == job_id,
+                or_(ImportJob.status == JOB_QUEUED, _resumable()),
+            )
+            .values(status=JOB_RUNNING, updated_at=func.now())
+            .returning(ImportJob.id)
+        )
+        if claimed.scalar_one_or_none() is None:
+            await self.db.rollback()
+            return
+        await self.db.commit()
+
+        job = await self.db.get(ImportJob, job_id)
+        user = await self.db.get(User, job.created_by) if job.created_by else None
+        try:
+            if user is None:
+                raise HTTPException(status_code=400, detail="The importing user no longer exists")
+            await self._process_job(job, user)
+        except _JobTakenOver:
+            await self.db.rollback()
+            logger.warning("Import job %s was taken over by another worker", job_id)
+        except Exception as exc:
+            await self.db.rollback()
+            message = getattr(exc, "detail", None) or str(exc)
+            logger.exception("Import job %s failed", job_id)
+            await self.db.execute(
+                update(ImportJob)
+                .where(ImportJob.id == job_id, ImportJob.status == JOB_RUNNING)
+                .values(status=JOB_FAILED, message=message, updated_at=func.now())
+            )
+            await self.db.commit()
+
+    async def _process_job(self, job: ImportJob, user: User) -> None:
+        file_id = file_id_from_url(job.file_url)
+        record = await get_file(file_id) if file_id is not None else None
+        if record is None:
+            raise HTTPException(status_code=400, detail="The uploaded file is no longer available")
+
+        spool = tempfile.SpooledTemporaryFile(max_size=settings.STORAGE_CHUNK_SIZE * 4)
+        try:
+            async for chunk in iter_file(record):
+                await asyncio.to_thread(spool.write, chunk)
+            await asyncio.to_thread(spool.seek, 0)
+
+            last_row = job.last_row
+
+            async def on_batch(batch: _Batch) -> None:
+                # Errors and counters commit with the batch, so last_row is
+                # exactly where a resumed job has to pick up.  The last_row
+                # check fails if another worker took the job over meanwhile.
+                nonlocal last_row
+                if batch.errors or batch.conflicts:
+                    await self.db.execute(
+                        insert(ImportJobError),
+                        [
+                            {"job_id": job.id, **error}
+                            for error in batch.errors + batch.conflicts
+                        ],
+                    )
+                progressed = await self.db.execute(
+                    update(ImportJob)
+                    .where(
+                        ImportJob.id == job.id,
+                        ImportJob.status == JOB_RUNNING,
+                        ImportJob.last_row == last_row,
+                    )
+                    .values(
+                        rows_processed=ImportJob.rows_processed + batch.read,
+                        rows_imported=ImportJob.rows_imported + batch.inserted + batch.updated,
+                        rows_updated=ImportJob.rows_updated + batch.updated,
+                        error_count=ImportJob.error_count + batch.rejected,
+                        conflict_count=ImportJob.conflict_count + len(batch.conflicts),
+                        last_row=batch.last_row,
+                        updated_at=func.now(),
+                    )
+                    .returning(ImportJob.id)
+                )
+                if progressed.scalar_one_or_none() is None:
+                    raise _JobTakenOver()
+                if batch.rows and not job.dry_run:
+                    payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
+                    invalidate_counts_after_commit(
+                        self.db, ENTITY_MODEL_MAP[job.entity].__tablename__
+                    )
+                await self.db.commit()
+                last_row = batch.last_row
+
+            text = io.TextIOWrapper(spool, encoding="utf-8-sig", newline="")
+            await self._import_batches(
+                job.entity, text, user, on_batch, last_row, job.mode, job.dry_run
+            )
+        finally:
+            await asyncio.to_thread(spool.close)
+
+        await self.db.refresh(job)
+        if job.status != JOB_RUNNING or job.last_row != last_row:
+            raise _JobTakenOver()
+
+        if job.error_count or job.conflict_count:
+            job.error_file_url = await self._write_error_file(job)
+            await self.db.execute(delete(ImportJobError).where(ImportJobError.job_id == job.id))
+        job.status = JOB_COMPLETED
+        job.file_url = None
+        job.finished_at = func.now()
+        if job.rows_imported and not job.dry_run:
+            await self._log_import(
+                user, job.entity, job.filename, job.rows_imported, job.error_count
+            )
+        await self.db.commit()
+        # The uploaded CSV is no longer needed once the job has finished
+        await delete_files([file_id])
+
+    async def _write_error_file(self, job: ImportJob) -> str:
+        """Store the job's rejected rows as a CSV and return its URL."""
+        rows = await self.db.stream(
+            select(ImportJobError.row, ImportJobError.field, ImportJobError.message)
+            .where(ImportJobError.job_id == job.id)
+            .order_by(ImportJobError.row, ImportJobError.id)
+        )
+
+        async def chunks() -> AsyncIterator[bytes]:
+            output = io.StringIO()
+            writer = csv.writer(output)
+            writer.writerow(["row", "field", "message"])
+            async for partition in rows.partitions(settings.IMPORT_BATCH_SIZE):
+                writer.writerows(partition)
+                yield output.getvalue().encode("utf-8")
+                output.seek(0)
+                output.truncate()
+            if output.tell():
+                yield output.getvalue().encode("utf-8")
+
+        stem = (job.filename or job.entity).rsplit(".", 1)[0]
+        stored = await upload_stream(
+            chunks(), f"{uuid.uuid4()}.csv", "text/csv", original_filename=f"{stem}-errors.csv"
+        )
+        return stored["url"]
+
+
+def _resumable(include_failed: bool = False):
+    """Jobs another worker may take over: stalled queued/running ones (and failed ones)."""
+    stale = ImportJob.updated_at < func.now() - timedelta(
+        seconds=settings.IMPORT_JOB_STALE_SECONDS
+    )
+    condition = and_(ImportJob.status.in_((JOB_QUEUED, JOB_RUNNING)), stale)
+    if include_failed:
+        condition = or_(condition, ImportJob.status == JOB_FAILED)
+    return condition
@@ -8,7 +8,7 @@ Follows SOLID principles and service layer architecture.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,7 +21,7 @@ from app.schemas.calendar_event_schema import (
     CalendarEventOut,
     CalendarEventUpdate,
 )
-from app.utils.scoping import get_scoped_user_ids
+from app.utils.scoping import scope_filter
 
 
 class CalendarEventService:
@@ -47,6 +47,8 @@ class CalendarEventService:
         page: int,
         limit: int,
         user: User,
+        cursor: Optional[str] = None,
+        count: str = "exact",
     ) -> Dict[str, Any]:
         """
         List calendar events with filtering and pagination.
@@ -55,6 +57,8 @@ class CalendarEventService:
             page: Page number
             limit: Items per page
             user: Current user
+            cursor: Keyset cursor (``nextCursor`` of the previous page)
+            count: Total count mode ("exact", "estimated" or "none")
 
         Returns:
             Dictionary with data and pagination info
@@ -62,12 +66,12 @@ class CalendarEventService:
         filters = []
 
         # Apply hierarchy-based scoping (admins see all, others see own + subordinates)
-        scoped_ids = await get_scoped_user_ids(user, self.db)
-        if scoped_ids is not None:
-            filters.append(CalendarEvent.owner_id.in_(scoped_ids))
+        scope = scope_filter(CalendarEvent.owner_id, user)
+        if scope is not None:
+            filters.append(scope)
 
         result = await self.event_repo.get_with_owner(
-            page=page, limit=limit, filters=filters or None
+            page=page, limit=limit, cursor=cursor, count=count, filters=filters or None
         )
 
         # Transform data to include owner name
@@ -101,9 +105,9 @@ class CalendarEventService:
         filters = []
 
         # Apply hierarchy-based scoping (admins see all, others see own + subordinates)
-        scoped_ids = await get_scoped_user_ids(user, self.db)
-        if scoped_ids is not None:
-            filters.append(CalendarEvent.owner_id.in_(scoped_ids))
+        scope = scope_filter(CalendarEvent.owner_id, user)
+        if scope is not None:
+            filters.append(scope)
 
         items = await self.event_repo.get_by_range(
             start_date=start_date,
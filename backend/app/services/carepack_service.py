@@ -19,6 +19,10 @@ from app.models.partner import Partner
 from app.models.user import User
 from app.repositories.base import BaseRepository
 from app.schemas.carepack_schema import CarepackCreate, CarepackOut, CarepackUpdate
+from app.utils.pagination import Keyset, count_rows
+
+# Sort key of the paginated list (newest first)
+LIST_KEYSET = Keyset(Carepack.created_at, Carepack.id)
 
 
 class CarepackService:
@@ -44,6 +48,8 @@ class CarepackService:
         limit: int,
         status: Optional[str] = None,
         partner_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count: str = "exact",
     ) -> Dict[str, Any]:
         """
         List carepacks with filtering and pagination.
@@ -53,6 +59,8 @@ class CarepackService:
             limit: Items per page
             status: Filter by status (active, expired, cancelled)
             partner_id: Filter by partner ID
+            cursor: Keyset cursor (``nextCursor`` of the previous page)
+            count: Total count mode ("exact", "estimated" or "none")
 
         Returns:
             Dictionary with data and pagination info
@@ -72,12 +80,10 @@ class CarepackService:
             stmt = stmt.where(f)
             count_stmt = count_stmt.where(f)
 
-        stmt = stmt.order_by(Carepack.created_at.desc())
-        offset = (page - 1) * limit
-        stmt = stmt.offset(offset).limit(limit)
+        stmt = LIST_KEYSET.paginate(stmt, page, limit, cursor)
 
         result = await self.db.execute(stmt)
-        rows = result.all()
+        rows, next_cursor = LIST_KEYSET.split(result.all(), limit)
 
         data = []
         for row in rows:
@@ -85,9 +91,8 @@ class CarepackService:
             out["partnerName"] = row[1]
             data.append(out)
 
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-        total_pages = (total + limit - 1) // limit
+        total, estimated = await count_rows(self.db, count_stmt, count)
+        total_pages = (total + limit - 1) // limit if total is not None else None
 
         return {
             "data": data,
@@ -96,6 +101,8 @@ class CarepackService:
                 "limit": limit,
                 "total": total,
                 "totalPages": total_pages,
+                "nextCursor": next_cursor,
+                "totalEstimated": estimated,
             },
         }
 
@@ -51,6 +51,8 @@ class ContactService:
         status: Optional[str] = None,
         type: Optional[str] = None,
         search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count: str = "exact",
     ) -> Dict[str, Any]:
         """
         List contacts with filtering, pagination, and access control.
@@ -63,6 +65,8 @@ class ContactService:
             status: Optional filter by status
             type: Optional filter by type
             search: Optional search term for name
+            cursor: Keyset cursor (``nextCursor`` of the previous page)
+            count: Total count mode ("exact", "estimated" or "none")
 
         Returns:
             Dictionary with 'data' and 'pagination'
@@ -90,7 +94,7 @@ class ContactService:
 
         # Get data from repository
         result = await self.contact_repo.get_with_names(
-            page=page, limit=limit, filters=filters or None
+            page=page, limit=limit, cursor=cursor, count=count, filters=filters or None
         )
 
         # Transform data
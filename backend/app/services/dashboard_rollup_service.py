@@ -0,0 +1,319 @@
+"""
+Dashboard Rollup Service
+
+This module maintains the rollup tables that back the dashboard aggregates:
+
+- ``sales_daily_rollups``: per-day x salesperson x partner x product totals
+- ``pipeline_rollups``: per-assignee x stage counters for leads and deals
+
+Write paths take a snapshot of the record before and after the change and
+pass both to ``record_sales`` / ``record_pipeline``; the difference is
+applied as an upsert in the same transaction, so the rollups stay current
+without rescanning the raw tables.  ``rebuild`` and ``check_consistency``
+recompute everything from the raw tables for repair and auditing.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, func, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.dashboard_rollup import NIL_UUID, PipelineRollup, SalesDailyRollup
+
+# Rows per upsert statement (keeps us well below the bind-parameter limit)
+_UPSERT_CHUNK = 1000
+
+_NIL = f"'{NIL_UUID}'::uuid"
+
+_SALES_RAW_SQL = f"""
+    SELECT sale_date, salesperson_id,
+           COALESCE(partner_id, {_NIL}) AS partner_id,
+           COALESCE(product_id, {_NIL}) AS product_id,
+           count(*) AS entry_count,
+           COALESCE(sum(amount), 0) AS total_amount,
+           count(*) FILTER (WHERE payment_status = 'pending') AS pending_count
+    FROM sales_entries
+    GROUP BY 1, 2, 3, 4
+"""
+
+_PIPELINE_RAW_SQL = f"""
+    SELECT 'lead' AS entity, COALESCE(assigned_to, {_NIL}) AS owner_id,
+           COALESCE(stage, '') AS stage, count(*) AS record_count,
+           COALESCE(sum(estimated_value), 0) AS total_value
+    FROM leads
+    GROUP BY 2, 3
+    UNION ALL
+    SELECT 'deal', COALESCE(owner_id, {_NIL}), COALESCE(stage, ''),
+           count(*), COALESCE(sum(value), 0)
+    FROM deals
+    GROUP BY 2, 3
+"""
+
+_SALES_ROLLUP_SQL = """
+    SELECT sale_date, salesperson_id, partner_id, product_id,
+           entry_count, total_amount, pending_count
+    FROM sales_daily_rollups
+    WHERE entry_count <> 0
+"""
+
+_PIPELINE_ROLLUP_SQL = """
+    SELECT entity, owner_id, stage, record_count, total_value
+    FROM pipeline_rollups
+    WHERE record_count <> 0
+"""
+
+
+def _as_uuid(value: Any) -> uuid.UUID:
+    if value is None:
+        return NIL_UUID
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
+
+def _as_decimal(value: Any) -> Decimal:
+    return Decimal(str(value)) if value is not None else Decimal("0")
+
+
+def sales_snapshot(entry: Any) -> Optional[Dict[str, Any]]:
+    """Capture the rollup-relevant fields of a sales entry."""
+    if entry is None:
+        return None
+    return {
+        "key": (
+            entry.sale_date,
+            _as_uuid(entry.salesperson_id),
+            _as_uuid(entry.partner_id),
+            _as_uuid(entry.product_id),
+        ),
+        "amount": _as_decimal(entry.amount),
+        "pending": entry.payment_status == "pending",
+    }
+
+
+def lead_snapshot(lead: Any) -> Optional[Dict[str, Any]]:
+    """Capture the rollup-relevant fields of a lead."""
+    if lead is None:
+        return None
+    return {
+        "key": ("lead", _as_uuid(lead.assigned_to), lead.stage or ""),
+        "value": _as_decimal(lead.estimated_value),
+    }
+
+
+def deal_snapshot(deal: Any) -> Optional[Dict[str, Any]]:
+    """Capture the rollup-relevant fields of a deal."""
+    if deal is None:
+        return None
+    return {
+        "key": ("deal", _as_uuid(deal.owner_id), deal.stage or ""),
+        "value": _as_decimal(deal.value),
+    }
+
+
+class DashboardRollupService:
+    """
+    Service layer for the dashboard rollup tables.
+
+    Handles:
+    - Incremental maintenance from sales entry / lead / deal writes
+    - Full rebuild from the raw tables
+    - Consistency check of rollups against the raw tables
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def record_sales(
+        self,
+        before: Iterable[Optional[Dict[str, Any]]] = (),
+        after: Iterable[Optional[Dict[str, Any]]] = (),
+    ) -> None:
+        """
+        Apply sales entry changes to ``sales_daily_rollups``.
+
+        Args:
+            before: Snapshots of the entries before the write (removed)
+            after: Snapshots of the entries after the write (added)
+        """
+        deltas: Dict[tuple, List[Any]] = defaultdict(lambda: [0, Decimal("0"), 0])
+        for sign, snapshots in ((-1, before), (1, after)):
+            for snap in snapshots:
+                if snap is None:
+                    continue
+                delta = deltas[snap["key"]]
+                delta[0] += sign
+                delta[1] += sign * snap["amount"]
+                delta[2] += sign if snap["pending"] else 0
+
+        rows = [
+            {
+                "sale_date": key[0],
+                "salesperson_id": key[1],
+                "partner_id": key[2],
+                "product_id": key[3],
+                "entry_count": cnt,
+                "total_amount": amount,
+                "pending_count": pending,
+            }
+            for key, (cnt, amount, pending) in deltas.items()
+            if cnt or amount or pending
+        ]
+        if not rows:
+            return
+
+        for i in range(0, len(rows), _UPSERT_CHUNK):
+            stmt = pg_insert(SalesDailyRollup).values(rows[i : i + _UPSERT_CHUNK])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["sale_date", "salesperson_id", "partner_id", "product_id"],
+                set_={
+                    "entry_count": SalesDailyRollup.entry_count + stmt.excluded.entry_count,
+                    "total_amount": SalesDailyRollup.total_amount + stmt.excluded.total_amount,
+                    "pending_count": SalesDailyRollup.pending_count
+                    + stmt.excluded.pending_count,
+                    "updated_at": func.now(),
+                },
+            )
+            await self.db.execute(stmt)
+
+        # Drop buckets that no longer hold any entries
+        emptied = [key for key, (cnt, _, _) in deltas.items() if cnt < 0]
+        if emptied:
+            await self.db.execute(
+                delete(SalesDailyRollup)
+                .where(SalesDailyRollup.entry_count <= 0)
+                .where(
+                    tuple_(
+                        SalesDailyRollup.sale_date,
+                        SalesDailyRollup.salesperson_id,
+                        SalesDailyRollup.partner_id,
+                        SalesDailyRollup.product_id,
+                    ).in_(emptied)
+                )
+            )
+
+    async def record_pipeline(
+        self,
+        before: Iterable[Optional[Dict[str, Any]]] = (),
+        after: Iterable[Optional[Dict[str, Any]]] = (),
+    ) -> None:
+        """
+        Apply lead / deal changes to ``pipeline_rollups``.
+
+        Args:
+            before: Snapshots of the records before the write (removed)
+            after: Snapshots of the records after the write (added)
+        """
+        deltas: Dict[tuple, List[Any]] = defaultdict(lambda: [0, Decimal("0")])
+        for sign, snapshots in ((-1, before), (1, after)):
+            for snap in snapshots:
+                if snap is None:
+                    continue
+                delta = deltas[snap["key"]]
+                delta[0] += sign
+                delta[1] += sign * snap["value"]
+
+        rows = [
+            {
+                "entity": key[0],
+                "owner_id": key[1],
+                "stage": key[2],
+                "record_count": cnt,
+                "total_value": value,
+            }
+            for key, (cnt, value) in deltas.items()
+            if cnt or value
+        ]
+        if not rows:
+            return
+
+        for i in range(0, len(rows), _UPSERT_CHUNK):
+            stmt = pg_insert(PipelineRollup).values(rows[i : i + _UPSERT_CHUNK])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["entity", "owner_id", "stage"],
+                set_={
+                    "record_count": PipelineRollup.record_count + stmt.excluded.record_count,
+                    "total_value": PipelineRollup.total_value + stmt.excluded.total_value,
+                    "updated_at": func.now(),
+                },
+            )
+            await self.db.execute(stmt)
+
+        emptied = [key for key, (cnt, _) in deltas.items() if cnt < 0]
+        if emptied:
+            await self.db.execute(
+                delete(PipelineRollup)
+                .where(PipelineRollup.record_count <= 0)
+                .where(
+                    tuple_(
+                        PipelineRollup.entity,
+                        PipelineRollup.owner_id,
+                        PipelineRollup.stage,
+                    ).in_(emptied)
+                )
+            )
+
+    async def rebuild(self) -> Dict[str, int]:
+        """
+        Recompute both rollup tables from the raw tables.
+
+        Returns:
+            Number of rollup rows written per table
+        """
+        await self.db.execute(delete(SalesDailyRollup))
+        await self.db.execute(delete(PipelineRollup))
+
+        sales = await self.db.execute(
+            text(
+                "INSERT INTO sales_daily_rollups (sale_date, salesperson_id, partner_id, "
+                "product_id, entry_count, total_amount, pending_count) " + _SALES_RAW_SQL
+            )
+        )
+        pipeline = await self.db.execute(
+            text(
+                "INSERT INTO pipeline_rollups (entity, owner_id, stage, record_count, "
+                "total_value) " + _PIPELINE_RAW_SQL
+            )
+        )
+        await self.db.flush()
+        return {
+            "sales_daily_rollups": sales.rowcount,
+            "pipeline_rollups": pipeline.rowcount,
+        }
+
+    async def check_consistency(self, sample_size: int = 20) -> Dict[str, Any]:
+        """
+        Compare the rollup tables against a fresh aggregation of the raw tables.
+
+        Args:
+            sample_size: Maximum number of drifted keys to return per table
+
+        Returns:
+            Dictionary with drift counts, sample keys and an overall flag
+        """
+        report: Dict[str, Any] = {}
+        for name, raw_sql, rollup_sql in (
+            ("sales_daily_rollups", _SALES_RAW_SQL, _SALES_ROLLUP_SQL),
+            ("pipeline_rollups", _PIPELINE_RAW_SQL, _PIPELINE_ROLLUP_SQL),
+        ):
+            missing = (
+                await self.db.execute(text(f"({raw_sql}) EXCEPT ({rollup_sql})"))
+            ).all()
+            stale = (
+                await self.db.execute(text(f"({rollup_sql}) EXCEPT ({raw_sql})"))
+            ).all()
+            report[name] = {
+                "missingOrWrong": len(missing),
+                "stale": len(stale),
+                "sample": [
+                    [str(v) for v in row] for row in (missing + stale)[:sample_size]
+                ],
+            }
+
+        consistent = all(not (r["missingOrWrong"] or r["stale"]) for r in report.values())
+        report["consistent"] = consistent
+        return report
@@ -7,13 +7,20 @@ Follows SOLID principles and service layer architecture.
 
 from __future__ import annotations
 
+import asyncio
+from collections import defaultdict
 from datetime import date, datetime, time, timedelta
-from typing import Any, Dict, List
+from typing import Any, Awaitable, Callable, Dict, List
 
 from sqlalchemy import and_, case, extract, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.pool import NullPool
 
+from app.config import settings
+from app.database import async_session, engine
 from app.models.calendar_event import CalendarEvent
+from app.models.contact import Contact
+from app.models.dashboard_rollup import NIL_UUID, PipelineRollup, SalesDailyRollup
 from app.models.deal import Deal
 from app.models.deal_activity import DealActivity
 from app.models.lead import Lead
@@ -22,7 +29,8 @@ from app.models.product import Product
 from app.models.sales_entry import SalesEntry
 from app.models.task import Task
 from app.models.user import User
-from app.utils.scoping import get_scoped_user_ids
+from app.utils.aggregation import CLOSED_STAGES, stage_totals, stage_values
+from app.utils.scoping import get_scoped_user_ids, scoped_user_subquery
 
 
 class DashboardService:
@@ -41,34 +49,84 @@ class DashboardService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    def _apply_sales_scope(self, stmt, scoped_ids):
+    async def _gather(self, *groups: Callable[[AsyncSession], Awaitable[Any]]) -> List[Any]:
+        """
+        Run independent read-only query groups concurrently.
+
+        Up to ``DASHBOARD_QUERY_CONCURRENCY`` lanes take groups off a shared
+        queue: one on ``self.db`` and the others each on a pooled session of
+        their own, so the round trips overlap and a request holds at most
+        that many connections, its own included.  With a limit of 1, or
+        under NullPool (every extra session would open a new connection),
+        the groups run one after another on ``self.db``.
+
+        Args:
+            groups: Coroutine functions taking the session to query with
+
+        Returns:
+            Group results, in the order of ``groups``
+        """
+        lanes = min(settings.DASHBOARD_QUERY_CONCURRENCY, len(groups))
+        if lanes <= 1 or isinstance(engine.pool, NullPool):
+            return [await group(self.db) for group in groups]
+
+        results: List[Any] = [None] * len(groups)
+        queue = iter(enumerate(groups))
+
+        async def run(session: AsyncSession) -> None:
+            for i, group in queue:
+                results[i] = await group(session)
+
+        async def run_pooled() -> None:
+            async with async_session() as session:
+                await run(session)
+
+        await asyncio.gather(run(self.db), *(run_pooled() for _ in range(lanes - 1)))
+        return results
+
+    # ``scope`` is the closure-table subquery from scoped_user_subquery(),
+    # or None for unrestricted users.
+
+    def _apply_sales_scope(self, stmt, scope):
         """Apply sales scoping filter."""
-        if scoped_ids is not None:
-            return stmt.where(SalesEntry.salesperson_id.in_(scoped_ids))
+        if scope is not None:
+            return stmt.where(SalesEntry.salesperson_id.in_(scope))
         return stmt
 
-    def _apply_lead_scope(self, stmt, scoped_ids):
+    def _apply_lead_scope(self, stmt, scope):
         """Apply lead scoping filter."""
-        if scoped_ids is not None:
-            return stmt.where(Lead.assigned_to.in_(scoped_ids))
+        if scope is not None:
+            return stmt.where(Lead.assigned_to.in_(scope))
         return stmt
 
-    def _apply_deal_scope(self, stmt, scoped_ids):
+    def _apply_deal_scope(self, stmt, scope):
         """Apply deal scoping filter."""
-        if scoped_ids is not None:
-            return stmt.where(Deal.owner_id.in_(scoped_ids))
+        if scope is not None:
+            return stmt.where(Deal.owner_id.in_(scope))
         return stmt
 
-    def _apply_task_scope(self, stmt, scoped_ids):
+    def _apply_task_scope(self, stmt, scope):
         """Apply task scoping filter."""
-        if scoped_ids is not None:
-            return stmt.where(Task.assigned_to.in_(scoped_ids))
+        if scope is not None:
+            return stmt.where(Task.assigned_to.in_(scope))
         return stmt
 
-    def _apply_partner_scope(self, stmt, scoped_ids):
+    def _apply_partner_scope(self, stmt, scope):
         """Apply partner scoping filter."""
-        if scoped_ids is not None:
-            return stmt.where(Partner.assigned_to.in_(scoped_ids))
+        if scope is not None:
+            return stmt.where(Partner.assigned_to.in_(scope))
+        return stmt
+
+    def _apply_sales_rollup_scope(self, stmt, scope):
+        """Apply sales scoping filter to the sales rollup table."""
+        if scope is not None:
+            return stmt.where(SalesDailyRollup.salesperson_id.in_(scope))
+        return stmt
+
+    def _apply_pipeline_rollup_scope(self, stmt, scope):
+        """Apply owner scoping filter to the pipeline rollup table."""
+        if scope is not None:
+            return stmt.where(PipelineRollup.owner_id.in_(scope))
         return stmt
 
     async def get_dashboard_stats(self, user: User) -> Dict[str, Any]:
@@ -83,67 +141,46 @@ class DashboardService:
         """
         today = date.today()
         month_start = today.replace(day=1)
-        scoped_ids = await get_scoped_user_ids(user, self.db)
-
-        # Total sales amount (all time, scoped)
-        sales_stmt = select(func.coalesce(func.sum(SalesEntry.amount), 0))
-        sales_stmt = self._apply_sales_scope(sales_stmt, scoped_ids)
-        total_sales = (await self.db.execute(sales_stmt)).scalar_one()
-
-        # Monthly revenue
-        monthly_stmt = select(func.coalesce(func.sum(SalesEntry.amount), 0)).where(
-            SalesEntry.sale_date >= month_start
-        )
-        monthly_stmt = self._apply_sales_scope(monthly_stmt, scoped_ids)
-        monthly_revenue = (await self.db.execute(monthly_stmt)).scalar_one()
-
-        # Total sales count
-        count_stmt = select(func.count()).select_from(SalesEntry)
-        count_stmt = self._apply_sales_scope(count_stmt, scoped_ids)
-        total_count = (await self.db.execute(count_stmt)).scalar_one()
-
-        # Total partners
-        partner_stmt = (
-            select(func.count())
-            .select_from(Partner)
-            .where(Partner.status == "approved")
-        )
-        partner_stmt = self._apply_partner_scope(partner_stmt, scoped_ids)
-        total_partners = (await self.db.execute(partner_stmt)).scalar_one()
-
-        # Pending partners
-        pending_stmt = (
-            select(func.count()).select_from(Partner).where(Partner.status == "pending")
+        scope = scoped_user_subquery(user)
+
+        def scoped(column):
+            return [column.in_(scope)] if scope is not None else None
+
+        # Sales totals, monthly revenue and pending payments (one scan)
+        payments, sales = await stage_totals(
+            self.db,
+            SalesEntry.payment_status,
+            sums={
+                "amount": SalesEntry.amount,
+                "monthly": case(
+                    (SalesEntry.sale_date >= month_start, SalesEntry.amount), else_=0
+                ),
+            },
+            filters=scoped(SalesEntry.salesperson_id),
         )
-        pending_stmt = self._apply_partner_scope(pending_stmt, scoped_ids)
-        pending_partners = (await self.db.execute(pending_stmt)).scalar_one()
 
-        # Active leads
-        lead_stmt = (
-            select(func.count())
-            .select_from(Lead)
-            .where(Lead.stage.notin_(["Closed Won", "Closed Lost"]))
+        # Approved / pending partners
+        partners, _ = await stage_totals(
+            self.db,
+            Partner.status,
+            filters=scoped(Partner.assigned_to),
+            stages=("approved", "pending"),
         )
-        lead_stmt = self._apply_lead_scope(lead_stmt, scoped_ids)
-        active_leads = (await self.db.execute(lead_stmt)).scalar_one()
 
-        # Pending payments
-        pending_pay_stmt = (
-            select(func.count())
-            .select_from(SalesEntry)
-            .where(SalesEntry.payment_status == "pending")
+        # Active leads (every stage except the closed ones)
+        closed, leads = await stage_totals(
+            self.db, Lead.stage, filters=scoped(Lead.assigned_to), stages=CLOSED_STAGES
         )
-        pending_pay_stmt = self._apply_sales_scope(pending_pay_stmt, scoped_ids)
-        pending_payments = (await self.db.execute(pending_pay_stmt)).scalar_one()
+        active_leads = leads["count"] - sum(t["count"] for t in closed.values())
 
         return {
-            "totalSales": float(total_sales),
-            "totalCount": total_count,
-            "monthlyRevenue": float(monthly_revenue),
-            "totalPartners": total_partners,
-            "pendingPartners": pending_partners,
+            "totalSales": sales["amount"],
+            "totalCount": sales["count"],
+            "monthlyRevenue": sales["monthly"],
+            "totalPartners": partners["approved"]["count"],
+            "pendingPartners": partners["pending"]["count"],
             "activeLeads": active_leads,
-            "pendingPayments": pending_payments,
+            "pendingPayments": payments["pending"]["count"],
         }
 
     async def get_monthly_stats(self, user: User) -> List[Dict[str, Any]]:
@@ -158,7 +195,7 @@ class DashboardService:
         """
         today = date.today()
         twelve_months_ago = (today.replace(day=1) - timedelta(days=365)).replace(day=1)
-        scoped_ids = await get_scoped_user_ids(user, self.db)
+        scope = scoped_user_subquery(user)
 
         stmt = (
             select(
@@ -171,7 +208,7 @@ class DashboardService:
             .group_by("year", "month")
             .order_by("year", "month")
         )
-        stmt = self._apply_sales_scope(stmt, scoped_ids)
+        stmt = self._apply_sales_scope(stmt, scope)
 
         result = await self.db.execute(stmt)
         rows = result.all()
@@ -217,7 +254,7 @@ class DashboardService:
         this_month_start = today.replace(day=1)
         last_month_end = this_month_start - timedelta(days=1)
         last_month_start = last_month_end.replace(day=1)
-        scoped_ids = await get_scoped_user_ids(user, self.db)
+        scope = scoped_user_subquery(user)
 
         async def _month_sum(start: date, end: date) -> float:
             stmt = (
@@ -225,7 +262,7 @@ class DashboardService:
                 .where(SalesEntry.sale_date >= start)
                 .where(SalesEntry.sale_date <= end)
             )
-            stmt = self._apply_sales_scope(stmt, scoped_ids)
+            stmt = self._apply_sales_scope(stmt, scope)
             return float((await self.db.execute(stmt)).scalar_one())
 
         this_month = await _month_sum(this_month_start, today)
@@ -248,7 +285,7 @@ class DashboardService:
             .order_by(SalesEntry.created_at.desc())
             .limit(5)
         )
-        recent_stmt = self._apply_sales_scope(recent_stmt, scoped_ids)
+        recent_stmt = self._apply_sales_scope(recent_stmt, scope)
 
         result = await self.db.execute(recent_stmt)
         recent_rows = result.all()
@@ -278,7 +315,7 @@ class DashboardService:
     async def get_dashboard_all(self, user: User) -> Dict[str, Any]:
         """
         Single combined endpoint returning ALL dashboard data in one request.
-        Optimized with minimal queries using aggregations.
+        Sales and pipeline aggregates are read from the rollup tables.
 
         Args:
             user: Current user
@@ -292,47 +329,200 @@ class DashboardService:
         last_month_start = last_month_end.replace(day=1)
         twelve_months_ago = (month_start - timedelta(days=365)).replace(day=1)
 
-        scoped_ids = await get_scoped_user_ids(user, self.db)
+        scope = scoped_user_subquery(user)
 
-        # ── 1. Sales aggregates (single query) ──────────────────────
-        sales_agg = select(
-            func.coalesce(func.sum(SalesEntry.amount), 0).label("total_sales"),
-            func.count().label("total_count"),
-            func.coalesce(
-                func.sum(
-                    case(
-                        (SalesEntry.sale_date >= month_start, SalesEntry.amount),
-                        else_=0,
-                    )
-                ),
-                0,
-            ).label("monthly_revenue"),
-            func.coalesce(
-                func.sum(
-                    case(
-                        (
-                            SalesEntry.sale_date.between(
-                                last_month_start, last_month_end
+        # Sales and pipeline aggregates come from the rollup tables
+        # (see DashboardRollupService); partners and tasks are read raw.
+        R = SalesDailyRollup
+
+        # ── 1. Sales aggregates (single rollup query) ───────────────
+        async def _sales(db: AsyncSession):
+            sales_agg = select(
+                func.coalesce(func.sum(R.total_amount), 0).label("total_sales"),
+                func.coalesce(func.sum(R.entry_count), 0).label("total_count"),
+                func.coalesce(
+                    func.sum(case((R.sale_date >= month_start, R.total_amount), else_=0)),
+                    0,
+                ).label("monthly_revenue"),
+                func.coalesce(
+                    func.sum(
+                        case(
+                            (
+                                R.sale_date.between(last_month_start, last_month_end),
+                                R.total_amount,
                             ),
-                            SalesEntry.amount,
-                        ),
-                        else_=0,
+                            else_=0,
+                        )
+                    ),
+                    0,
+                ).label("last_month_revenue"),
+                func.coalesce(func.sum(R.pending_count), 0).label("pending_payments"),
+            )
+            sales_agg = self._apply_sales_rollup_scope(sales_agg, scope)
+            return (await db.execute(sales_agg)).one()
+
+        # ── 2. Partner counts (single query) ────────────────────────
+        async def _partners(db: AsyncSession):
+            partner_agg = select(
+                func.count().filter(Partner.status == "approved").label("approved"),
+                func.count().filter(Partner.status == "pending").label("pending"),
+            ).select_from(Partner)
+            partner_agg = self._apply_partner_scope(partner_agg, scope)
+            return (await db.execute(partner_agg)).one()
+
+        # ── 3-5. Lead / deal stage stats and per-assignee pipeline ──
+        # One rollup query per (entity, owner, stage) feeds the stage
+        # stats, the active-lead count and the assignee summary.
+        async def _pipeline(db: AsyncSession):
+            pipeline_stmt = self._apply_pipeline_rollup_scope(
+                select(
+                    PipelineRollup.entity,
+                    PipelineRollup.owner_id,
+                    PipelineRollup.stage,
+                    PipelineRollup.record_count,
+                    PipelineRollup.total_value,
+                ).where(PipelineRollup.record_count != 0),
+                scope,
+            )
+            return (await db.execute(pipeline_stmt)).all()
+
+        # ── 6. Task stats (single GROUP BY query) ──────────────────
+        lead_stages = await stage_values(self.db, Lead.stage)
+        deal_stages = await stage_values(self.db, Deal.stage)
+        task_statuses = await stage_values(self.db, Task.status)
+
+        async def _tasks(db: AsyncSession):
+            by_status, _ = await stage_totals(
+                db,
+                Task.status,
+                filters=[Task.assigned_to.in_(scope)] if scope is not None else None,
+                stages=task_statuses,
+            )
+            return by_status
+
+        # ── 7. Monthly stats (single grouped rollup query) ─────────
+        async def _monthly(db: AsyncSession):
+            monthly_stmt = (
+                select(
+                    extract("year", R.sale_date).label("year"),
+                    extract("month", R.sale_date).label("month"),
+                    func.coalesce(func.sum(R.total_amount), 0).label("revenue"),
+                    func.coalesce(func.sum(R.entry_count), 0).label("count"),
+                )
+                .where(R.sale_date >= twelve_months_ago)
+                .group_by("year", "month")
+                .order_by("year", "month")
+            )
+            monthly_stmt = self._apply_sales_rollup_scope(monthly_stmt, scope)
+            return (await db.execute(monthly_stmt)).all()
+
+        # ── 8. Recent sales (single query with joins) ──────────────
+        async def _recent(db: AsyncSession):
+            recent_stmt = (
+                select(
+                    SalesEntry,
+                    Partner.company_name.label("partner_name"),
+                    User.name.label("salesperson_name"),
+                )
+                .outerjoin(Partner, SalesEntry.partner_id == Partner.id)
+                .outerjoin(User, SalesEntry.salesperson_id == User.id)
+                .order_by(SalesEntry.created_at.desc())
+                .limit(5)
+            )
+            recent_stmt = self._apply_sales_scope(recent_stmt, scope)
+            return (await db.execute(recent_stmt)).all()
+
+        # ── 9. Breakdown: by product, partner, salesperson ─────────
+        def _breakdown(name_col, join_target, join_on, name_key):
+            async def run(db: AsyncSession):
+                stmt = self._apply_sales_rollup_scope(
+                    select(
+                        name_col.label("name"),
+                        func.coalesce(func.sum(R.total_amount), 0).label("total"),
+                        func.coalesce(func.sum(R.entry_count), 0).label("cnt"),
                     )
-                ),
-                0,
-            ).label("last_month_revenue"),
-            func.count()
-            .filter(SalesEntry.payment_status == "pending")
-            .label("pending_payments"),
+                    .join(join_target, join_on)
+                    .group_by(name_col)
+                    .order_by(func.sum(R.total_amount).desc())
+                    .limit(10),
+                    scope,
+                )
+                return [
+                    {
+                        name_key: r.name or "Unknown",
+                        "totalAmount": float(r.total),
+                        "count": int(r.cnt),
+                    }
+                    for r in (await db.execute(stmt)).all()
+                ]
+
+            return run
+
+        # ── Assignee Summary: partners and sales per assignee ──────
+        async def _assignee_partners(db: AsyncSession):
+            assignee_partner_stmt = self._apply_partner_scope(
+                select(
+                    Partner.assigned_to,
+                    func.count().label("cnt"),
+                )
+                .where(Partner.is_active.is_(True))
+                .group_by(Partner.assigned_to),
+                scope,
+            )
+            return {
+                str(r[0]): r.cnt
+                for r in (await db.execute(assignee_partner_stmt)).all()
+                if r[0] is not None
+            }
+
+        async def _assignee_sales(db: AsyncSession):
+            assignee_sales_stmt = self._apply_sales_rollup_scope(
+                select(
+                    R.salesperson_id,
+                    func.coalesce(func.sum(R.entry_count), 0).label("cnt"),
+                    func.coalesce(func.sum(R.total_amount), 0).label("total"),
+                ).group_by(R.salesperson_id),
+                scope,
+            )
+            return {
+                str(r[0]): {"count": int(r.cnt), "amount": float(r.total)}
+                for r in (await db.execute(assignee_sales_stmt)).all()
+                if r[0] is not None
+            }
+
+        (
+            sr,
+            pr,
+            pipeline_rows,
+            task_totals,
+            monthly_rows,
+            recent_rows,
+            by_product,
+            by_partner,
+            by_salesperson,
+            assignee_partners,
+            assignee_sales,
+        ) = await self._gather(
+            _sales,
+            _partners,
+            _pipeline,
+            _tasks,
+            _monthly,
+            _recent,
+            _breakdown(Product.name, Product, R.product_id == Product.id, "productName"),
+            _breakdown(
+                Partner.company_name, Partner, R.partner_id == Partner.id, "partnerName"
+            ),
+            _breakdown(User.name, User, R.salesperson_id == User.id, "salespersonName"),
+            _assignee_partners,
+            _assignee_sales,
         )
-        sales_agg = self._apply_sales_scope(sales_agg, scoped_ids)
-        sr = (await self.db.execute(sales_agg)).one()
 
         total_sales = float(sr.total_sales)
-        total_count = sr.total_count
+        total_count = int(sr.total_count)
         monthly_revenue = float(sr.monthly_revenue)
         last_month_rev = float(sr.last_month_revenue)
-        pending_payments = sr.pending_payments
+        pending_payments = int(sr.pending_payments)
 
         if last_month_rev > 0:
             growth_pct = round(
@@ -341,88 +531,40 @@ class DashboardService:
         else:
             growth_pct = 100.0 if monthly_revenue > 0 else 0.0
 
-        # ── 2. Partner counts (single query) ────────────────────────
-        partner_agg = select(
-            func.count().filter(Partner.status == "approved").label("approved"),
-            func.count().filter(Partner.status == "pending").label("pending"),
-        ).select_from(Partner)
-        partner_agg = self._apply_partner_scope(partner_agg, scoped_ids)
-        pr = (await self.db.execute(partner_agg)).one()
-
-        # ── 3. Active leads (single query) ──────────────────────────
-        lead_count_stmt = (
-            select(func.count())
-            .select_from(Lead)
-            .where(Lead.stage.notin_(["Closed Won", "Closed Lost"]))
+        stage_counts: Dict[tuple, int] = defaultdict(int)
+        stage_amounts: Dict[tuple, float] = defaultdict(float)
+        assignee_leads: Dict[str, int] = defaultdict(int)
+        assignee_deals: Dict[str, Dict[str, Any]] = {}
+        for r in pipeline_rows:
+            stage_counts[(r.entity, r.stage)] += r.record_count
+            stage_amounts[(r.entity, r.stage)] += float(r.total_value)
+            if r.stage in CLOSED_STAGES or r.owner_id == NIL_UUID:
+                continue
+            owner = str(r.owner_id)
+            if r.entity == "lead":
+                assignee_leads[owner] += r.record_count
+            else:
+                agg = assignee_deals.setdefault(owner, {"count": 0, "value": 0.0})
+                agg["count"] += r.record_count
+                agg["value"] += float(r.total_value)
+
+        lead_stats = {s: stage_counts[("lead", s)] for s in lead_stages}
+        active_leads = sum(
+            cnt
+            for (entity, stage), cnt in stage_counts.items()
+            if entity == "lead" and stage not in CLOSED_STAGES
         )
-        lead_count_stmt = self._apply_lead_scope(lead_count_stmt, scoped_ids)
-        active_leads = (await self.db.execute(lead_count_stmt)).scalar_one()
-
-        # ── 4. Lead stats by stage (single query with CASE) ─────────
-        lead_stages = ["New", "Cold", "Proposal", "Negotiation", "Closed Won", "Closed Lost"]
-        lead_cases = [
-            func.count().filter(Lead.stage == s).label(s.lower().replace(" ", "_"))
-            for s in lead_stages
-        ]
-        lead_stmt = select(*lead_cases).select_from(Lead)
-        lead_stmt = self._apply_lead_scope(lead_stmt, scoped_ids)
-        lr = (await self.db.execute(lead_stmt)).one()
-        lead_stats = {s: getattr(lr, s.lower().replace(" ", "_")) for s in lead_stages}
-
-        # ── 5. Deal pipeline stats (single query with CASE) ─────────
-        deal_stages = [
-            "New",
-            "Cold",
-            "Proposal",
-            "Negotiation",
-            "Closed Won",
-            "Closed Lost",
-        ]
-        deal_cases = []
-        for ds in deal_stages:
-            safe = ds.lower().replace(" ", "_")
-            deal_cases.append(
-                func.count().filter(Deal.stage == ds).label(f"{safe}_cnt")
-            )
-            deal_cases.append(
-                func.coalesce(
-                    func.sum(case((Deal.stage == ds, Deal.value), else_=0)), 0
-                ).label(f"{safe}_val")
-            )
-        deal_stmt = select(*deal_cases).select_from(Deal)
-        deal_stmt = self._apply_deal_scope(deal_stmt, scoped_ids)
-        dr = (await self.db.execute(deal_stmt)).one()
-        deal_stats = {}
-        for ds in deal_stages:
-            safe = ds.lower().replace(" ", "_")
-            deal_stats[ds] = {
-                "count": getattr(dr, f"{safe}_cnt"),
-                "value": float(getattr(dr, f"{safe}_val")),
+
+        deal_stats = {
+            ds: {
+                "count": stage_counts[("deal", ds)],
+                "value": stage_amounts[("deal", ds)],
             }
+            for ds in deal_stages
+        }
 
-        # ── 6. Task stats (single query with CASE) ─────────────────
-        task_statuses = ["pending", "in_progress", "completed"]
-        task_cases = [
-            func.count().filter(Task.status == s).label(s) for s in task_statuses
-        ]
-        task_stmt = select(*task_cases).select_from(Task)
-        task_stmt = self._apply_task_scope(task_stmt, scoped_ids)
-        tr = (await self.db.execute(task_stmt)).one()
-        task_stats = {s: getattr(tr, s) for s in task_statuses}
+        task_stats = {s: totals["count"] for s, totals in task_totals.items()}
 
-        # ── 7. Monthly stats (single grouped query) ────────────────
-        monthly_stmt = (
-            select(
-                extract("year", SalesEntry.sale_date).label("year"),
-                extract("month", SalesEntry.sale_date).label("month"),
-                func.coalesce(func.sum(SalesEntry.amount), 0).label("revenue"),
-                func.count().label("count"),
-            )
-            .where(SalesEntry.sale_date >= twelve_months_ago)
-            .group_by("year", "month")
-            .order_by("year", "month")
-        )
-        monthly_stmt = self._apply_sales_scope(monthly_stmt, scoped_ids)
         month_names = [
             "",
             "Jan",
@@ -442,26 +584,13 @@ class DashboardService:
             {
                 "month": f"{month_names[int(r.month)]} {int(r.year)}",
                 "revenue": float(r.revenue),
-                "count": r.count,
+                "count": int(r.count),
             }
-            for r in (await self.db.execute(monthly_stmt)).all()
+            for r in monthly_rows
         ]
 
-        # ── 8. Recent sales (single query with joins) ──────────────
-        recent_stmt = (
-            select(
-                SalesEntry,
-                Partner.company_name.label("partner_name"),
-                User.name.label("salesperson_name"),
-            )
-            .outerjoin(Partner, SalesEntry.partner_id == Partner.id)
-            .outerjoin(User, SalesEntry.salesperson_id == User.id)
-            .order_by(SalesEntry.created_at.desc())
-            .limit(5)
-        )
-        recent_stmt = self._apply_sales_scope(recent_stmt, scoped_ids)
         recent_sales = []
-        for row in (await self.db.execute(recent_stmt)).all():
+        for row in recent_rows:
             sale = row[0]
             recent_sales.append(
                 {
@@ -475,148 +604,6 @@ class DashboardService:
                 }
             )
 
-        # ── 9. Breakdown: by product, partner, salesperson ─────────
-        def _scope(stmt):
-            return self._apply_sales_scope(stmt, scoped_ids)
-
-        by_product = [
-            {
-                "productName": r.name or "Unknown",
-                "totalAmount": float(r.total),
-                "count": r.cnt,
-            }
-            for r in (
-                await self.db.execute(
-                    _scope(
-                        select(
-                            Product.name.label("name"),
-                            func.coalesce(func.sum(SalesEntry.amount), 0).label(
-                                "total"
-                            ),
-                            func.count().label("cnt"),
-                        )
-                        .join(Product, SalesEntry.product_id == Product.id)
-                        .group_by(Product.name)
-                        .order_by(func.sum(SalesEntry.amount).desc())
-                        .limit(10)
-                    )
-                )
-            ).all()
-        ]
-        by_partner = [
-            {
-                "partnerName": r.name or "Unknown",
-                "totalAmount": float(r.total),
-                "count": r.cnt,
-            }
-            for r in (
-                await self.db.execute(
-                    _scope(
-                        select(
-                            Partner.company_name.label("name"),
-                            func.coalesce(func.sum(SalesEntry.amount), 0).label(
-                                "total"
-                            ),
-                            func.count().label("cnt"),
-                        )
-                        .join(Partner, SalesEntry.partner_id == Partner.id)
-                        .group_by(Partner.company_name)
-                        .order_by(func.sum(SalesEntry.amount).desc())
-                        .limit(10)
-                    )
-                )
-            ).all()
-        ]
-        by_salesperson = [
-            {
-                "salespersonName": r.name or "Unknown",
-                "totalAmount": float(r.total),
-                "count": r.cnt,
-            }
-            for r in (
-                await self.db.execute(
-                    _scope(
-                        select(
-                            User.name.label("name"),
-                            func.coalesce(func.sum(SalesEntry.amount), 0).label(
-                                "total"
-                            ),
-                            func.count().label("cnt"),
-                        )
-                        .join(User, SalesEntry.salesperson_id == User.id)
-                        .group_by(User.name)
-                        .order_by(func.sum(SalesEntry.amount).desc())
-                        .limit(10)
-                    )
-                )
-            ).all()
-        ]
-
-        # ── Assignee Summary ────────────────────────────────────────
-        # Partners per assignee
-        assignee_partner_stmt = self._apply_partner_scope(
-            select(
-                Partner.assigned_to,
-                func.count().label("cnt"),
-            )
-            .where(Partner.is_active.is_(True))
-            .group_by(Partner.assigned_to),
-            scoped_ids,
-        )
-        assignee_partners = {
-            str(r[0]): r.cnt
-            for r in (await self.db.execute(assignee_partner_stmt)).all()
-            if r[0] is not None
-        }
-
-        # Leads per assignee
-        assignee_lead_stmt = self._apply_lead_scope(
-            select(
-                Lead.assigned_to,
-                func.count().label("cnt"),
-            )
-            .where(Lead.stage.notin_(["Closed Won", "Closed Lost"]))
-            .group_by(Lead.assigned_to),
-            scoped_ids,
-        )
-        assignee_leads = {
-            str(r[0]): r.cnt
-            for r in (await self.db.execute(assignee_lead_stmt)).all()
-            if r[0] is not None
-        }
-
-        # Deals per assignee
-        assignee_deal_stmt = self._apply_deal_scope(
-            select(
-                Deal.owner_id,
-                func.count().label("cnt"),
-                func.coalesce(func.sum(Deal.value), 0).label("val"),
-            )
-            .where(Deal.stage.notin_(["Closed Won", "Closed Lost"]))
-            .group_by(Deal.owner_id),
-            scoped_ids,
-        )
-        assignee_deals = {
-            str(r[0]): {"count": r.cnt, "value": float(r.val)}
-            for r in (await self.db.execute(assignee_deal_stmt)).all()
-            if r[0] is not None
-        }
-
-        # Sales per assignee (salesperson)
-        assignee_sales_stmt = self._apply_sales_scope(
-            select(
-                SalesEntry.salesperson_id,
-                func.count().label("cnt"),
-                func.coalesce(func.sum(SalesEntry.amount), 0).label("total"),
-            ).group_by(SalesEntry.salesperson_id),
-            scoped_ids,
-        )
-        assignee_sales = {
-            str(r[0]): {"count": r.cnt, "amount": float(r.total)}
-            for r in (await self.db.execute(assignee_sales_stmt)).all()
-            if r[0] is not None
-        }
-
         # Collect all user IDs and fetch names
         all_assignee_ids = (
             set(assignee_partners.keys())
@@ -719,30 +706,6 @@ class DashboardService:
             )
         ).scalar_one()
 
-        lead_cnt = (
-            await self.db.execute(
-                select(func.count())
-                .select_from(Lead)
-                .where(
-                    Lead.assigned_to.in_(target_ids), Lead.stage.notin_(["Closed Won", "Closed Lost"])
-                )
-            )
-        ).scalar_one()
-
-        deal_agg = (
-            await self.db.execute(
-                select(
-                    func.count().label("cnt"),
-                    func.coalesce(func.sum(Deal.value), 0).label("val"),
-                )
-                .select_from(Deal)
-                .where(
-                    Deal.owner_id.in_(target_ids),
-                    Deal.stage.notin_(["Closed Won", "Closed Lost"]),
-                )
-            )
-        ).one()
-
         sales_agg = (
             await self.db.execute(
                 select(
@@ -754,57 +717,23 @@ class DashboardService:
             )
         ).one()
 
-        # ── Leads by stage ────────────────────────────────────────
-        lead_stages = ["New", "Cold", "Proposal", "Negotiation", "Closed Won", "Closed Lost"]
-        lead_cases = [
-            func.count().filter(Lead.stage == s).label(s.lower().replace(" ", "_"))
-            for s in lead_stages
-        ]
-        lr = (
-            await self.db.execute(
-                select(*lead_cases)
-                .select_from(Lead)
-                .where(Lead.assigned_to.in_(target_ids))
-            )
-        ).one()
-        leads_by_stage = {
-            s: getattr(lr, s.lower().replace(" ", "_")) for s in lead_stages
-        }
-
-        # ── Deals by stage ────────────────────────────────────────
-        deal_stages = [
-            "New",
-            "Cold",
-            "Proposal",
-            "Negotiation",
-            "Closed Won",
-            "Closed Lost",
-        ]
-        deal_cases = []
-        for ds in deal_stages:
-            safe = ds.lower().replace(" ", "_")
-            deal_cases.append(
-                func.count().filter(Deal.stage == ds).label(f"{safe}_cnt")
-            )
-            deal_cases.append(
-                func.coalesce(
-                    func.sum(case((Deal.stage == ds, Deal.value), else_=0)), 0
-                ).label(f"{safe}_val")
-            )
-        dr = (
-            await self.db.execute(
-                select(*deal_cases)
-                .select_from(Deal)
-                .where(Deal.owner_id.in_(target_ids))
-            )
-        ).one()
-        deals_by_stage = {}
-        for ds in deal_stages:
-            safe = ds.lower().replace(" ", "_")
-            cnt = getattr(dr, f"{safe}_cnt")
-            val = float(getattr(dr, f"{safe}_val"))
-            if cnt > 0:
-                deals_by_stage[ds] = {"count": cnt, "value": val}
+        # ── Leads and deals by stage (one scan each) ──────────────
+        lead_totals, leads = await stage_totals(
+            self.db, Lead.stage, filters=[Lead.assigned_to.in_(target_ids)]
+        )
+        leads_by_stage = {s: t["count"] for s, t in lead_totals.items()}
+        lead_cnt = leads["count"] - sum(leads_by_stage.get(s, 0) for s in CLOSED_STAGES)
+
+        deal_totals, deals = await stage_totals(
+            self.db,
+            Deal.stage,
+            sums={"value": Deal.value},
+            filters=[Deal.owner_id.in_(target_ids)],
+        )
+        deals_by_stage = {s: t for s, t in deal_totals.items() if t["count"] > 0}
+        closed_deals = [deal_totals.get(s, {"count": 0, "value": 0.0}) for s in CLOSED_STAGES]
+        open_deal_cnt = deals["count"] - sum(t["count"] for t in closed_deals)
+        open_deal_value = deals["value"] - sum(t["value"] for t in closed_deals)
 
         # ── Monthly sales (last 12 months) ────────────────────────
         today = date.today()
@@ -877,8 +806,8 @@ class DashboardService:
             "summary": {
                 "partners": partner_cnt,
                 "leads": lead_cnt,
-                "deals": deal_agg.cnt,
-                "dealValue": float(deal_agg.val),
+                "deals": open_deal_cnt,
+                "dealValue": open_deal_value,
                 "salesCount": sales_agg.cnt,
                 "salesAmount": float(sales_agg.total),
             },
@@ -901,58 +830,183 @@ class DashboardService:
         next_month = (month_start + timedelta(days=32)).replace(day=1)
         uid = str(user.id)
 
+        def _count(stmt):
+            async def run(db: AsyncSession) -> int:
+                return (await db.execute(stmt)).scalar_one()
+
+            return run
+
         # ── KPI 1: My Open Deals ─────────────────────────────────
-        my_open_deals = (
-            await self.db.execute(
-                select(func.count())
-                .select_from(Deal)
-                .where(Deal.owner_id == uid)
-                .where(Deal.stage.notin_(["Closed Won", "Closed Lost"]))
-            )
-        ).scalar_one()
+        _open_deals = _count(
+            select(func.count())
+            .select_from(Deal)
+            .where(Deal.owner_id == uid)
+            .where(Deal.stage.notin_(CLOSED_STAGES))
+        )
 
         # ── KPI 2: My Untouched Deals (no activity records) ──────
-        my_untouched_deals = (
-            await self.db.execute(
-                select(func.count())
-                .select_from(Deal)
-                .outerjoin(DealActivity, Deal.id == DealActivity.deal_id)
-                .where(Deal.owner_id == uid)
-                .where(Deal.stage.notin_(["Closed Won", "Closed Lost"]))
-                .where(DealActivity.id.is_(None))
-            )
-        ).scalar_one()
+        _untouched_deals = _count(
+            select(func.count())
+            .select_from(Deal)
+            .outerjoin(DealActivity, Deal.id == DealActivity.deal_id)
+            .where(Deal.owner_id == uid)
+            .where(Deal.stage.notin_(CLOSED_STAGES))
+            .where(DealActivity.id.is_(None))
+        )
 
         # ── KPI 3: My Calls Today ────────────────────────────────
-        my_calls_today = (
-            await self.db.execute(
-                select(func.count())
-                .select_from(CalendarEvent)
-                .where(CalendarEvent.owner_id == uid)
-                .where(CalendarEvent.start_time >= today_start)
-                .where(CalendarEvent.start_time <= today_end)
-            )
-        ).scalar_one()
+        _calls_today = _count(
+            select(func.count())
+            .select_from(CalendarEvent)
+            .where(CalendarEvent.owner_id == uid)
+            .where(CalendarEvent.start_time >= today_start)
+            .where(CalendarEvent.start_time <= today_end)
+        )
 
         # ── KPI 4: My Leads (all) ────────────────────────────────
-        my_leads = (
-            await self.db.execute(
-                select(func.count())
-                .select_from(Lead)
-                .where(Lead.assigned_to == uid)
-            )
-        ).scalar_one()
+        _leads = _count(
+            select(func.count())
+            .select_from(Lead)
+            .where(Lead.assigned_to == uid)
+        )
 
         # ── My Open Tasks (list) ─────────────────────────────────
-        task_rows = (
-            await self.db.execute(
-                select(Task)
-                .where(Task.assigned_to == uid)
-                .where(Task.status != "completed")
-                .order_by(Task.due_date.asc().nulls_last())
-                .limit(50)
+        async def _tasks(db: AsyncSession):
+            return (
+                await db.execute(
+                    select(Task)
+                    .where(Task.assigned_to == uid)
+                    .where(Task.status != "completed")
+                    .order_by(Task.due_date.asc().nulls_last())
+                    .limit(50)
+                )
+            ).scalars().all()
+
+        # ── My Meetings (list) ───────────────────────────────────
+        async def _meetings(db: AsyncSession):
+            return (
+                await db.execute(
+                    select(
+                        CalendarEvent,
+                        Contact.first_name.label("cf"),
+                        Contact.last_name.label("cl"),
+                    )
+                    .outerjoin(
+                        Contact,
+                        and_(
+                            CalendarEvent.related_to_type == "Contact",
+                            CalendarEvent.related_to_id == Contact.id,
+                        ),
+                    )
+                    .where(CalendarEvent.owner_id == uid)
+                    .order_by(CalendarEvent.start_time.desc())
+                    .limit(50)
+                )
+            ).all()
+
+        # ── Today's Leads (list) ─────────────────────────────────
+        async def _todays_leads(db: AsyncSession):
+            return (
+                await db.execute(
+                    select(Lead)
+                    .where(Lead.assigned_to == uid)
+                    .where(Lead.created_at >= today_start)
+                    .where(Lead.created_at <= today_end)
+                    .order_by(Lead.created_at.desc())
+                    .limit(50)
+                )
+            ).scalars().all()
+
+        # ── Deals Closing This Month ─────────────────────────────
+        async def _closing(db: AsyncSession):
+            return (
+                await db.execute(
+                    select(Deal, User.name.label("owner_name"))
+                    .outerjoin(User, Deal.owner_id == User.id)
+                    .where(Deal.owner_id == uid)
+                    .where(Deal.closing_date >= month_start)
+                    .where(Deal.closing_date < next_month)
+                    .where(Deal.stage.notin_(CLOSED_STAGES))
+                    .order_by(Deal.closing_date.asc())
+                    .limit(50)
+                )
+            ).all()
+
+        # ── Pipeline Deals By Stage (funnel) ─────────────────────
+        async def _pipeline(db: AsyncSession):
+            return (
+                await db.execute(
+                    select(
+                        Deal.stage,
+                        func.count().label("count"),
+                        func.coalesce(func.sum(Deal.value), 0).label("value"),
+                    )
+                    .where(Deal.owner_id == uid)
+                    .where(Deal.stage.notin_(CLOSED_STAGES))
+                    .group_by(Deal.stage)
+                )
+            ).all()
+
+        # ── Sales Users Targets (scoped) ─────────────────────────
+        scope = scoped_user_subquery(user)
+
+        async def _targets(db: AsyncSession):
+            target_stmt = (
+                select(User.id, User.name, User.monthly_target)
+                .where(User.is_active.is_(True))
+                .where(User.monthly_target.isnot(None))
+                .where(User.monthly_target > 0)
+            )
+            if scope is not None:
+                target_stmt = target_stmt.where(User.id.in_(scope))
+            return (await db.execute(target_stmt)).all()
+
+        # Current month sales per user
+        async def _monthly_sales(db: AsyncSession):
+            sales_stmt = (
+                select(
+                    SalesEntry.salesperson_id,
+                    func.coalesce(func.sum(SalesEntry.amount), 0).label("total"),
+                )
+                .where(SalesEntry.sale_date >= month_start)
+                .where(SalesEntry.sale_date < next_month)
+                .group_by(SalesEntry.salesperson_id)
             )
-        ).scalars().all()
+            if scope is not None:
+                sales_stmt = sales_stmt.where(
+                    SalesEntry.salesperson_id.in_(scope)
+                )
+            return {
+                str(r[0]): float(r[1])
+                for r in (await db.execute(sales_stmt)).all()
+                if r[0] is not None
+            }
+
+        (
+            my_open_deals,
+            my_untouched_deals,
+            my_calls_today,
+            my_leads,
+            task_rows,
+            meeting_rows,
+            todays_lead_rows,
+            closing_rows,
+            pipeline_rows,
+            target_users,
+            monthly_sales_map,
+        ) = await self._gather(
+            _open_deals,
+            _untouched_deals,
+            _calls_today,
+            _leads,
+            _tasks,
+            _meetings,
+            _todays_leads,
+            _closing,
+            _pipeline,
+            _targets,
+            _monthly_sales,
+        )
 
         my_open_tasks = [
             {
@@ -967,29 +1021,6 @@ class DashboardService:
             for t in task_rows
         ]
 
-        # ── My Meetings (list) ───────────────────────────────────
-        from app.models.contact import Contact
-
-        meeting_rows = (
-            await self.db.execute(
-                select(
-                    CalendarEvent,
-                    Contact.first_name.label("cf"),
-                    Contact.last_name.label("cl"),
-                )
-                .outerjoin(
-                    Contact,
-                    and_(
-                        CalendarEvent.related_to_type == "Contact",
-                        CalendarEvent.related_to_id == Contact.id,
-                    ),
-                )
-                .where(CalendarEvent.owner_id == uid)
-                .order_by(CalendarEvent.start_time.desc())
-                .limit(50)
-            )
-        ).all()
-
         my_meetings = [
             {
                 "id": str(row[0].id),
@@ -1003,18 +1034,6 @@ class DashboardService:
             for row in meeting_rows
         ]
 
-        # ── Today's Leads (list) ─────────────────────────────────
-        todays_lead_rows = (
-            await self.db.execute(
-                select(Lead)
-                .where(Lead.assigned_to == uid)
-                .where(Lead.created_at >= today_start)
-                .where(Lead.created_at <= today_end)
-                .order_by(Lead.created_at.desc())
-                .limit(50)
-            )
-        ).scalars().all()
-
         todays_leads = [
             {
                 "id": str(l.id),
@@ -1030,20 +1049,6 @@ class DashboardService:
             for l in todays_lead_rows
         ]
 
-        # ── Deals Closing This Month ─────────────────────────────
-        closing_rows = (
-            await self.db.execute(
-                select(Deal, User.name.label("owner_name"))
-                .outerjoin(User, Deal.owner_id == User.id)
-                .where(Deal.owner_id == uid)
-                .where(Deal.closing_date >= month_start)
-                .where(Deal.closing_date < next_month)
-                .where(Deal.stage.notin_(["Closed Won", "Closed Lost"]))
-                .order_by(Deal.closing_date.asc())
-                .limit(50)
-            )
-        ).all()
-
         deals_closing = [
             {
                 "id": str(row[0].id),
@@ -1057,58 +1062,11 @@ class DashboardService:
             for row in closing_rows
         ]
 
-        # ── Pipeline Deals By Stage (funnel) ─────────────────────
-        pipeline_rows = (
-            await self.db.execute(
-                select(
-                    Deal.stage,
-                    func.count().label("count"),
-                    func.coalesce(func.sum(Deal.value), 0).label("value"),
-                )
-                .where(Deal.owner_id == uid)
-                .where(Deal.stage.notin_(["Closed Won", "Closed Lost"]))
-                .group_by(Deal.stage)
-            )
-        ).all()
-
         pipeline_by_stage = [
             {"stage": r.stage, "count": r.count, "value": float(r.value)}
             for r in pipeline_rows
         ]
 
-        # ── Sales Users Targets (scoped) ─────────────────────────
-        scoped_ids = await get_scoped_user_ids(user, self.db)
-
-        target_stmt = (
-            select(User.id, User.name, User.monthly_target)
-            .where(User.is_active.is_(True))
-            .where(User.monthly_target.isnot(None))
-            .where(User.monthly_target > 0)
-        )
-        if scoped_ids is not None:
-            target_stmt = target_stmt.where(User.id.in_(scoped_ids))
-        target_users = (await self.db.execute(target_stmt)).all()
-
-        # Current month sales per user
-        sales_stmt = (
-            select(
-                SalesEntry.salesperson_id,
-                func.coalesce(func.sum(SalesEntry.amount), 0).label("total"),
-            )
-            .where(SalesEntry.sale_date >= month_start)
-            .where(SalesEntry.sale_date < next_month)
-            .group_by(SalesEntry.salesperson_id)
-        )
-        if scoped_ids is not None:
-            sales_stmt = sales_stmt.where(
-                SalesEntry.salesperson_id.in_(scoped_ids)
-            )
-        monthly_sales_map = {
-            str(r[0]): float(r[1])
-            for r in (await self.db.execute(sales_stmt)).all()
-            if r[0] is not None
-        }
-
         sales_targets = sorted(
             [
                 {
@@ -28,8 +28,10 @@ from app.schemas.deal_schema import (
     DealOut,
     DealUpdate,
 )
+from app.services.dashboard_rollup_service import DashboardRollupService, deal_snapshot
 from app.utils.activity_logger import compute_changes, log_activity, model_to_dict
-from app.utils.scoping import enforce_scope, get_scoped_user_ids
+from app.utils.cache import DASHBOARD_CACHE, payload_cache
+from app.utils.scoping import enforce_scope, scope_filter
 
 
 class DealService:
@@ -52,6 +54,7 @@ class DealService:
         """
         self.db = db
         self.deal_repo = DealRepository(db)
+        self.rollups = DashboardRollupService(db)
 
     async def list_deals(
         self,
@@ -61,6 +64,8 @@ class DealService:
         stage: Optional[str] = None,
         account_id: Optional[str] = None,
         owner: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count: str = "exact",
     ) -> Dict[str, Any]:
         """
         List deals with filtering, pagination, and access control.
@@ -72,6 +77,8 @@ class DealService:
             stage: Optional filter by stage
             account_id: Optional filter by account
             owner: Optional filter by owner
+            cursor: Keyset cursor (``nextCursor`` of the previous page)
+            count: Total count mode ("exact", "estimated" or "none")
 
         Returns:
             Dictionary with 'data' and 'pagination'
@@ -86,13 +93,13 @@ class DealService:
             filters.append(Deal.owner_id == owner)
 
         # Apply access control scoping
-        scoped_ids = await get_scoped_user_ids(user, self.db)
-        if scoped_ids is not None:
-            filters.append(Deal.owner_id.in_(scoped_ids))
+        scope = scope_filter(Deal.owner_id, user)
+        if scope is not None:
+            filters.append(scope)
 
         # Get data from repository
         result = await self.deal_repo.get_with_names(
-            page=page, limit=limit, filters=filters or None
+            page=page, limit=limit, cursor=cursor, count=count, filters=filters or None
         )
 
         # Transform data
@@ -117,9 +124,9 @@ class DealService:
             Pipeline statistics
         """
         filters = []
-        scoped_ids = await get_scoped_user_ids(user, self.db)
-        if scoped_ids is not None:
-            filters.append(Deal.owner_id.in_(scoped_ids))
+        scope = scope_filter(Deal.owner_id, user)
+        if scope is not None:
+            filters.append(scope)
 
         return await self.deal_repo.get_pipeline_stats(filters=filters or None)
 
@@ -166,9 +173,11 @@ class DealService:
 
         # Create deal
         deal = await self.deal_repo.create(data)
+        await self.rollups.record_pipeline(after=[deal_snapshot(deal)])
 
         # Log activity
         await log_activity(self.db, user, "create", "deal", str(deal.id), deal.title)
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         return DealOut.model_validate(deal).model_dump(by_alias=True)
 
@@ -188,7 +197,7 @@ class DealService:
             NotFoundException: If deal not found
         """
         # Get existing deal
-        old = await self.deal_repo.get_by_id(deal_id)
+        old = await self.deal_repo.get_by_id(deal_id, for_update=True)
         if not old:
             raise NotFoundException("Deal not found")
 
@@ -197,13 +206,16 @@ class DealService:
 
         # Track changes for audit log
         old_data = model_to_dict(old)
+        before = deal_snapshot(old)
 
         # Update deal
         deal = await self.deal_repo.update(deal_id, deal_data.model_dump(exclude_unset=True))
+        await self.rollups.record_pipeline(before=[before], after=[deal_snapshot(deal)])
 
         # Log activity with changes
         changes = compute_changes(old_data, model_to_dict(deal))
         await log_activity(self.db, user, "update", "deal", str(deal.id), deal.title, changes)
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         return DealOut.model_validate(deal).model_dump(by_alias=True)
 
@@ -222,7 +234,7 @@ class DealService:
             NotFoundException: If deal not found
         """
         # Get existing deal
-        deal = await self.deal_repo.get_by_id(deal_id)
+        deal = await self.deal_repo.get_by_id(deal_id, for_update=True)
         if not deal:
             raise NotFoundException("Deal not found")
 
@@ -231,12 +243,15 @@ class DealService:
 
         # Store name before deletion
         deal_name = deal.title
+        before = deal_snapshot(deal)
 
         # Delete deal
         await self.deal_repo.delete(deal_id)
+        await self.rollups.record_pipeline(before=[before])
 
         # Log activity
         await log_activity(self.db, user, "delete", "deal", deal_id, deal_name)
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         return True
 
@@ -293,6 +308,7 @@ class DealService:
 
         # Create deal
         deal = await self.deal_repo.create(data)
+        await self.rollups.record_pipeline(after=[deal_snapshot(deal)])
 
         # Create line items
         for item in line_items:
@@ -301,6 +317,7 @@ class DealService:
         await self.db.flush()
 
         await log_activity(self.db, user, "create", "deal", str(deal.id), deal.title)
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         # Return with line items
         result = await self.deal_repo.get_with_line_items(deal.id)
@@ -332,16 +349,18 @@ class DealService:
         Raises:
             NotFoundException: If deal not found
         """
-        old = await self.deal_repo.get_by_id(deal_id)
+        old = await self.deal_repo.get_by_id(deal_id, for_update=True)
         if not old:
             raise NotFoundException("Deal not found")
 
         await enforce_scope(old, "owner_id", user, self.db, resource_name="deal")
         old_data = model_to_dict(old)
+        before = deal_snapshot(old)
 
         # Update deal (exclude line items)
         update_data = deal_data.model_dump(exclude_unset=True, exclude={"line_items"})
         deal = await self.deal_repo.update(deal_id, update_data)
+        await self.rollups.record_pipeline(before=[before], after=[deal_snapshot(deal)])
 
         # Replace line items if provided
         if deal_data.line_items is not None:
@@ -353,6 +372,7 @@ class DealService:
 
         changes = compute_changes(old_data, model_to_dict(deal))
         await log_activity(self.db, user, "update", "deal", str(deal.id), deal.title, changes)
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         # Notify Product Managers when deal moves to Negotiation stage
         if update_data.get("stage") == "Negotiation":
@@ -451,9 +471,9 @@ class DealService:
         owner: Optional[str] = None,
     ) -> Dict[str, Any]:
         filters = []
-        scoped_ids = await get_scoped_user_ids(user, self.db)
-        if scoped_ids is not None:
-            filters.append(Deal.owner_id.in_(scoped_ids))
+        scope = scope_filter(Deal.owner_id, user)
+        if scope is not None:
+            filters.append(scope)
         if owner:
             filters.append(Deal.owner_id == owner)
         if search:
@@ -480,21 +500,24 @@ class DealService:
 
     async def get_stage_counts(self, user: User) -> Dict[str, int]:
         filters = []
-        scoped_ids = await get_scoped_user_ids(user, self.db)
-        if scoped_ids is not None:
-            filters.append(Deal.owner_id.in_(scoped_ids))
+        scope = scope_filter(Deal.owner_id, user)
+        if scope is not None:
+            filters.append(scope)
         return await self.deal_repo.get_stage_counts(filters=filters or None)
 
     async def update_stage(self, deal_id: str, new_stage: str, user: User) -> Dict[str, Any]:
-        old = await self.deal_repo.get_by_id(deal_id)
+        old = await self.deal_repo.get_by_id(deal_id, for_update=True)
         if not old:
             raise NotFoundException("Deal not found")
         await enforce_scope(old, "owner_id", user, self.db, resource_name="deal")
 
         old_data = model_to_dict(old)
+        before = deal_snapshot(old)
         deal = await self.deal_repo.update(deal_id, {"stage": new_stage})
+        await self.rollups.record_pipeline(before=[before], after=[deal_snapshot(deal)])
         changes = compute_changes(old_data, model_to_dict(deal))
         await log_activity(self.db, user, "update", "deal", str(deal.id), deal.title, changes)
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         if new_stage == "Negotiation":
             await self._notify_product_managers_stage_change(deal, "Deal")
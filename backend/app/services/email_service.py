@@ -43,6 +43,8 @@ class EmailService:
         limit: int,
         user: User,
         status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count: str = "exact",
     ) -> Dict[str, Any]:
         """
         List emails with filtering and pagination.
@@ -52,6 +54,8 @@ class EmailService:
             limit: Items per page
             user: Current user
             status: Optional status filter
+            cursor: Keyset cursor (``nextCursor`` of the previous page)
+            count: Total count mode ("exact", "estimated" or "none")
 
         Returns:
             Dictionary with data and pagination info
@@ -65,7 +69,7 @@ class EmailService:
             filters.append(Email.owner_id == user.id)
 
         result = await self.email_repo.get_with_names(
-            page=page, limit=limit, filters=filters or None
+            page=page, limit=limit, cursor=cursor, count=count, filters=filters or None
         )
 
         # Transform data to include related names
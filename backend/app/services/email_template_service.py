@@ -7,7 +7,7 @@ Follows SOLID principles and service layer architecture.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -44,6 +44,8 @@ class EmailTemplateService:
         page: int,
         limit: int,
         user: User,
+        cursor: Optional[str] = None,
+        count: str = "exact",
     ) -> Dict[str, Any]:
         """
         List email templates with filtering and pagination.
@@ -52,6 +54,8 @@ class EmailTemplateService:
             page: Page number
             limit: Items per page
             user: Current user
+            cursor: Keyset cursor (``nextCursor`` of the previous page)
+            count: Total count mode ("exact", "estimated" or "none")
 
         Returns:
             Dictionary with data and pagination info
@@ -63,7 +67,7 @@ class EmailTemplateService:
             filters.append(EmailTemplate.owner_id == user.id)
 
         result = await self.template_repo.get_with_owner(
-            page=page, limit=limit, filters=filters or None
+            page=page, limit=limit, cursor=cursor, count=count, filters=filters or None
         )
 
         # Transform data to include owner name
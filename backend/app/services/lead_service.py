@@ -28,8 +28,14 @@ from app.schemas.lead_schema import (
     LeadOut,
     LeadUpdate,
 )
+from app.services.dashboard_rollup_service import (
+    DashboardRollupService,
+    lead_snapshot,
+    sales_snapshot,
+)
 from app.utils.activity_logger import compute_changes, log_activity, model_to_dict
-from app.utils.scoping import enforce_scope, get_scoped_user_ids
+from app.utils.cache import DASHBOARD_CACHE, payload_cache
+from app.utils.scoping import enforce_scope, scope_filter
 
 
 class LeadService:
@@ -52,6 +58,7 @@ class LeadService:
         """
         self.db = db
         self.lead_repo = LeadRepository(db)
+        self.rollups = DashboardRollupService(db)
 
     async def list_leads(
         self,
@@ -62,6 +69,8 @@ class LeadService:
         priority: Optional[str] = None,
         assigned_to: Optional[str] = None,
         source: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count: str = "exact",
     ) -> Dict[str, Any]:
         """
         List leads with filtering, pagination, and access control.
@@ -74,6 +83,8 @@ class LeadService:
             priority: Optional filter by priority
             assigned_to: Optional filter by assigned user
             source: Optional filter by source
+            cursor: Keyset cursor (``nextCursor`` of the previous page)
+            count: Total count mode ("exact", "estimated" or "none")
 
         Returns:
             Dictionary with 'data' and 'pagination'
@@ -90,13 +101,13 @@ class LeadService:
             filters.append(Lead.source == source)
 
         # Apply access control scoping
-        scoped_ids = await get_scoped_user_ids(user, self.db)
-        if scoped_ids is not None:
-            filters.append(Lead.assigned_to.in_(scoped_ids))
+        scope = scope_filter(Lead.assigned_to, user)
+        if scope is not None:
+            filters.append(scope)
 
         # Get data from repository
         result = await self.lead_repo.get_with_assigned(
-            page=page, limit=limit, filters=filters or None
+            page=page, limit=limit, cursor=cursor, count=count, filters=filters or None
         )
 
         # Transform data
@@ -119,9 +130,9 @@ class LeadService:
             Lead statistics
         """
         filters = []
-        scoped_ids = await get_scoped_user_ids(user, self.db)
-        if scoped_ids is not None:
-            filters.append(Lead.assigned_to.in_(scoped_ids))
+        scope = scope_filter(Lead.assigned_to, user)
+        if scope is not None:
+            filters.append(scope)
 
         return await self.lead_repo.get_stats(filters=filters or None)
 
@@ -168,9 +179,11 @@ class LeadService:
 
         # Create lead
         lead = await self.lead_repo.create(data)
+        await self.rollups.record_pipeline(after=[lead_snapshot(lead)])
 
         # Log activity
         await log_activity(self.db, user, "create", "lead", str(lead.id), lead.company_name)
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         return LeadOut.model_validate(lead).model_dump(by_alias=True)
 
@@ -190,7 +203,7 @@ class LeadService:
             NotFoundException: If lead not found
         """
         # Get existing lead
-        old = await self.lead_repo.get_by_id(lead_id)
+        old = await self.lead_repo.get_by_id(lead_id, for_update=True)
         if not old:
             raise NotFoundException("Lead not found")
 
@@ -199,13 +212,16 @@ class LeadService:
 
         # Track changes for audit log
         old_data = model_to_dict(old)
+        before = lead_snapshot(old)
 
         # Update lead
         lead = await self.lead_repo.update(lead_id, lead_data.model_dump(exclude_unset=True))
+        await self.rollups.record_pipeline(before=[before], after=[lead_snapshot(lead)])
 
         # Log activity with changes
         changes = compute_changes(old_data, model_to_dict(lead))
         await log_activity(self.db, user, "update", "lead", str(lead.id), lead.company_name, changes)
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         return LeadOut.model_validate(lead).model_dump(by_alias=True)
 
@@ -224,7 +240,7 @@ class LeadService:
             NotFoundException: If lead not found
         """
         # Get existing lead
-        lead = await self.lead_repo.get_by_id(lead_id)
+        lead = await self.lead_repo.get_by_id(lead_id, for_update=True)
         if not lead:
             raise NotFoundException("Lead not found")
 
@@ -233,12 +249,15 @@ class LeadService:
 
         # Store company name before deletion
         company_name = lead.company_name
+        before = lead_snapshot(lead)
 
         # Delete lead
         await self.lead_repo.delete(lead_id)
+        await self.rollups.record_pipeline(before=[before])
 
         # Log activity
         await log_activity(self.db, user, "delete", "lead", lead_id, company_name)
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         return True
 
@@ -259,19 +278,22 @@ class LeadService:
         Raises:
             NotFoundException: If lead not found
         """
-        old = await self.lead_repo.get_by_id(lead_id)
+        old = await self.lead_repo.get_by_id(lead_id, for_update=True)
         if not old:
             raise NotFoundException("Lead not found")
 
         await enforce_scope(old, "assigned_to", user, self.db, resource_name="lead")
         old_data = model_to_dict(old)
+        before = lead_snapshot(old)
         update_data = lead_data.model_dump(exclude_unset=True)
 
         lead = await self.lead_repo.update(lead_id, update_data)
+        await self.rollups.record_pipeline(before=[before], after=[lead_snapshot(lead)])
         changes = compute_changes(old_data, model_to_dict(lead))
         await log_activity(
             self.db, user, "update", "lead", str(lead.id), lead.company_name, changes
         )
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         # Notify Product Managers when lead moves to Negotiation stage
         if update_data.get("stage") == "Negotiation":
@@ -297,7 +319,7 @@ class LeadService:
             NotFoundException: If lead not found
             BadRequestException: If lead already converted
         """
-        lead = await self.lead_repo.get_by_id(lead_id)
+        lead = await self.lead_repo.get_by_id(lead_id, for_update=True)
         if not lead:
             raise NotFoundException("Lead not found")
 
@@ -317,15 +339,19 @@ class LeadService:
             "sale_date": convert_data.sale_date,
         }
         sale = await sales_repo.create(sale_data)
+        await self.rollups.record_sales(after=[sales_snapshot(sale)])
 
         # Update lead
-        await self.lead_repo.update(
+        before = lead_snapshot(lead)
+        lead = await self.lead_repo.update(
             lead_id,
             {
                 "stage": "Closed Won",
                 "won_sale_id": sale.id,
             },
         )
+        await self.rollups.record_pipeline(before=[before], after=[lead_snapshot(lead)])
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         # Add activity
         await self.lead_repo.create_activity(
@@ -426,9 +452,9 @@ class LeadService:
         source: Optional[str] = None,
     ) -> Dict[str, Any]:
         filters = []
-        scoped_ids = await get_scoped_user_ids(user, self.db)
-        if scoped_ids is not None:
-            filters.append(Lead.assigned_to.in_(scoped_ids))
+        scope = scope_filter(Lead.assigned_to, user)
+        if scope is not None:
+            filters.append(scope)
         if assigned_to:
             filters.append(Lead.assigned_to == assigned_to)
         if priority:
@@ -457,21 +483,24 @@ class LeadService:
 
     async def get_stage_counts(self, user: User) -> Dict[str, int]:
         filters = []
-        scoped_ids = await get_scoped_user_ids(user, self.db)
-        if scoped_ids is not None:
-            filters.append(Lead.assigned_to.in_(scoped_ids))
+        scope = scope_filter(Lead.assigned_to, user)
+        if scope is not None:
+            filters.append(scope)
         return await self.lead_repo.get_stage_counts(filters=filters or None)
 
     async def update_stage(self, lead_id: str, new_stage: str, user: User) -> Dict[str, Any]:
-        old = await self.lead_repo.get_by_id(lead_id)
+        old = await self.lead_repo.get_by_id(lead_id, for_update=True)
         if not old:
             raise NotFoundException("Lead not found")
         await enforce_scope(old, "assigned_to", user, self.db, resource_name="lead")
 
         old_data = model_to_dict(old)
+        before = lead_snapshot(old)
         lead = await self.lead_repo.update(lead_id, {"stage": new_stage})
+        await self.rollups.record_pipeline(before=[before], after=[lead_snapshot(lead)])
         changes = compute_changes(old_data, model_to_dict(lead))
         await log_activity(self.db, user, "update", "lead", str(lead.id), lead.company_name, changes)
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         if new_stage == "Negotiation":
             await self._notify_product_managers_stage_change(lead, "Lead")
@@ -15,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.exceptions import BadRequestException, NotFoundException
 from app.models.user import User
+from app.utils.cache import DROPDOWN_CACHE, payload_cache
 
 # Master data table configs — entity name -> table name
 ENTITY_MAP = {
@@ -315,6 +316,7 @@ class MasterDataService:
                 },
             )
             row = result.mappings().first()
+            payload_cache.invalidate_after_commit(self.db, DROPDOWN_CACHE)
             return self._convert_row(row)
 
         # Handle regular entities
@@ -421,6 +423,7 @@ class MasterDataService:
             row = result.mappings().first()
             if not row:
                 raise NotFoundException("Item not found")
+            payload_cache.invalidate_after_commit(self.db, DROPDOWN_CACHE)
             return self._convert_row(row)
 
         # Handle regular entities
@@ -475,6 +478,7 @@ class MasterDataService:
             )
             if result.rowcount == 0:
                 raise NotFoundException("Item not found")
+            payload_cache.invalidate_after_commit(self.db, DROPDOWN_CACHE)
             return True
 
         # Handle regular entities
@@ -24,6 +24,7 @@ from app.schemas.partner_schema import (
     PartnerUpdate,
 )
 from app.utils.activity_logger import compute_changes, log_activity, model_to_dict
+from app.utils.cache import DASHBOARD_CACHE, payload_cache
 from app.utils.scoping import enforce_scope, get_scoped_user_ids
 
 
@@ -158,6 +159,8 @@ class PartnerService:
         tier: Optional[str] = None,
         city: Optional[str] = None,
         assigned_to: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count: str = "exact",
     ) -> Dict[str, Any]:
         """
         List partners with filtering and pagination.
@@ -170,6 +173,8 @@ class PartnerService:
             tier: Filter by tier
             city: Filter by city
             assigned_to: Filter by assigned user
+            cursor: Keyset cursor (``nextCursor`` of the previous page)
+            count: Total count mode ("exact", "estimated" or "none")
 
         Returns:
             Dictionary with data and pagination info
@@ -190,7 +195,7 @@ class PartnerService:
             filters.append(Partner.assigned_to.in_(scoped_ids))
 
         result = await self.partner_repo.get_with_assigned(
-            page=page, limit=limit, filters=filters or None
+            page=page, limit=limit, cursor=cursor, count=count, filters=filters or None
         )
 
         # Transform data to include assigned_to name
@@ -304,6 +309,7 @@ class PartnerService:
         await log_activity(
             self.db, user, "create", "partner", str(partner.id), partner.company_name
         )
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         return PartnerOut.model_validate(partner).model_dump(by_alias=True)
 
@@ -349,6 +355,7 @@ class PartnerService:
             partner.company_name,
             changes,
         )
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         return PartnerOut.model_validate(partner).model_dump(by_alias=True)
 
@@ -383,6 +390,7 @@ class PartnerService:
         await self.partner_repo.delete(partner_id)
 
         await log_activity(self.db, user, "delete", "partner", partner_id, partner_name)
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         return True
 
@@ -436,5 +444,6 @@ class PartnerService:
         await log_activity(
             self.db, user, action, "partner", partner_id, partner.company_name, changes
         )
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         return PartnerOut.model_validate(updated).model_dump(by_alias=True)
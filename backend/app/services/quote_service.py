@@ -7,12 +7,19 @@ Follows SOLID principles and service layer architecture.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import re
+import time
+from datetime import date, datetime, timezone
+from functools import partial
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.database import async_session
 from app.exceptions import NotFoundException
 from app.models.partner import Partner
 from app.models.product import Product
@@ -29,9 +36,56 @@ from app.schemas.quote_schema import (
     QuoteOut,
     QuoteUpdate,
 )
+from app.utils.pagination import Keyset, count_rows
+from app.utils.pdf_generator import quote_pdf_fingerprint
+from app.utils.pdf_jobs import pdf_jobs, render_quote_pdf
+from app.utils.storage import (
+    delete_files,
+    file_id_from_url,
+    get_file,
+    iter_file,
+    upload_file,
+)
+from app.utils.zip_stream import ZipStreamWriter
 
 logger = logging.getLogger(__name__)
 
+# quotes.pdf_status values
+PDF_PENDING = "pending"
+PDF_READY = "ready"
+PDF_FAILED = "failed"
+
+_PDF_POLL_SECONDS = 0.5
+
+# Sort key of the paginated quote list (newest first)
+LIST_KEYSET = Keyset(Quote.created_at, Quote.id)
+
+_ORPHANED_PDFS_SQL = """
+SELECT f.id FROM file_uploads f
+WHERE f.filename LIKE 'quotes/%'
+  AND f.created_at < NOW() - make_interval(secs => :grace)
+  AND NOT EXISTS (
+      SELECT 1 FROM quotes q WHERE q.pdf_url = '/api/uploads/files/' || f.id
+  )
+"""
+
+
+
+def _archive_name(quote: Quote) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", quote.quote_number or str(quote.id)) + ".pdf"
+
+
+async def _load_or_render_pdf(
+    stored_url: Optional[str], quote_data: Dict[str, Any]
+) -> Tuple[bytes, bool]:
+    """Read a current stored PDF, or render one. Returns (bytes, rendered)."""
+    file_id = file_id_from_url(stored_url)
+    if file_id is not None:
+        record = await get_file(file_id)
+        if record:
+            return b"".join([chunk async for chunk in iter_file(record)]), False
+    return await render_quote_pdf(quote_data), True
+
 
 class QuoteService:
     """
@@ -111,24 +165,100 @@ class QuoteService:
         )
         quote.terms = compiled
 
-    async def _generate_and_store_pdf(
-        self, quote: Quote, quote_data: Dict[str, Any]
+    async def _render_and_store_pdf(
+        self, quote: Quote, force: bool = False
     ) -> Optional[str]:
-        """Generate a PDF for a quote and store it locally. Returns the URL."""
-        try:
-            from app.utils.pdf_generator import generate_quote_pdf
-            from app.utils.storage import upload_file
+        """
+        Render a quote's PDF on the render pool, store it and record the outcome.
 
-            pdf_bytes = generate_quote_pdf(quote_data)
-            file_name = f"quotes/quote-{quote.id}.pdf"
-            pdf_url = await upload_file(pdf_bytes, file_name, "application/pdf")
-            quote.pdf_url = pdf_url
-            await self.db.flush()
-            return pdf_url
+        Skips rendering when the stored PDF was made from the same inputs
+        (``pdf_hash``) unless ``force`` is set.  Sets ``pdf_status`` to ready
+        (with ``pdf_url``) or failed; a replaced PDF file is deleted once the
+        transaction commits.
+
+        Returns:
+            PDF URL, or None if rendering failed
+        """
+        try:
+            quote_data = await self._get_quote_with_items(str(quote.id))
+            fingerprint = quote_pdf_fingerprint(quote_data)
+            if not force and quote.pdf_url and quote.pdf_hash == fingerprint:
+                quote.pdf_status = PDF_READY
+                await self.db.flush()
+                return quote.pdf_url
+
+            pdf_bytes = await render_quote_pdf(quote_data)
+            return await self._store_pdf(quote, pdf_bytes, fingerprint)
         except Exception:
             logger.exception("Failed to generate PDF for quote %s", quote.id)
+            quote.pdf_status = PDF_FAILED
+            await self.db.flush()
             return None
 
+    async def _store_pdf(self, quote: Quote, pdf_bytes: bytes, fingerprint: str) -> str:
+        """Store rendered PDF bytes as the quote's current PDF. Returns the URL."""
+        file_name = f"quotes/quote-{quote.id}.pdf"
+        pdf_url = await upload_file(pdf_bytes, file_name, "application/pdf")
+        self._release_pdf_after_commit(quote.pdf_url)
+        quote.pdf_url = pdf_url
+        quote.pdf_hash = fingerprint
+        quote.pdf_status = PDF_READY
+        await self.db.flush()
+        return pdf_url
+
+    def _release_pdf_after_commit(self, pdf_url: Optional[str]) -> None:
+        """Delete a stored PDF once the transaction that dropped it commits."""
+        file_id = file_id_from_url(pdf_url)
+        if file_id is not None:
+            pdf_jobs.schedule_after_commit(
+                self.db, f"release:{file_id}", partial(delete_files, [file_id])
+            )
+
+    def _schedule_pdf(self, quote: Quote) -> None:
+        """Mark the quote's PDF pending and render it once this transaction commits."""
+        quote.pdf_status = PDF_PENDING
+        quote_id = str(quote.id)
+        pdf_jobs.schedule_after_commit(
+            self.db, quote_id, partial(QuoteService.render_pdf_job, quote_id)
+        )
+
+    @staticmethod
+    async def render_pdf_job(quote_id: str) -> None:
+        """Background job: render and store a quote's PDF in its own session."""
+        async with async_session() as session:
+            service = QuoteService(session)
+            quote = await service.quote_repo.get_by_id(quote_id)
+            if not quote:  # deleted before the job ran
+                return
+            await service._render_and_store_pdf(quote)
+            await session.commit()
+
+    async def _wait_for_pdf(self, quote: Quote) -> None:
+        """
+        Wait up to PDF_RENDER_WAIT_SECONDS for a pending render to finish.
+
+        Awaits the job directly when it runs in this process, otherwise polls
+        the row.  A pending quote with no local job that has not been touched
+        for the whole wait window is treated as lost (e.g. the worker that
+        owned it restarted) and returns straight away.
+        """
+        key = str(quote.id)
+        wait = settings.PDF_RENDER_WAIT_SECONDS
+        deadline = time.monotonic() + wait
+        while quote.pdf_status == PDF_PENDING:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if pdf_jobs.is_running(key):
+                await pdf_jobs.wait(key, remaining)
+            elif quote.updated_at and (
+                datetime.now(timezone.utc) - quote.updated_at
+            ).total_seconds() > wait:
+                return
+            else:
+                await asyncio.sleep(min(_PDF_POLL_SECONDS, remaining))
+            await self.db.refresh(quote, ["pdf_url", "pdf_status", "updated_at"])
+
     async def _get_quote_with_items(self, quote_id: str) -> Optional[Dict[str, Any]]:
         """Fetch quote with partner name, line items, and selected term IDs."""
         stmt = (
@@ -186,6 +316,8 @@ class QuoteService:
         status: Optional[str] = None,
         lead_id: Optional[str] = None,
         deal_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count: str = "exact",
     ) -> Dict[str, Any]:
         """
         List quotes with filtering and pagination.
@@ -196,6 +328,8 @@ class QuoteService:
             status: Filter by status
             lead_id: Filter by lead ID
             deal_id: Filter by deal ID
+            cursor: Keyset cursor (``nextCursor`` of the previous page)
+            count: Total count mode ("exact", "estimated" or "none")
 
         Returns:
             Dictionary with data and pagination info
@@ -218,12 +352,10 @@ class QuoteService:
                 stmt = stmt.where(f)
                 count_stmt = count_stmt.where(f)
 
-        stmt = stmt.order_by(Quote.created_at.desc())
-        offset = (page - 1) * limit
-        stmt = stmt.offset(offset).limit(limit)
+        stmt = LIST_KEYSET.paginate(stmt, page, limit, cursor)
 
         result = await self.db.execute(stmt)
-        rows = result.all()
+        rows, next_cursor = LIST_KEYSET.split(result.all(), limit)
 
         data = []
         for row in rows:
@@ -231,9 +363,8 @@ class QuoteService:
             out["partnerName"] = row[1]
             data.append(out)
 
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-        total_pages = (total + limit - 1) // limit
+        total, estimated = await count_rows(self.db, count_stmt, count)
+        total_pages = (total + limit - 1) // limit if total is not None else None
 
         return {
             "data": data,
@@ -242,6 +373,8 @@ class QuoteService:
                 "limit": limit,
                 "total": total,
                 "totalPages": total_pages,
+                "nextCursor": next_cursor,
+                "totalEstimated": estimated,
             },
         }
 
@@ -302,17 +435,11 @@ class QuoteService:
         # Save selected T&C
         await self._save_selected_terms(quote, quote_data.selected_term_ids)
 
+        # Render the PDF in the background once the quote is committed
+        self._schedule_pdf(quote)
         await self.db.flush()
 
-        result = await self._get_quote_with_items(str(quote.id))
-
-        # Auto-generate PDF
-        if result:
-            pdf_url = await self._generate_and_store_pdf(quote, result)
-            if pdf_url:
-                result["pdfUrl"] = pdf_url
-
-        return result
+        return await self._get_quote_with_items(str(quote.id))
 
     async def update_quote(
         self,
@@ -376,14 +503,11 @@ class QuoteService:
         await self.db.flush()
         result = await self._get_quote_with_items(quote_id)
 
-        # Regenerate PDF when content changes
-        if result and (
-            quote_data.line_items is not None
-            or quote_data.selected_term_ids is not None
-        ):
-            pdf_url = await self._generate_and_store_pdf(quote, result)
-            if pdf_url:
-                result["pdfUrl"] = pdf_url
+        # Re-render the PDF in the background when anything it shows changed
+        if result and quote_pdf_fingerprint(result) != quote.pdf_hash:
+            self._schedule_pdf(quote)
+            await self.db.flush()
+            result["pdfStatus"] = PDF_PENDING
 
         return result
 
@@ -400,9 +524,11 @@ class QuoteService:
         Raises:
             NotFoundException: If quote not found
         """
-        deleted = await self.quote_repo.delete(quote_id)
-        if not deleted:
+        quote = await self.quote_repo.get_by_id(quote_id)
+        if not quote:
             raise NotFoundException("Quote not found")
+        self._release_pdf_after_commit(quote.pdf_url)
+        await self.quote_repo.delete(quote_id)
         return True
 
     async def get_or_regenerate_pdf(
@@ -411,6 +537,11 @@ class QuoteService:
         """
         Get or regenerate the PDF for a quote.
 
+        A pending background render is awaited (up to
+        PDF_RENDER_WAIT_SECONDS).  The stored PDF is returned only while
+        its fingerprint still matches the quote; a stale, failed, missing
+        or lost render is redone in this request.
+
         Args:
             quote_id: Quote ID
             regenerate: Whether to force regeneration
@@ -425,15 +556,138 @@ class QuoteService:
         if not quote:
             raise NotFoundException("Quote not found")
 
-        if not regenerate and quote.pdf_url:
-            return quote.pdf_url
-
-        quote_data = await self._get_quote_with_items(quote_id)
-        if not quote_data:
-            raise NotFoundException("Quote not found")
+        if not regenerate and quote.pdf_status == PDF_PENDING:
+            await self._wait_for_pdf(quote)
 
-        pdf_url = await self._generate_and_store_pdf(quote, quote_data)
+        pdf_url = await self._render_and_store_pdf(quote, force=regenerate)
         if not pdf_url:
             raise NotFoundException("Failed to generate PDF")
 
         return pdf_url
+
+    async def collect_orphaned_pdfs(self, grace_seconds: int) -> int:
+        """
+        Delete stored quote PDFs that no quote points at any more.
+
+        Covers files left behind by renders whose transaction rolled back or
+        a worker that exited before releasing the old file.  Files newer than
+        ``grace_seconds`` are kept so in-flight renders are not touched.
+
+        Args:
+            grace_seconds: Minimum age of a file before it is reclaimed
+
+        Returns:
+            Number of files deleted
+        """
+        result = await self.db.execute(
+            text(_ORPHANED_PDFS_SQL), {"grace": grace_seconds}
+        )
+        return await delete_files(result.scalars().all())
+
+    # ---------------------------------------------------------------------------
+    # Bulk PDF Export
+    # ---------------------------------------------------------------------------
+
+    @staticmethod
+    async def export_pdf_archive(
+        partner_id: Optional[str] = None,
+        month: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a ZIP of the matching quotes' PDFs.
+
+        The response body is sent after the request's session is closed, so
+        this opens its own.
+
+        Args:
+            partner_id: Only quotes for this partner
+            month: Only quotes created in this month (YYYY-MM)
+            status: Only quotes with this status
+
+        Yields:
+            Consecutive chunks of the ZIP archive
+        """
+        filters = []
+        if partner_id:
+            filters.append(Quote.partner_id == partner_id)
+        if status:
+            filters.append(Quote.status == status)
+        if month:
+            year, mon = (int(part) for part in month.split("-"))
+            start = date(year, mon, 1)
+            end = date(year + mon // 12, mon % 12 + 1, 1)
+            filters.append(Quote.created_at >= start)
+            filters.append(Quote.created_at < end)
+
+        async with async_session() as session:
+            async for chunk in QuoteService(session)._stream_pdf_archive(filters):
+                yield chunk
+
+    async def _stream_pdf_archive(self, filters: List[Any]) -> AsyncIterator[bytes]:
+        """
+        Yield a ZIP archive of the matching quotes' PDFs as they become ready.
+
+        Stored PDFs whose fingerprint is current are copied as-is; the rest
+        are rendered on the render pool and stored for next time.  At most
+        ``2 * PDF_RENDER_WORKERS`` PDFs are loaded or rendering at once, so
+        memory stays bounded however many quotes match.  Quotes that fail to
+        render are listed in ``errors.txt`` at the end of the archive.
+        """
+        ids_stmt = select(Quote.id).where(*filters).order_by(Quote.created_at)
+        quote_ids = iter((await self.db.execute(ids_stmt)).scalars().all())
+        window = max(1, settings.PDF_RENDER_WORKERS) * 2
+
+        archive = ZipStreamWriter()
+        # Plain values, not the Quote: a rollback after a failed store expires
+        # every instance, and reading an expired attribute here would lazy-load
+        pending: Dict[asyncio.Task, Tuple[Any, str, str]] = {}
+        failed: List[str] = []
+        try:
+            while True:
+                # Keep the window full; DB reads stay on this task's session
+                while len(pending) < window:
+                    quote_id = next(quote_ids, None)
+                    if quote_id is None:
+                        break
+                    quote_data = await self._get_quote_with_items(str(quote_id))
+                    quote = await self.db.get(Quote, quote_id)
+                    if not quote_data or not quote:
+                        continue
+                    fingerprint = quote_pdf_fingerprint(quote_data)
+                    stored_url = quote.pdf_url if quote.pdf_hash == fingerprint else None
+                    task = asyncio.create_task(_load_or_render_pdf(stored_url, quote_data))
+                    pending[task] = (quote_id, _archive_name(quote), fingerprint)
+
+                if not pending:
+                    break
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    quote_id, name, fingerprint = pending.pop(task)
+                    try:
+                        pdf_bytes, rendered = task.result()
+                    except Exception:
+                        logger.exception("Failed to export PDF for quote %s", quote_id)
+                        failed.append(name)
+                        continue
+                    if rendered:
+                        try:
+                            # get() reloads the instance if a rollback expired it
+                            quote = await self.db.get(Quote, quote_id)
+                            await self._store_pdf(quote, pdf_bytes, fingerprint)
+                            await self.db.commit()
+                        except Exception:
+                            logger.exception("Failed to store PDF for quote %s", quote_id)
+                            await self.db.rollback()
+                    yield archive.add(name, pdf_bytes)
+
+            if failed:
+                yield archive.add(
+                    "errors.txt",
+                    ("Could not render:\n" + "\n".join(failed) + "\n").encode(),
+                )
+            yield archive.close()
+        finally:
+            for task in pending:
+                task.cancel()
+
@@ -22,8 +22,10 @@ from app.schemas.sales_entry_schema import (
     SalesEntryUpdate,
     SalesSummary,
 )
+from app.services.dashboard_rollup_service import DashboardRollupService, sales_snapshot
 from app.utils.activity_logger import compute_changes, log_activity, model_to_dict
-from app.utils.scoping import enforce_scope, get_scoped_user_ids
+from app.utils.cache import DASHBOARD_CACHE, payload_cache
+from app.utils.scoping import enforce_scope, scope_filter
 
 
 class SalesEntryService:
@@ -43,6 +45,7 @@ class SalesEntryService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.sales_entry_repo = SalesEntryRepository(db)
+        self.rollups = DashboardRollupService(db)
 
     async def list_sales_entries(
         self,
@@ -59,6 +62,8 @@ class SalesEntryService:
         vertical_id: Optional[str] = None,
         deal_id: Optional[str] = None,
         search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count: str = "exact",
     ) -> Dict[str, Any]:
         """
         List sales entries with filtering and pagination.
@@ -77,6 +82,8 @@ class SalesEntryService:
             vertical_id: Filter by vertical ID
             deal_id: Filter by deal ID
             search: Search by customer name
+            cursor: Keyset cursor (``nextCursor`` of the previous page)
+            count: Total count mode ("exact", "estimated" or "none")
 
         Returns:
             Dictionary with data and pagination info
@@ -105,12 +112,12 @@ class SalesEntryService:
             filters.append(SalesEntry.customer_name.ilike(f"%{search}%"))
 
         # Scope: non-admin users only see their own / team sales
-        scoped_ids = await get_scoped_user_ids(user, self.db)
-        if scoped_ids is not None:
-            filters.append(SalesEntry.salesperson_id.in_(scoped_ids))
+        scope = scope_filter(SalesEntry.salesperson_id, user)
+        if scope is not None:
+            filters.append(scope)
 
         result = await self.sales_entry_repo.get_with_names(
-            page=page, limit=limit, filters=filters or None
+            page=page, limit=limit, cursor=cursor, count=count, filters=filters or None
         )
 
         data = []
@@ -139,9 +146,9 @@ class SalesEntryService:
             Sales summary dictionary
         """
         filters = []
-        scoped_ids = await get_scoped_user_ids(user, self.db)
-        if scoped_ids is not None:
-            filters.append(SalesEntry.salesperson_id.in_(scoped_ids))
+        scope = scope_filter(SalesEntry.salesperson_id, user)
+        if scope is not None:
+            filters.append(scope)
 
         summary = await self.sales_entry_repo.get_summary(filters=filters or None)
         return SalesSummary(**summary).model_dump(by_alias=True)
@@ -157,9 +164,9 @@ class SalesEntryService:
             Sales breakdown dictionary
         """
         filters = []
-        scoped_ids = await get_scoped_user_ids(user, self.db)
-        if scoped_ids is not None:
-            filters.append(SalesEntry.salesperson_id.in_(scoped_ids))
+        scope = scope_filter(SalesEntry.salesperson_id, user)
+        if scope is not None:
+            filters.append(scope)
 
         return await self.sales_entry_repo.get_breakdown(filters=filters or None)
 
@@ -173,7 +180,7 @@ class SalesEntryService:
         Returns:
             Collections dictionary with pending, partial, and paid
         """
-        scoped_ids = await get_scoped_user_ids(user, self.db)
+        scope = scope_filter(SalesEntry.salesperson_id, user)
         stmt = (
             select(
                 SalesEntry.customer_name,
@@ -184,8 +191,8 @@ class SalesEntryService:
             .group_by(SalesEntry.customer_name, SalesEntry.payment_status)
             .order_by(SalesEntry.customer_name)
         )
-        if scoped_ids is not None:
-            stmt = stmt.where(SalesEntry.salesperson_id.in_(scoped_ids))
+        if scope is not None:
+            stmt = stmt.where(scope)
 
         result = await self.db.execute(stmt)
         rows = result.all()
@@ -230,9 +237,11 @@ class SalesEntryService:
             data["product_ids"] = [str(pid) for pid in data["product_ids"]]
 
         entry = await self.sales_entry_repo.create(data)
+        await self.rollups.record_sales(after=[sales_snapshot(entry)])
         await log_activity(
             self.db, user, "create", "sales_entry", str(entry.id), entry.customer_name
         )
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
         return SalesEntryOut.model_validate(entry).model_dump(by_alias=True)
 
     async def get_sales_entry_by_id(self, entry_id: str, user: User) -> Dict[str, Any]:
@@ -263,7 +272,7 @@ class SalesEntryService:
         Raises:
             NotFoundException: If sales entry not found
         """
-        old = await self.sales_entry_repo.get_by_id(entry_id)
+        old = await self.sales_entry_repo.get_by_id(entry_id, for_update=True)
         if not old:
             raise NotFoundException("Sales entry not found")
 
@@ -272,6 +281,7 @@ class SalesEntryService:
         )
 
         old_data = model_to_dict(old)
+        before = sales_snapshot(old)
         update_data = sales_entry_data.model_dump(exclude_unset=True)
 
         # Convert UUID objects to strings for JSONB column
@@ -281,6 +291,7 @@ class SalesEntryService:
             ]
 
         entry = await self.sales_entry_repo.update(entry_id, update_data)
+        await self.rollups.record_sales(before=[before], after=[sales_snapshot(entry)])
         changes = compute_changes(old_data, model_to_dict(entry))
         await log_activity(
             self.db,
@@ -291,6 +302,7 @@ class SalesEntryService:
             entry.customer_name,
             changes,
         )
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
         return SalesEntryOut.model_validate(entry).model_dump(by_alias=True)
 
     async def delete_sales_entry(self, entry_id: str, user: User) -> bool:
@@ -307,7 +319,7 @@ class SalesEntryService:
         Raises:
             NotFoundException: If sales entry not found
         """
-        entry = await self.sales_entry_repo.get_by_id(entry_id)
+        entry = await self.sales_entry_repo.get_by_id(entry_id, for_update=True)
         if not entry:
             raise NotFoundException("Sales entry not found")
 
@@ -316,6 +328,9 @@ class SalesEntryService:
         )
 
         entry_name = entry.customer_name
+        before = sales_snapshot(entry)
         await self.sales_entry_repo.delete(entry_id)
+        await self.rollups.record_sales(before=[before])
         await log_activity(self.db, user, "delete", "sales_entry", entry_id, entry_name)
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
         return True
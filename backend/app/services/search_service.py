@@ -0,0 +1,149 @@
+"""
+Search Service
+
+Global search across leads, deals, accounts, contacts and sales entries.
+
+Each entity type matches ``column ILIKE '%term%'`` on its name columns (the
+same columns the list endpoints' ``search`` filter uses), answered by the
+pg_trgm GIN indexes, and ranks its hits by ``word_similarity``.  The
+per-type queries are combined with UNION ALL, so one round trip returns the
+best hits over all types.  Every type is scoped to the user's team.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import func, literal, or_, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import BadRequestException
+from app.models.account import Account
+from app.models.contact import Contact
+from app.models.deal import Deal
+from app.models.lead import Lead
+from app.models.sales_entry import SalesEntry
+from app.models.user import User
+from app.utils.scoping import scope_filter
+
+MIN_TERM_LENGTH = 3  # pg_trgm indexes need at least one trigram
+
+
+@dataclass(frozen=True)
+class SearchTarget:
+    """How one entity type is matched, ranked and scoped."""
+
+    model: Any
+    title: Any
+    subtitle: Any
+    columns: Sequence[Any]
+    scope_column: Any
+
+
+SEARCH_TARGETS: Dict[str, SearchTarget] = {
+    "lead": SearchTarget(
+        Lead, Lead.company_name, Lead.contact_person, [Lead.company_name], Lead.assigned_to
+    ),
+    "deal": SearchTarget(Deal, Deal.title, Deal.company, [Deal.title], Deal.owner_id),
+    "account": SearchTarget(
+        Account, Account.name, Account.industry, [Account.name], Account.owner_id
+    ),
+    "contact": SearchTarget(
+        Contact,
+        func.concat_ws(" ", Contact.first_name, Contact.last_name),
+        Contact.email,
+        [Contact.first_name, Contact.last_name],
+        Contact.owner_id,
+    ),
+    "sales_entry": SearchTarget(
+        SalesEntry,
+        SalesEntry.customer_name,
+        SalesEntry.contact_name,
+        [SalesEntry.customer_name],
+        SalesEntry.salesperson_id,
+    ),
+}
+
+
+class SearchService:
+    """Service for global search."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _target_stmt(self, entity_type: str, term: str, limit: int, user: User):
+        """Best ``limit`` hits of one entity type, ranked by word similarity."""
+        target = SEARCH_TARGETS[entity_type]
+        pattern = f"%{term}%"
+        scores = [func.word_similarity(term, func.coalesce(c, "")) for c in target.columns]
+        score = scores[0] if len(scores) == 1 else func.greatest(*scores)
+
+        stmt = select(
+            literal(entity_type).label("type"),
+            target.model.id.label("id"),
+            target.title.label("title"),
+            target.subtitle.label("subtitle"),
+            score.label("score"),
+        ).where(or_(*(c.ilike(pattern) for c in target.columns)))
+
+        scope = scope_filter(target.scope_column, user)
+        if scope is not None:
+            stmt = stmt.where(scope)
+        return stmt.order_by(score.desc()).limit(limit)
+
+    async def search(
+        self,
+        term: str,
+        user: User,
+        types: Optional[List[str]] = None,
+        limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search the user's leads, deals, accounts, contacts and sales entries.
+
+        Args:
+            term: Search term (matched anywhere in the name, case-insensitive)
+            user: Current authenticated user
+            types: Entity types to search (default: all of SEARCH_TARGETS)
+            limit: Maximum number of hits over all types
+
+        Returns:
+            Hits ordered by relevance, each with type, id, title, subtitle and score
+
+        Raises:
+            BadRequestException: If the term is too short or a type is unknown
+        """
+        term = term.strip()
+        if len(term) < MIN_TERM_LENGTH:
+            raise BadRequestException(
+                f"Search term must be at least {MIN_TERM_LENGTH} characters"
+            )
+        types = types or list(SEARCH_TARGETS)
+        unknown = [t for t in types if t not in SEARCH_TARGETS]
+        if unknown:
+            raise BadRequestException(
+                f"Unknown search type(s): {', '.join(unknown)}; "
+                f"expected {', '.join(SEARCH_TARGETS)}"
+            )
+
+        hits = union_all(
+            *(self._target_stmt(t, term, limit, user) for t in dict.fromkeys(types))
+        ).subquery()
+        stmt = (
+            select(hits)
+            .order_by(hits.c.score.desc(), hits.c.title, hits.c.type, hits.c.id)
+            .limit(limit)
+        )
+
+        result = await self.db.execute(stmt)
+        return [
+            {
+                "type": row.type,
+                "id": str(row.id),
+                "title": row.title,
+                "subtitle": row.subtitle,
+                "score": round(float(row.score), 4),
+            }
+            for row in result.all()
+        ]
@@ -18,6 +18,7 @@ from app.models.user import User
 from app.repositories.task_repository import TaskRepository
 from app.schemas.task_schema import TaskCreate, TaskOut, TaskUpdate
 from app.utils.activity_logger import compute_changes, log_activity, model_to_dict
+from app.utils.cache import DASHBOARD_CACHE, payload_cache
 from app.utils.scoping import enforce_scope, get_scoped_user_ids
 
 
@@ -51,6 +52,8 @@ class TaskService:
         priority: Optional[str] = None,
         type: Optional[str] = None,
         assigned_to: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count: str = "exact",
     ) -> Dict[str, Any]:
         """
         List tasks with filtering, pagination, and access control.
@@ -63,6 +66,8 @@ class TaskService:
             priority: Optional filter by priority
             type: Optional filter by type
             assigned_to: Optional filter by assigned user
+            cursor: Keyset cursor (``nextCursor`` of the previous page)
+            count: Total count mode ("exact", "estimated" or "none")
 
         Returns:
             Dictionary with 'data' and 'pagination'
@@ -85,7 +90,7 @@ class TaskService:
 
         # Get data from repository
         result = await self.task_repo.get_with_names(
-            page=page, limit=limit, filters=filters or None
+            page=page, limit=limit, cursor=cursor, count=count, filters=filters or None
         )
 
         # Transform data
@@ -163,6 +168,7 @@ class TaskService:
 
         # Log activity
         await log_activity(self.db, user, "create", "task", str(task.id), task.title)
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         return TaskOut.model_validate(task).model_dump(by_alias=True)
 
@@ -198,6 +204,7 @@ class TaskService:
         # Log activity with changes
         changes = compute_changes(old_data, model_to_dict(task))
         await log_activity(self.db, user, "update", "task", str(task.id), task.title, changes)
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         return TaskOut.model_validate(task).model_dump(by_alias=True)
 
@@ -231,6 +238,7 @@ class TaskService:
 
         # Log activity
         await log_activity(self.db, user, "delete", "task", task_id, task_title)
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         return True
 
@@ -265,5 +273,6 @@ class TaskService:
 
         changes = compute_changes(old_data, model_to_dict(task))
         await log_activity(self.db, user, "update", "task", str(task.id), task.title, changes)
+        payload_cache.invalidate_after_commit(self.db, DASHBOARD_CACHE)
 
         return TaskOut.model_validate(task).model_dump(by_alias=True)
@@ -10,34 +10,62 @@ from __future__ import annotations
 import uuid
 from typing import Any, Dict
 
-from fastapi import UploadFile
+from fastapi import Request
 
+from app.config import settings
+from app.exceptions import PayloadTooLargeException
 from app.models.user import User
-from app.utils.storage import upload_file
+from app.utils.multipart_stream import stream_file_part
+from app.utils.storage import upload_stream
+
+# Room for the multipart boundaries, part headers and small form fields
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
 
 
 class UploadService:
     """Service for file upload operations."""
 
-    async def upload_file(self, file: UploadFile, user: User) -> Dict[str, Any]:
+    async def upload_file(self, request: Request, user: User) -> Dict[str, Any]:
         """
-        Upload a file to storage.
+        Upload the ``file`` field of a multipart request to storage.
+
+        The body is parsed as it arrives: a declared Content-Length over the
+        limit is rejected before anything is read, and otherwise reading
+        stops as soon as the file passes MAX_UPLOAD_SIZE_BYTES.
 
         Args:
-            file: File to upload
+            request: ``multipart/form-data`` request with a ``file`` field
             user: Current user
 
         Returns:
-            Dictionary with URL and filename
+            Dictionary with URL, filename, size and whether the content was
+            already stored
+
+        Raises:
+            BadRequestException: If the request has no multipart ``file`` field
+            PayloadTooLargeException: If the file exceeds MAX_UPLOAD_SIZE_BYTES
         """
-        file_bytes = await file.read()
+        max_size = settings.MAX_UPLOAD_SIZE_BYTES
+        declared = request.headers.get("content-length")
+        if declared and declared.isdigit() and int(declared) > max_size + MULTIPART_OVERHEAD_BYTES:
+            raise PayloadTooLargeException(
+                f"File exceeds the maximum upload size of {max_size // (1024 * 1024)} MB"
+            )
+
+        file = await stream_file_part(request, "file")
         ext = file.filename.split(".")[-1] if file.filename else "pdf"
         unique_name = f"{uuid.uuid4()}.{ext}"
-        url = await upload_file(
-            file_bytes,
+        stored = await upload_stream(
+            file.chunks,
             unique_name,
             file.content_type or "application/pdf",
             original_filename=file.filename,
+            max_size=max_size,
         )
-        return {"url": url, "filename": file.filename}
+        return {
+            "url": stored["url"],
+            "filename": file.filename,
+            "size": stored["size"],
+            "deduplicated": stored["deduplicated"],
+        }
 
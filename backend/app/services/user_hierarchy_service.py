@@ -0,0 +1,133 @@
+"""
+User Hierarchy Service
+
+This module maintains the ``user_hierarchy_closure`` table, the transitive
+closure of ``users.manager_id`` that record scoping semi-joins against.
+All methods run inside the caller's transaction.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Optional, Union
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import BadRequestException
+
+UserId = Union[str, uuid.UUID]
+
+_REBUILD_SQL = """
+    INSERT INTO user_hierarchy_closure (ancestor_id, descendant_id, depth)
+    WITH RECURSIVE tree(ancestor_id, descendant_id, depth) AS (
+        SELECT id, id, 0 FROM users
+        UNION ALL
+        SELECT t.ancestor_id, u.id, t.depth + 1
+        FROM tree t
+        JOIN users u ON u.manager_id = t.descendant_id
+        WHERE t.depth < 64
+    )
+    SELECT ancestor_id, descendant_id, min(depth)
+    FROM tree
+    GROUP BY ancestor_id, descendant_id
+"""
+
+
+class UserHierarchyService:
+    """Service keeping the manager closure table in step with ``users``."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def add_user(self, user_id: UserId, manager_id: Optional[UserId]) -> None:
+        """
+        Insert closure rows for a newly created user.
+
+        Args:
+            user_id: New user's ID
+            manager_id: Manager the user reports to, if any
+        """
+        params = {"uid": str(user_id), "mgr": str(manager_id) if manager_id else None}
+        await self.db.execute(
+            text(
+                "INSERT INTO user_hierarchy_closure (ancestor_id, descendant_id, depth) "
+                "VALUES (:uid, :uid, 0) ON CONFLICT DO NOTHING"
+            ),
+            params,
+        )
+        if manager_id:
+            await self.db.execute(
+                text("""
+                    INSERT INTO user_hierarchy_closure (ancestor_id, descendant_id, depth)
+                    SELECT ancestor_id, :uid, depth + 1
+                    FROM user_hierarchy_closure
+                    WHERE descendant_id = :mgr
+                    ON CONFLICT DO NOTHING
+                """),
+                params,
+            )
+
+    async def move_user(self, user_id: UserId, manager_id: Optional[UserId]) -> None:
+        """
+        Re-parent a user (and their whole subtree) under a new manager.
+
+        Args:
+            user_id: User whose manager changed
+            manager_id: New manager, or None to detach
+
+        Raises:
+            BadRequestException: If the new manager reports to the user
+        """
+        params = {"uid": str(user_id), "mgr": str(manager_id) if manager_id else None}
+
+        if manager_id:
+            cycle = await self.db.execute(
+                text(
+                    "SELECT 1 FROM user_hierarchy_closure "
+                    "WHERE ancestor_id = :uid AND descendant_id = :mgr"
+                ),
+                params,
+            )
+            if cycle.first():
+                raise BadRequestException(
+                    "A user cannot report to themselves or one of their subordinates"
+                )
+
+        # Detach the subtree from all of its current outside ancestors
+        await self.db.execute(
+            text("""
+                DELETE FROM user_hierarchy_closure
+                WHERE descendant_id IN (
+                    SELECT descendant_id FROM user_hierarchy_closure WHERE ancestor_id = :uid
+                )
+                AND ancestor_id NOT IN (
+                    SELECT descendant_id FROM user_hierarchy_closure WHERE ancestor_id = :uid
+                )
+            """),
+            params,
+        )
+        if manager_id:
+            # Attach it below every ancestor of the new manager
+            await self.db.execute(
+                text("""
+                    INSERT INTO user_hierarchy_closure (ancestor_id, descendant_id, depth)
+                    SELECT a.ancestor_id, d.descendant_id, a.depth + d.depth + 1
+                    FROM user_hierarchy_closure a
+                    CROSS JOIN user_hierarchy_closure d
+                    WHERE a.descendant_id = :mgr AND d.ancestor_id = :uid
+                    ON CONFLICT DO NOTHING
+                """),
+                params,
+            )
+
+    async def rebuild(self) -> int:
+        """
+        Recompute the closure table from ``users.manager_id``.
+
+        Returns:
+            Number of closure rows written
+        """
+        await self.db.execute(text("DELETE FROM user_hierarchy_closure"))
+        result = await self.db.execute(text(_REBUILD_SQL))
+        return result.rowcount
@@ -0,0 +1,116 @@
+"""
+Per-stage / per-status totals in a single scan.
+
+Stats used to be gathered with one ``count(*)`` (and ``sum``) per stage.
+``stage_totals`` groups the filtered rows by the stage column once::
+
+    SELECT stage, count(*), coalesce(sum(value), 0)
+    FROM deals WHERE ... GROUP BY stage
+
+and returns every stage's totals plus the totals over all rows.
+
+The stage list (keys and their order) comes from ``master_dropdowns``, so a
+stage added there shows up in the stats without a code change.  Dropdown
+values are cached and invalidated when master data is edited.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.master_dropdown import MasterDropdown
+from app.utils.cache import DROPDOWN_CACHE, payload_cache
+
+PIPELINE_STAGES = ("New", "Cold", "Proposal", "Negotiation", "Closed Won", "Closed Lost")
+CLOSED_STAGES = ("Closed Won", "Closed Lost")
+
+# "<table>.<column>" -> (master_dropdowns entity, values used when it has no
+# active rows).  Leads move through the deal pipeline stages.
+STAGE_DROPDOWNS: Dict[str, Tuple[Optional[str], Tuple[str, ...]]] = {
+    "leads.stage": ("deal-stages", PIPELINE_STAGES),
+    "deals.stage": ("deal-stages", PIPELINE_STAGES),
+    "tasks.status": ("task-statuses", ("pending", "in_progress", "completed")),
+    "partners.status": ("partner-statuses", ("pending", "approved", "suspended", "inactive")),
+    "sales_entries.payment_status": (None, ("pending", "partial", "paid")),
+}
+
+Totals = Dict[str, Any]
+
+
+async def stage_values(db: AsyncSession, column: Any) -> List[str]:
+    """
+    Stages of ``column`` in display order.
+
+    Args:
+        db: Database session
+        column: Stage/status column listed in STAGE_DROPDOWNS
+
+    Returns:
+        Active master_dropdowns values, or the column's fallback values
+    """
+    dropdown, fallback = STAGE_DROPDOWNS[f"{column.table.name}.{column.key}"]
+    if dropdown is None:
+        return list(fallback)
+
+    async def load() -> List[str]:
+        result = await db.execute(
+            select(MasterDropdown.value)
+            .where(MasterDropdown.entity == dropdown, MasterDropdown.is_active.is_(True))
+            .order_by(MasterDropdown.sort_order)
+        )
+        return list(result.scalars().all())
+
+    values = await payload_cache.get_or_compute(DROPDOWN_CACHE, dropdown, load)
+    return list(values) or list(fallback)
+
+
+async def stage_totals(
+    db: AsyncSession,
+    column: Any,
+    sums: Optional[Mapping[str, Any]] = None,
+    filters: Optional[list] = None,
+    stages: Optional[Sequence[str]] = None,
+) -> Tuple[Dict[str, Totals], Totals]:
+    """
+    Count (and sum) the filtered rows per stage in one GROUP BY scan.
+
+    Args:
+        db: Database session
+        column: Stage/status column to group by
+        sums: Result key -> expression to sum per stage (e.g. {"value": Deal.value})
+        filters: List of SQLAlchemy filter expressions
+        stages: Stages to report (default: ``stage_values(db, column)``)
+
+    Returns:
+        Tuple of ({stage: {"count": n, <sum key>: float}} for every stage, in
+        order and zero-filled; the same totals over all rows, including
+        stages not in the list)
+    """
+    sums = sums or {}
+    if stages is None:
+        stages = await stage_values(db, column)
+
+    stmt = select(
+        column,
+        func.count().label("count"),
+        *(func.coalesce(func.sum(expr), 0).label(key) for key, expr in sums.items()),
+    ).group_by(column)
+    if filters:
+        for f in filters:
+            stmt = stmt.where(f)
+
+    def empty() -> Totals:
+        return {"count": 0, **{key: 0.0 for key in sums}}
+
+    by_stage = {stage: empty() for stage in stages}
+    overall = empty()
+    for stage, count, *amounts in (await db.execute(stmt)).all():
+        totals = {"count": count, **{key: float(a) for key, a in zip(sums, amounts)}}
+        for key, amount in totals.items():
+            overall[key] += amount
+        if stage in by_stage:
+            by_stage[stage] = totals
+    return by_stage, overall
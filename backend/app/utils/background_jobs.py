@@ -0,0 +1,108 @@
+"""
+In-process background jobs started after commit.
+
+``JobQueue`` runs per-key jobs as asyncio tasks.  Write paths call
+``schedule_after_commit(db, key, job)``: the job is only started once the
+session's transaction commits, so it never acts on rows the request later
+rolls back and can read them from its own session.  Jobs for the same key
+run one after another, so the last committed change is handled last.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+JobFactory = Callable[[], Awaitable[Any]]
+
+_queues: List["JobQueue"] = []
+
+
+class JobQueue:
+    """In-process registry of running jobs, keyed by record id."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._pending_key = f"{name}_jobs.pending"
+        self._tasks: Dict[str, asyncio.Task] = {}
+        _queues.append(self)
+
+    def submit(self, key: str, job: JobFactory) -> asyncio.Task:
+        """Start ``job`` now, after any job already running for ``key``."""
+        previous = self._tasks.get(key)
+
+        async def _run() -> Any:
+            if previous is not None and not previous.done():
+                await asyncio.wait({previous})
+            return await job()
+
+        task = asyncio.get_running_loop().create_task(_run())
+        self._tasks[key] = task
+        task.add_done_callback(lambda t: self._forget(key, t))
+        return task
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("%s job %s failed", self.name, key, exc_info=task.exception())
+
+    def schedule_after_commit(self, db: AsyncSession, key: str, job: JobFactory) -> None:
+        """Start ``job`` once the session's transaction commits."""
+        pending: Dict[str, JobFactory] = db.sync_session.info.setdefault(self._pending_key, {})
+        pending[key] = job
+
+    def _flush_pending(self, session: Session) -> None:
+        pending = session.info.pop(self._pending_key, None)
+        if not pending:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning("No running event loop; dropped %d %s jobs", len(pending), self.name)
+            return
+        for key, job in pending.items():
+            self.submit(key, job)
+
+    def _discard_pending(self, session: Session) -> None:
+        session.info.pop(self._pending_key, None)
+
+    def is_running(self, key: str) -> bool:
+        return key in self._tasks
+
+    async def wait(self, key: str, timeout: float) -> bool:
+        """
+        Wait for the job running for ``key`` in this process.
+
+        Returns:
+            True if a job was running and finished within ``timeout``
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            return False
+        done, _ = await asyncio.wait({task}, timeout=timeout)
+        return bool(done)
+
+    async def drain(self, timeout: float) -> None:
+        """Wait up to ``timeout`` seconds for every running job."""
+        if self._tasks:
+            await asyncio.wait(set(self._tasks.values()), timeout=timeout)
+
+
+@event.listens_for(Session, "after_commit")
+def _start_on_commit(session: Session) -> None:
+    for queue in _queues:
+        queue._flush_pending(session)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    for queue in _queues:
+        queue._discard_pending(session)
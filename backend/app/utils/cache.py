@@ -0,0 +1,287 @@
+"""
+Payload cache with TTL expiry and write-driven invalidation.
+
+Cached values live in a pluggable backend:
+
+- ``MemoryCacheBackend``: per-process LRU dict (default)
+- ``RedisCacheBackend``: shared across workers, enabled with
+  ``CACHE_BACKEND=redis`` and ``CACHE_URL`` (needs the optional ``redis``
+  package)
+
+Entries are grouped into namespaces.  Each namespace carries a version
+number that is part of every key, so invalidating a namespace is a single
+counter bump; stale entries simply stop being addressed and age out.
+
+Write paths call ``invalidate_after_commit(db, namespace)``: the bump is deferred until
+the session commits so a concurrent reader can't re-cache pre-commit data,
+and a rolled-back write invalidates nothing.
+
+``principal_cache`` is a separate, always in-process cache of authenticated
+user rows used by ``get_current_user``; it follows the same after-commit
+invalidation rule, per user id.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.user import User
+
+_PENDING_KEY = "cache_invalidate"
+_PENDING_PRINCIPALS_KEY = "principal_invalidate"
+
+# Namespace for /dashboard payloads; invalidated by lead, deal, task,
+# sales entry, partner and user writes.
+DASHBOARD_CACHE = "dashboard"
+# Active master_dropdowns values per dropdown; invalidated by master data writes.
+DROPDOWN_CACHE = "master-dropdowns"
+
+# Version bumps scheduled from sync session events; the event loop only keeps
+# weak references to tasks, so they are held here until done.
+_background_tasks: Set[asyncio.Task] = set()
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            self._data.pop(key, None)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    async def get_version(self, namespace: str) -> int:
+        return self._versions.get(namespace, 0)
+
+    async def bump_version(self, namespace: str) -> None:
+        self._versions[namespace] = self._versions.get(namespace, 0) + 1
+
+    def bump_version_nowait(self, namespace: str) -> None:
+        self._versions[namespace] = self._versions.get(namespace, 0) + 1
+
+
+class RedisCacheBackend:
+    """Shared cache backed by Redis; values are stored as JSON."""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis  # optional dependency
+
+        self._client = redis.from_url(url)
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self._client.get(key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        await self._client.set(key, json.dumps(value, default=str), ex=ttl)
+
+    async def get_version(self, namespace: str) -> int:
+        raw = await self._client.get(f"{namespace}:version")
+        return int(raw) if raw is not None else 0
+
+    async def bump_version(self, namespace: str) -> None:
+        await self._client.incr(f"{namespace}:version")
+
+    def bump_version_nowait(self, namespace: str) -> None:
+        # Called from a sync session event; schedule on the running loop
+        try:
+            task = asyncio.get_running_loop().create_task(self.bump_version(namespace))
+        except RuntimeError:
+            return
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+class PayloadCache:
+    """
+    Namespaced TTL cache for computed API payloads.
+
+    Values handed out on a hit are shared with other callers and must be
+    treated as read-only.
+    """
+
+    def __init__(self, backend: Any, default_ttl: int = 60):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        self.invalidations: Counter[str] = Counter()
+
+    async def get_or_compute(
+        self,
+        namespace: str,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+    ) -> Any:
+        """
+        Return the cached value for ``namespace``/``key``, computing it on a miss.
+
+        Args:
+            namespace: Invalidation group (e.g. "dashboard")
+            key: Entry key within the namespace (e.g. "all:<user-id>")
+            compute: Coroutine factory producing the value on a miss
+            ttl: Expiry in seconds (defaults to the cache's default_ttl)
+
+        Returns:
+            Cached or freshly computed value
+        """
+        version = await self.backend.get_version(namespace)
+        full_key = f"{namespace}:v{version}:{key}"
+        value = await self.backend.get(full_key)
+        if value is not None:
+            self.hits[namespace] += 1
+            return value
+
+        self.misses[namespace] += 1
+        value = await compute()
+        await self.backend.set(full_key, value, ttl or self.default_ttl)
+        return value
+
+    async def invalidate(self, namespace: str) -> None:
+        """Invalidate every entry in a namespace immediately."""
+        self.invalidations[namespace] += 1
+        await self.backend.bump_version(namespace)
+
+    def invalidate_after_commit(self, db: AsyncSession | Session, namespace: str) -> None:
+        """Invalidate a namespace once the session's transaction commits."""
+        session = db.sync_session if isinstance(db, AsyncSession) else db
+        pending: Set[str] = session.info.setdefault(_PENDING_KEY, set())
+        pending.add(namespace)
+
+    def _flush_pending(self, session: Session) -> None:
+        for namespace in session.info.pop(_PENDING_KEY, ()):
+            self.invalidations[namespace] += 1
+            self.backend.bump_version_nowait(namespace)
+
+    def stats(self, namespace: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Hit/miss counters for this process.
+
+        Args:
+            namespace: Report only this namespace (default: all namespaces)
+        """
+        if namespace is None:
+            hits = sum(self.hits.values())
+            misses = sum(self.misses.values())
+            invalidations = sum(self.invalidations.values())
+        else:
+            hits = self.hits[namespace]
+            misses = self.misses[namespace]
+            invalidations = self.invalidations[namespace]
+        lookups = hits + misses
+        return {
+            "backend": type(self.backend).__name__,
+            "namespace": namespace,
+            "hits": hits,
+            "misses": misses,
+            "hitRate": round(hits / lookups, 4) if lookups else 0.0,
+            "invalidations": invalidations,
+        }
+
+
+class PrincipalCache:
+    """
+    Short-TTL cache of authenticated users keyed by token subject (user id).
+
+    Stores a column snapshot (without ``password_hash``) and hands out a
+    fresh, session-less ``User`` per lookup, so request handlers can read
+    it like the row they used to load but must re-fetch before writing.
+    Always per-process: the TTL bounds how long another worker can keep
+    honouring a deactivated account.
+    """
+
+    _columns = tuple(
+        attr.key for attr in inspect(User).column_attrs if attr.key != "password_hash"
+    )
+
+    def __init__(self, ttl: int = 30, max_entries: int = 2048):
+        self.ttl = ttl
+        self._store = MemoryCacheBackend(max_entries=max_entries)
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, subject: str) -> Optional[User]:
+        """Return a detached ``User`` for ``subject`` or None on a miss."""
+        if self.ttl <= 0:
+            return None
+        snapshot = await self._store.get(subject)
+        if snapshot is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return User(**copy.deepcopy(snapshot))
+
+    async def put(self, user: User) -> None:
+        """Cache the current column values of a loaded user."""
+        if self.ttl <= 0:
+            return
+        snapshot = {key: getattr(user, key) for key in self._columns}
+        await self._store.set(str(user.id), snapshot, self.ttl)
+
+    def invalidate(self, subject: str) -> None:
+        """Drop a cached user immediately."""
+        self._store.delete(str(subject))
+
+    def invalidate_after_commit(self, db: AsyncSession, subject: Any) -> None:
+        """Drop a cached user once the session's transaction commits."""
+        pending: Set[str] = db.sync_session.info.setdefault(_PENDING_PRINCIPALS_KEY, set())
+        pending.add(str(subject))
+
+    def _flush_pending(self, session: Session) -> None:
+        for subject in session.info.pop(_PENDING_PRINCIPALS_KEY, ()):
+            self.invalidate(subject)
+
+
+def _build_backend() -> Any:
+    if settings.CACHE_BACKEND == "redis" and settings.CACHE_URL:
+        return RedisCacheBackend(settings.CACHE_URL)
+    return MemoryCacheBackend(max_entries=settings.CACHE_MAX_ENTRIES)
+
+
+payload_cache = PayloadCache(_build_backend(), default_ttl=settings.DASHBOARD_CACHE_TTL_SECONDS)
+
+principal_cache = PrincipalCache(
+    ttl=settings.AUTH_USER_CACHE_TTL_SECONDS, max_entries=settings.CACHE_MAX_ENTRIES
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    payload_cache._flush_pending(session)
+    principal_cache._flush_pending(session)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_PENDING_PRINCIPALS_KEY, None)
@@ -0,0 +1,134 @@
+"""
+Conditional and ranged HTTP responses for stored files.
+
+``file_response`` turns a ``get_file`` record into:
+
+- ``304 Not Modified`` when ``If-None-Match`` / ``If-Modified-Since`` match
+- ``206 Partial Content`` for a single ``Range: bytes=...`` request
+- ``416`` for an unsatisfiable range
+- otherwise a streamed ``200`` with ``Accept-Ranges``
+
+Stored files never change after upload, so rows with a content hash get a
+strong ETag and an immutable ``Cache-Control``; legacy base64 rows without
+one get a weak ETag and must revalidate.
+"""
+
+from __future__ import annotations
+
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+
+from app.utils.storage import iter_file
+
+_IMMUTABLE = "private, max-age=31536000, immutable"
+_REVALIDATE = "private, no-cache"
+
+
+def _etag(record: dict) -> str:
+    if record.get("content_hash"):
+        return f'"{record["content_hash"]}"'
+    stamp = int(record["updated_at"].timestamp()) if record.get("updated_at") else 0
+    return f'W/"{record["id"]}-{stamp}-{record["size_bytes"]}"'
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison, as required for If-None-Match."""
+    if header.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in header.split(","))
+
+
+def _not_modified_since(header: str, record: dict) -> bool:
+    modified = record.get("updated_at")
+    if not modified:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None or modified.tzinfo is None:
+        return False
+    return int(modified.timestamp()) <= int(since.timestamp())
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single ``bytes=`` range into ``(start, end_exclusive)``.
+
+    Returns None when the header should be ignored (other units, multiple
+    ranges or malformed syntax) and ``(size, size)`` when it is
+    unsatisfiable.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if not first:  # suffix range: last N bytes
+            length = int(last)
+            if length <= 0:
+                return (size, size)
+            return (max(0, size - length), size)
+        start = int(first)
+        end = int(last) + 1 if last else size
+    except ValueError:
+        return None
+    if end <= start:
+        return None
+    if start >= size:
+        return (size, size)
+    return (start, min(end, size))
+
+
+def file_response(request: Request, record: dict) -> Response:
+    """Build the response for a stored file honouring conditional and Range headers."""
+    size = record["size_bytes"]
+    etag = _etag(record)
+    headers: Dict[str, str] = {
+        "ETag": etag,
+        "Cache-Control": _IMMUTABLE if record.get("content_hash") else _REVALIDATE,
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'inline; filename="{record["original_filename"]}"',
+    }
+    if record.get("updated_at"):
+        headers["Last-Modified"] = format_datetime(record["updated_at"], usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+    elif _not_modified_since(request.headers.get("if-modified-since", ""), record):
+        return Response(status_code=304, headers=headers)
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    if range_header:
+        if_range = request.headers.get("if-range")
+        # If-Range needs a strong validator match; otherwise send the full file
+        if if_range is None or (not etag.startswith("W/") and if_range.strip() == etag):
+            byte_range = _parse_range(range_header, size)
+
+    if byte_range is not None:
+        start, end = byte_range
+        if start >= size:
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(status_code=416, headers=headers)
+        headers["Content-Range"] = f"bytes {start}-{end - 1}/{size}"
+        headers["Content-Length"] = str(end - start)
+        return StreamingResponse(
+            iter_file(record, start, end),
+            status_code=206,
+            media_type=record["content_type"],
+            headers=headers,
+        )
+
+    headers["Content-Length"] = str(size)
+    return StreamingResponse(
+        iter_file(record), media_type=record["content_type"], headers=headers
+    )
@@ -0,0 +1,120 @@
+"""
+Incremental multipart/form-data parsing for file uploads.
+
+``UploadFile`` parameters make Starlette read the whole request body and
+spool it to a temporary file before the endpoint runs, so nothing the
+endpoint does can limit or stream the upload.  ``stream_file_part`` instead
+feeds ``request.stream()`` through python-multipart's push parser and hands
+back the file part's bytes as they arrive from the socket: a size limit
+applied while consuming them stops reading the body at the limit.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional, Tuple
+
+from fastapi import Request
+
+from app.exceptions import BadRequestException
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:  # python-multipart < 0.0.13
+    from multipart.multipart import MultipartParser, parse_options_header
+
+Event = Tuple[str, object]
+
+
+@dataclass
+class FilePart:
+    """A file field of a multipart body whose content is still being received."""
+
+    filename: Optional[str]
+    content_type: Optional[str]
+    chunks: AsyncIterator[bytes]
+
+
+async def _events(request: Request, boundary: bytes) -> AsyncIterator[Event]:
+    """Parser events for each body chunk, in order, as the chunks arrive."""
+    pending: List[Event] = []
+    header: List[bytes] = [b"", b""]
+
+    def on_header_field(data: bytes, start: int, end: int) -> None:
+        header[0] += data[start:end]
+
+    def on_header_value(data: bytes, start: int, end: int) -> None:
+        header[1] += data[start:end]
+
+    def on_header_end() -> None:
+        pending.append(("header", (header[0].lower(), header[1])))
+        header[0] = header[1] = b""
+
+    callbacks = {
+        "on_part_begin": lambda: pending.append(("begin", None)),
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": lambda: pending.append(("headers", None)),
+        "on_part_data": lambda data, start, end: pending.append(("data", data[start:end])),
+        "on_part_end": lambda: pending.append(("end", None)),
+    }
+    parser = MultipartParser(boundary, callbacks)
+    async for chunk in request.stream():
+        parser.write(chunk)
+        for event in pending:
+            yield event
+        pending.clear()
+    parser.finalize()
+    for event in pending:
+        yield event
+
+
+async def _part_data(events: AsyncIterator[Event]) -> AsyncIterator[bytes]:
+    async for kind, value in events:
+        if kind == "end":
+            return
+        if kind == "data" and value:
+            yield value
+
+
+async def stream_file_part(request: Request, field: str = "file") -> FilePart:
+    """
+    Read a multipart request up to the headers of one file field.
+
+    Args:
+        request: Incoming ``multipart/form-data`` request
+        field: Form field name of the file
+
+    Returns:
+        The field's filename and content type, and an async iterator over
+        its content that reads the rest of the part from the request
+
+    Raises:
+        BadRequestException: If the body is not multipart or has no such field
+    """
+    media_type, params = parse_options_header(request.headers.get("content-type", ""))
+    boundary = params.get(b"boundary")
+    if media_type != b"multipart/form-data" or not boundary:
+        raise BadRequestException("Expected a multipart/form-data request")
+
+    events = _events(request, boundary)
+    headers: dict = {}
+    async for kind, value in events:
+        if kind == "begin":
+            headers = {}
+        elif kind == "header":
+            name, raw = value
+            headers[name] = raw
+        elif kind == "headers":
+            _, options = parse_options_header(headers.get(b"content-disposition", b""))
+            if options.get(b"name", b"").decode("utf-8", "replace") != field:
+                continue  # data of other fields is skipped
+            filename = options.get(b"filename")
+            content_type = headers.get(b"content-type")
+            return FilePart(
+                filename=filename.decode("utf-8", "replace") if filename else None,
+                content_type=content_type.decode("latin-1") if content_type else None,
+                chunks=_part_data(events),
+            )
+    raise BadRequestException(f'Multipart field "{field}" is missing')
@@ -0,0 +1,249 @@
+"""
+Keyset (cursor) pagination for list queries.
+
+List endpoints page with ``page``/``limit`` (OFFSET) by default, which makes
+PostgreSQL read and discard every row before the requested page.  Each page
+also returns a ``nextCursor``; passing it back as ``cursor`` fetches the next
+page by seeking past the last row seen instead::
+
+    WHERE (created_at, id) < (:last_created_at, :last_id)
+    ORDER BY created_at DESC, id DESC
+    LIMIT :limit
+
+which the matching ``(created_at DESC, id DESC)`` index answers directly, so
+page 5000 costs the same as page 1.
+
+Cursors are opaque to clients: URL-safe base64 of the last row's sort key.
+
+The ``total`` of a page comes from ``count_rows``, in the mode picked with
+``?count=``:
+
+- ``exact``: ``SELECT count(*)`` of the filtered list (default)
+- ``estimated``: the planner's row estimate (``pg_class.reltuples`` for an
+  unfiltered table, ``EXPLAIN`` otherwise), counted exactly when the
+  estimate is below ``COUNT_EXACT_THRESHOLD``
+- ``none``: no count; ``total`` and ``totalPages`` are null
+
+Planner estimates are cached for ``COUNT_CACHE_TTL_SECONDS`` per table,
+statement and parameters (which include the caller's scope filter), and a
+table's entries are dropped when a session that flushed rows of it commits.
+Exact totals are never cached: writes that bypass the ORM (raw SQL, ON
+DELETE CASCADE) can miss the invalidation, and ``exact`` has to stay exact.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Row, event, literal, literal_column, text, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.config import settings
+from app.exceptions import BadRequestException
+from app.utils.cache import payload_cache
+
+COUNT_MODES = ("exact", "estimated", "none")
+COUNT_CACHE = "count"
+
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    return value
+
+
+def _load(column: Any, value: Any) -> Any:
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if issubclass(python_type, datetime):
+        return datetime.fromisoformat(value)
+    if issubclass(python_type, date):
+        return date.fromisoformat(value)
+    if issubclass(python_type, (uuid.UUID, Decimal)):
+        return python_type(value)
+    return value
+
+
+class Keyset:
+    """
+    Descending sort key of a list query.
+
+    The last column must be unique (the primary key) so every row has a
+    distinct position and no row is skipped or repeated between pages.
+    """
+
+    def __init__(self, *columns: Any):
+        self.columns = columns
+
+    def paginate(self, stmt: Any, page: int, limit: int, cursor: Optional[str] = None) -> Any:
+        """
+        Order ``stmt`` by the key and select one page.
+
+        One row more than ``limit`` is fetched so ``split`` can tell whether
+        there is a next page.
+
+        Args:
+            stmt: Select whose first entity carries the key columns
+            page: Page number (1-based), used when there is no cursor
+            limit: Items per page
+            cursor: ``nextCursor`` of the previous page
+
+        Raises:
+            BadRequestException: If the cursor is malformed
+        """
+        stmt = stmt.order_by(*(col.desc() for col in self.columns))
+        if cursor:
+            last = self.decode(cursor)
+            stmt = stmt.where(
+                tuple_(*self.columns)
+                < tuple_(*(literal(value, col.type) for col, value in zip(self.columns, last)))
+            )
+        else:
+            stmt = stmt.offset((page - 1) * limit)
+        return stmt.limit(limit + 1)
+
+    def split(self, rows: Sequence[Any], limit: int) -> Tuple[List[Any], Optional[str]]:
+        """
+        Trim the extra row fetched by ``paginate``.
+
+        Returns:
+            Tuple of (rows of this page, cursor of the next page or None)
+        """
+        rows = list(rows)
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last = rows[-1][0] if isinstance(rows[-1], Row) else rows[-1]
+        return rows, self.encode(last)
+
+    def encode(self, obj: Any) -> str:
+        """Cursor pointing just past ``obj``."""
+        payload = json.dumps(
+            [_dump(getattr(obj, col.key)) for col in self.columns], separators=(",", ":")
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> List[Any]:
+        """
+        Sort key values stored in ``cursor``.
+
+        Raises:
+            BadRequestException: If the cursor is malformed
+        """
+        try:
+            payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(payload)
+            if not isinstance(values, list) or len(values) != len(self.columns):
+                raise ValueError(cursor)
+            return [_load(col, value) for col, value in zip(self.columns, values)]
+        except (ValueError, TypeError, binascii.Error):
+            raise BadRequestException("Invalid pagination cursor")
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a statement, without running it."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any):
+        self.statement = statement
+
+
+@compiles(_Explain)
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def _estimate(db: AsyncSession, count_stmt: Any, table: str) -> Optional[int]:
+    if count_stmt.whereclause is None:
+        reltuples = (
+            await db.execute(
+                text("SELECT reltuples FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+                {"table": table},
+            )
+        ).scalar()
+        # -1 until the table is first vacuumed/analyzed
+        return int(reltuples) if reltuples is not None and reltuples >= 0 else None
+    rows_stmt = count_stmt.with_only_columns(literal_column("1"), maintain_column_froms=True)
+    plan = (await db.execute(_Explain(rows_stmt))).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_rows(
+    db: AsyncSession, count_stmt: Any, mode: str = "exact"
+) -> Tuple[Optional[int], bool]:
+    """
+    Total row count of a paginated list.
+
+    Args:
+        db: Database session
+        count_stmt: ``SELECT count(*)`` over the filtered list
+        mode: "exact", "estimated" or "none"
+
+    Returns:
+        Tuple of (total or None for mode "none", whether the total is an estimate)
+
+    Raises:
+        BadRequestException: If the mode is unknown
+    """
+    if mode not in COUNT_MODES:
+        raise BadRequestException(f"count must be one of: {', '.join(COUNT_MODES)}")
+    if mode == "none":
+        return None, False
+    if mode == "exact":
+        return (await db.execute(count_stmt)).scalar_one(), False
+
+    froms = count_stmt.get_final_froms()
+    table = getattr(froms[0], "name", "query") if froms else "query"
+    compiled = count_stmt.compile(dialect=postgresql.dialect())
+    params = repr(sorted(compiled.params.items()))
+    key = hashlib.sha1(f"{compiled}|{params}".encode()).hexdigest()
+
+    async def compute() -> List[Any]:
+        return [await _estimate(db, count_stmt, table)]
+
+    # Only the estimate is cached; below the threshold the exact count is live
+    [estimate] = await payload_cache.get_or_compute(
+        f"{COUNT_CACHE}:{table}", key, compute, ttl=settings.COUNT_CACHE_TTL_SECONDS
+    )
+    if estimate is not None and estimate >= settings.COUNT_EXACT_THRESHOLD:
+        return estimate, True
+    return (await db.execute(count_stmt)).scalar_one(), False
+
+
+def invalidate_counts_after_commit(db: AsyncSession | Session, table: str) -> None:
+    """Drop the cached totals of ``table`` once the session commits."""
+    payload_cache.invalidate_after_commit(db, f"{COUNT_CACHE}:{table}")
+
+
+# ORM writes invalidate on their own; Core INSERT/UPDATE/DELETE callers use
+# invalidate_counts_after_commit.
+@event.listens_for(Session, "after_flush")
+def _invalidate_counts(session: Session, _flush_context: Any) -> None:
+    tables = {
+        obj.__tablename__
+        for objects in (session.new, session.dirty, session.deleted)
+        for obj in objects
+        if hasattr(obj, "__tablename__")
+    }
+    for table in tables:
+        invalidate_counts_after_commit(session, table)
@@ -1,6 +1,21 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import re
+from functools import lru_cache
+from typing import Dict, List
+
+# Bump when the layout changes so cached PDFs are re-rendered
+PDF_TEMPLATE_VERSION = 2
+
+# The inputs generate_quote_pdf actually reads
+_QUOTE_PDF_FIELDS = (
+    "id", "quoteNumber", "status", "createdAt", "validUntil", "customerName",
+    "partnerName", "subtotal", "discountAmount", "taxRate", "taxAmount",
+    "totalAmount", "notes", "terms",
+)
+_LINE_ITEM_PDF_FIELDS = ("productName", "description", "quantity", "unitPrice", "lineTotal")
 
 
 def _format_inr(amount) -> str:
@@ -39,17 +54,22 @@ def _format_date(date_str) -> str:
         return str(date_str)
 
 
+_BREAK_RE = re.compile(r"<br\s*/?>|</p>|</li>", re.IGNORECASE)
+_LIST_ITEM_RE = re.compile(r"<li[^>]*>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+@lru_cache(maxsize=256)
 def _strip_html(html: str) -> str:
     """Strip HTML tags and convert common tags to plain text."""
     if not html:
         return ""
     # Convert <br>, <p>, <li> to newlines
-    text = re.sub(r"<br\s*/?>", "\n", html, flags=re.IGNORECASE)
-    text = re.sub(r"</p>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"<li[^>]*>", "• ", text, flags=re.IGNORECASE)
-    text = re.sub(r"</li>", "\n", text, flags=re.IGNORECASE)
+    text = _BREAK_RE.sub("\n", html)
+    text = _LIST_ITEM_RE.sub("\u2022 ", text)
     # Remove all remaining tags
-    text = re.sub(r"<[^>]+>", "", text)
+    text = _TAG_RE.sub("", text)
     # Decode common HTML entities
     text = (
         text.replace("&amp;", "&")
@@ -59,87 +79,248 @@ def _strip_html(html: str) -> str:
         .replace("&quot;", '"')
     )
     # Collapse excess whitespace/newlines
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
+def quote_pdf_fingerprint(quote_data: dict) -> str:
+    """
+    Hash the rendered inputs of a quote.
+
+    Two quotes with the same fingerprint render the same PDF, so the stored
+    one can be reused.  Ids and timestamps that the template does not print
+    (line item ids are replaced on every save) are left out.
+    """
+    payload = {field: quote_data.get(field) for field in _QUOTE_PDF_FIELDS}
+    payload["lineItems"] = [
+        [item.get(field) for field in _LINE_ITEM_PDF_FIELDS]
+        for item in quote_data.get("lineItems") or []
+    ]
+    payload["templateVersion"] = PDF_TEMPLATE_VERSION
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+# ── Layout (shared by every render) ───────────────────────────────────────────
+FONT = "Helvetica"
+# cp1252 instead of fpdf's latin-1 default, so bullets and curly quotes
+# pasted into terms render; anything else becomes "?" instead of failing
+ENCODING = "windows-1252"
+
+MARGIN = 14
+PAGE_W = 210  # A4 width mm
+USABLE_W = PAGE_W - MARGIN * 2  # 182 mm
+_PT_PER_MM = 72 / 25.4
+
+# Colour palette
+C_DARK = (15, 23, 42)       # slate-900
+C_MID = (100, 116, 139)     # slate-500
+C_LIGHT = (226, 232, 240)   # slate-200
+C_BG = (248, 250, 252)      # slate-50
+C_RED = (220, 38, 38)
+C_GREEN_BG = (209, 250, 229)
+C_GREEN_FG = (4, 120, 87)
+C_BLUE_BG = (219, 234, 254)
+C_BLUE_FG = (29, 78, 216)
+
+STATUS_COLORS = {
+    "draft":    ((241, 245, 249), (71, 85, 105)),
+    "sent":     (C_BLUE_BG, C_BLUE_FG),
+    "accepted": (C_GREEN_BG, C_GREEN_FG),
+    "rejected": ((254, 226, 226), C_RED),
+}
+
+# Line items table: (header, width, align) per column, left to right
+COL_NUM = 10
+COL_QTY = 18
+COL_PRICE = 35
+COL_TOTAL = 35
+COL_DESC = USABLE_W - COL_NUM - COL_QTY - COL_PRICE - COL_TOTAL
+TABLE_COLUMNS = (
+    ("#", COL_NUM, "C"),
+    ("Product / Description", COL_DESC, "L"),
+    ("Qty", COL_QTY, "C"),
+    ("Unit Price", COL_PRICE, "R"),
+    ("Total", COL_TOTAL, "R"),
+)
+TABLE_HEADER_H = 7
+NAME_LINE_H = 5
+DESC_LINE_H = 4
+
+
+def _pdf_text(value) -> str:
+    """Coerce a value to text the core font can encode."""
+    return str(value).encode(ENCODING, "replace").decode(ENCODING)
+
+
+@lru_cache(maxsize=None)
+def _font_widths(style: str) -> Dict[str, int]:
+    """Glyph widths (1/1000 em) of the core font, keyed by unicode character."""
+    from fpdf import FPDF
+
+    proto = FPDF()
+    proto.set_font(FONT, style, 10)
+    widths = {}
+    for code in range(256):
+        try:
+            char = bytes([code]).decode(ENCODING)
+        except UnicodeDecodeError:
+            continue
+        widths[char] = proto.current_font.cw[chr(code)]
+    return widths
+
+
+class _Canvas:
+    """
+    Positioned text and boxes on top of ``FPDF.text()`` / ``FPDF.rect()``.
+
+    ``cell()`` and ``multi_cell()`` re-measure text glyph by glyph on every
+    call, which dominated render time; this measures and wraps with the
+    cached width tables instead and draws each line with one ``text()``.
+    Text must already be passed through ``_pdf_text``.
+    """
+
+    def __init__(self, pdf) -> None:
+        self.pdf = pdf
+        self.style = ""
+        self.size = 10.0
+        self.color = None
+        self._widths = _font_widths("")
+
+    def font(self, style: str, size: float, color) -> None:
+        if style != self.style or size != self.size:
+            self.pdf.set_font(FONT, style, size)
+            self.style, self.size = style, size
+            self._widths = _font_widths(style)
+        if color != self.color:
+            self.pdf.set_text_color(*color)
+            self.color = color
+
+    def width(self, text: str) -> float:
+        return sum(map(self._widths.__getitem__, text)) * self.size / 1000 / _PT_PER_MM
+
+    def put(self, x: float, y: float, w: float, h: float, text: str, align: str = "L") -> None:
+        """Draw one line of text in the box (x, y, w, h), vertically centred like cell()."""
+        if not text:
+            return
+        pad = self.pdf.c_margin
+        if align == "R":
+            x += w - pad - self.width(text)
+        elif align == "C":
+            x += (w - self.width(text)) / 2
+        else:
+            x += pad
+        self.pdf.text(x, y + h / 2 + 0.3 * self.size / _PT_PER_MM, text)
+
+    def wrap(self, text: str, w: float) -> List[str]:
+        """Split text into lines fitting a box of width w, like multi_cell()."""
+        limit = w - 2 * self.pdf.c_margin
+        space = self.width(" ")
+        lines: List[str] = []
+        for paragraph in text.split("\n"):
+            line, line_w = None, 0.0
+            for word in paragraph.split(" "):
+                word_w = self.width(word)
+                if line is not None and line_w + space + word_w <= limit:
+                    line += " " + word
+                    line_w += space + word_w
+                    continue
+                if line is not None:
+                    lines.append(line)
+                while word_w > limit and len(word) > 1:
+                    cut = self._fit(word, limit)
+                    lines.append(word[:cut])
+                    word = word[cut:]
+                    word_w = self.width(word)
+                line, line_w = word, word_w
+            lines.append(line or "")
+        return lines
+
+    def _fit(self, word: str, limit: float) -> int:
+        scale = self.size / 1000 / _PT_PER_MM
+        used = 0.0
+        for i, char in enumerate(word):
+            used += self._widths[char] * scale
+            if used > limit:
+                return max(1, i)
+        return len(word)
+
+    def hline(self, y: float, x1: float = MARGIN, x2: float = PAGE_W - MARGIN,
+              thickness: float = 0.3, color=C_LIGHT) -> None:
+        self.pdf.set_draw_color(*color)
+        self.pdf.set_line_width(thickness)
+        self.pdf.line(x1, y, x2, y)
+
+    def fill(self, x: float, y: float, w: float, h: float, color) -> None:
+        self.pdf.set_fill_color(*color)
+        self.pdf.rect(x, y, w, h, style="F")
+
+    def ensure_space(self, h: float) -> bool:
+        """Start a new page if h mm do not fit; returns True if it did."""
+        if self.pdf.get_y() + h > self.pdf.page_break_trigger:
+            self.pdf.add_page()
+            return True
+        return False
+
+
+def _table_header(canvas: _Canvas) -> None:
+    pdf = canvas.pdf
+    y = pdf.get_y()
+    canvas.fill(MARGIN, y, USABLE_W, TABLE_HEADER_H, C_BG)
+    canvas.font("B", 8, C_MID)
+    x = MARGIN
+    for label, w, align in TABLE_COLUMNS:
+        canvas.put(x, y, w, TABLE_HEADER_H, label.upper(), align)
+        x += w
+    y += TABLE_HEADER_H
+    # Separator under header
+    canvas.hline(y, thickness=0.4)
+    pdf.set_xy(MARGIN, y)
+
+
 def generate_quote_pdf(quote_data: dict) -> bytes:
     """Generate a PDF from quote data and return bytes."""
     from fpdf import FPDF
 
-    # ── Layout constants ──────────────────────────────────────────────────────
-    MARGIN = 14
-    PAGE_W = 210  # A4 width mm
-    USABLE_W = PAGE_W - MARGIN * 2  # 182 mm
-
-    # Colour palette
-    C_DARK = (15, 23, 42)       # slate-900
-    C_MID = (100, 116, 139)     # slate-500
-    C_LIGHT = (226, 232, 240)   # slate-200
-    C_BG = (248, 250, 252)      # slate-50
-    C_RED = (220, 38, 38)
-    C_GREEN_BG = (209, 250, 229)
-    C_GREEN_FG = (4, 120, 87)
-    C_BLUE_BG = (219, 234, 254)
-    C_BLUE_FG = (29, 78, 216)
-
     # Status colour
     status = (quote_data.get("status") or "draft").lower()
-    STATUS_COLORS = {
-        "draft":    ((241, 245, 249), (71, 85, 105)),
-        "sent":     (C_BLUE_BG, C_BLUE_FG),
-        "accepted": (C_GREEN_BG, C_GREEN_FG),
-        "rejected": ((254, 226, 226), C_RED),
-    }
     status_bg, status_fg = STATUS_COLORS.get(status, STATUS_COLORS["draft"])
 
     quote_number = quote_data.get("quoteNumber") or str(quote_data.get("id", ""))[:8]
 
     # ── Build PDF ────────────────────────────────────────────────────────────
     pdf = FPDF()
+    pdf.core_fonts_encoding = ENCODING
     pdf.set_margins(MARGIN, MARGIN, MARGIN)
-    pdf.add_page()
     pdf.set_auto_page_break(auto=True, margin=MARGIN)
-
-    def set_color(r, g, b):
-        pdf.set_text_color(r, g, b)
-
-    def hr(thickness=0.3, color=C_LIGHT):
-        pdf.set_draw_color(*color)
-        pdf.set_line_width(thickness)
-        x = MARGIN
-        pdf.line(x, pdf.get_y(), PAGE_W - MARGIN, pdf.get_y())
-        pdf.ln(2)
+    pdf.add_page()
+    canvas = _Canvas(pdf)
+    pdf.set_font(FONT, canvas.style, canvas.size)
 
     # ── HEADER ────────────────────────────────────────────────────────────────
     # "Quotation" title (left)
-    pdf.set_font("Helvetica", "B", 22)
-    set_color(*C_DARK)
-    pdf.cell(USABLE_W * 0.6, 10, "Quotation", ln=False)
-
-    # Status badge (right) — draw a filled rounded rect manually via rect
-    badge_text = status.upper()
-    pdf.set_font("Helvetica", "B", 8)
-    badge_w = pdf.get_string_width(badge_text) + 10
+    y = pdf.get_y()
+    canvas.font("B", 22, C_DARK)
+    canvas.put(MARGIN, y, USABLE_W * 0.6, 10, "Quotation")
+
+    # Status badge (right)
+    badge_text = _pdf_text(status.upper())
+    canvas.font("B", 8, status_fg)
+    badge_w = canvas.width(badge_text) + 10
     badge_h = 7
     badge_x = PAGE_W - MARGIN - badge_w
-    badge_y = pdf.get_y() + 1
-    pdf.set_fill_color(*status_bg)
-    pdf.set_draw_color(*status_bg)
-    pdf.rect(badge_x, badge_y, badge_w, badge_h, style="F")
-    pdf.set_xy(badge_x, badge_y + 1)
-    set_color(*status_fg)
-    pdf.cell(badge_w, badge_h - 2, badge_text, align="C")
-    pdf.ln(11)
+    badge_y = y + 1
+    canvas.fill(badge_x, badge_y, badge_w, badge_h, status_bg)
+    canvas.put(badge_x, badge_y + 1, badge_w, badge_h - 2, badge_text, "C")
+    y = badge_y + 1 + 11
 
     # Quote number sub-line
-    pdf.set_font("Helvetica", "", 10)
-    set_color(*C_MID)
-    pdf.cell(0, 5, quote_number, ln=True)
-    pdf.ln(4)
+    canvas.font("", 10, C_MID)
+    canvas.put(MARGIN, y, USABLE_W, 5, _pdf_text(quote_number))
+    y += 5 + 4
 
-    hr(thickness=0.5)
-    pdf.ln(4)
+    canvas.hline(y, thickness=0.5)
+    y += 2 + 4
 
     # ── INFO GRID ────────────────────────────────────────────────────────────
     info_items = [("Customer", quote_data.get("customerName") or "-")]
@@ -152,127 +333,79 @@ def generate_quote_pdf(quote_data: dict) -> bytes:
     col_w = USABLE_W / len(info_items)
     label_h = 4
     value_h = 6
-
+    x = MARGIN
     for label, value in info_items:
-        x = pdf.get_x()
-        y = pdf.get_y()
-        pdf.set_font("Helvetica", "B", 8)
-        set_color(*C_MID)
-        pdf.cell(col_w, label_h, label.upper(), ln=False)
-        pdf.set_xy(x, y + label_h)
-        pdf.set_font("Helvetica", "", 11)
-        set_color(*C_DARK)
-        pdf.cell(col_w, value_h, str(value), ln=False)
-        pdf.set_xy(x + col_w, y)
-
-    pdf.ln(label_h + value_h + 6)
+        canvas.font("B", 8, C_MID)
+        canvas.put(x, y, col_w, label_h, label.upper())
+        canvas.font("", 11, C_DARK)
+        canvas.put(x, y + label_h, col_w, value_h, _pdf_text(value))
+        x += col_w
+    y += label_h + value_h + 6
 
     # ── LINE ITEMS TABLE ─────────────────────────────────────────────────────
-    COL_NUM = 10
-    COL_QTY = 18
-    COL_PRICE = 35
-    COL_TOTAL = 35
-    COL_DESC = USABLE_W - COL_NUM - COL_QTY - COL_PRICE - COL_TOTAL
-
-    # Table header
-    pdf.set_fill_color(*C_BG)
-    pdf.set_draw_color(*C_LIGHT)
-    pdf.set_line_width(0.2)
-    row_h = 7
-
-    def th(text, w, align="L"):
-        pdf.set_font("Helvetica", "B", 8)
-        set_color(*C_MID)
-        pdf.cell(w, row_h, text.upper(), border=0, align=align, fill=True)
-
-    th("#", COL_NUM, "C")
-    th("Product / Description", COL_DESC)
-    th("Qty", COL_QTY, "C")
-    th("Unit Price", COL_PRICE, "R")
-    th("Total", COL_TOTAL, "R")
-    pdf.ln()
+    pdf.set_xy(MARGIN, y)
+    _table_header(canvas)
 
-    # Separator under header
-    pdf.set_draw_color(*C_LIGHT)
-    pdf.set_line_width(0.4)
-    pdf.line(MARGIN, pdf.get_y(), PAGE_W - MARGIN, pdf.get_y())
-
-    # Table rows
     line_items = quote_data.get("lineItems") or []
     if not line_items:
-        pdf.set_font("Helvetica", "I", 10)
-        set_color(*C_MID)
-        pdf.ln(2)
-        pdf.cell(0, 8, "No line items", align="C", ln=True)
-    else:
-        for idx, li in enumerate(line_items):
-            product_name = li.get("productName") or "-"
-            description = _strip_html(li.get("description") or "")
-            # Description only if different from product name
-            if description == product_name:
-                description = ""
-
-            # Calculate row height (multi-line description)
-            pdf.set_font("Helvetica", "", 10)
-            desc_lines = 0
-            if description:
-                pdf.set_font("Helvetica", "", 8)
-                # Estimate lines needed
-                desc_lines = max(1, len(description) // max(1, int(COL_DESC / 2)))
-
-            row_h_data = max(8, 6 + desc_lines * 4)
-
-            # Alternating row background
-            if idx % 2 == 0:
-                pdf.set_fill_color(255, 255, 255)
-            else:
-                pdf.set_fill_color(*C_BG)
-
-            row_y = pdf.get_y()
-            row_x = MARGIN
-
-            # #
-            pdf.set_xy(row_x, row_y)
-            pdf.set_font("Helvetica", "", 9)
-            set_color(*C_MID)
-            pdf.cell(COL_NUM, row_h_data, str(idx + 1), align="C", fill=True)
-
-            # Product / Description
-            pdf.set_xy(row_x + COL_NUM, row_y)
-            pdf.set_font("Helvetica", "B", 10)
-            set_color(*C_DARK)
-            pdf.multi_cell(COL_DESC, 5, product_name, fill=True)
-            if description:
-                desc_y = pdf.get_y()
-                pdf.set_xy(row_x + COL_NUM, desc_y)
-                pdf.set_font("Helvetica", "", 8)
-                set_color(*C_MID)
-                pdf.multi_cell(COL_DESC, 4, description, fill=True)
-
-            cell_bottom = pdf.get_y()
-
-            # Qty
-            pdf.set_xy(row_x + COL_NUM + COL_DESC, row_y)
-            pdf.set_font("Helvetica", "", 10)
-            set_color(*C_MID)
-            pdf.cell(COL_QTY, cell_bottom - row_y, str(li.get("quantity", 0)), align="C", fill=True)
-
-            # Unit Price
-            pdf.set_xy(row_x + COL_NUM + COL_DESC + COL_QTY, row_y)
-            set_color(*C_DARK)
-            pdf.cell(COL_PRICE, cell_bottom - row_y, _format_inr_pdf(li.get("unitPrice", 0)), align="R", fill=True)
-
-            # Total
-            pdf.set_xy(row_x + COL_NUM + COL_DESC + COL_QTY + COL_PRICE, row_y)
-            pdf.set_font("Helvetica", "B", 10)
-            pdf.cell(COL_TOTAL, cell_bottom - row_y, _format_inr_pdf(li.get("lineTotal", 0)), align="R", fill=True)
-
-            pdf.set_xy(MARGIN, cell_bottom)
-
-            # Row bottom border
-            pdf.set_draw_color(*C_LIGHT)
-            pdf.set_line_width(0.2)
-            pdf.line(MARGIN, cell_bottom, PAGE_W - MARGIN, cell_bottom)
+        canvas.font("I", 10, C_MID)
+        y = pdf.get_y() + 2
+        canvas.put(MARGIN, y, USABLE_W, 8, "No line items", "C")
+        pdf.set_xy(MARGIN, y + 8)
+    for idx, li in enumerate(line_items):
+        product_name = _pdf_text(li.get("productName") or "-")
+        description = _pdf_text(_strip_html(li.get("description") or ""))
+        # Description only if different from product name
+        if description == product_name:
+            description = ""
+
+        canvas.font("B", 10, C_DARK)
+        name_lines = canvas.wrap(product_name, COL_DESC)
+        desc_lines: List[str] = []
+        if description:
+            canvas.font("", 8, C_MID)
+            desc_lines = canvas.wrap(description, COL_DESC)
+        row_h = len(name_lines) * NAME_LINE_H + len(desc_lines) * DESC_LINE_H
+
+        if canvas.ensure_space(row_h):
+            _table_header(canvas)
+        row_y = pdf.get_y()
+
+        # Alternating row background
+        if idx % 2:
+            canvas.fill(MARGIN, row_y, USABLE_W, row_h, C_BG)
+
+        x = MARGIN
+        canvas.font("", 9, C_MID)
+        canvas.put(x, row_y, COL_NUM, row_h, str(idx + 1), "C")
+        x += COL_NUM
+
+        # Product / Description
+        line_y = row_y
+        canvas.font("B", 10, C_DARK)
+        for line in name_lines:
+            canvas.put(x, line_y, COL_DESC, NAME_LINE_H, line)
+            line_y += NAME_LINE_H
+        if desc_lines:
+            canvas.font("", 8, C_MID)
+            for line in desc_lines:
+                canvas.put(x, line_y, COL_DESC, DESC_LINE_H, line)
+                line_y += DESC_LINE_H
+        x += COL_DESC
+
+        canvas.font("", 10, C_MID)
+        canvas.put(x, row_y, COL_QTY, row_h, _pdf_text(li.get("quantity", 0)), "C")
+        x += COL_QTY
+        canvas.font("", 10, C_DARK)
+        canvas.put(x, row_y, COL_PRICE, row_h, _format_inr_pdf(li.get("unitPrice", 0)), "R")
+        x += COL_PRICE
+        canvas.font("B", 10, C_DARK)
+        canvas.put(x, row_y, COL_TOTAL, row_h, _format_inr_pdf(li.get("lineTotal", 0)), "R")
+
+        # Row bottom border
+        cell_bottom = row_y + row_h
+        canvas.hline(cell_bottom, thickness=0.2)
+        pdf.set_xy(MARGIN, cell_bottom)
 
     pdf.ln(6)
 
@@ -280,15 +413,16 @@ def generate_quote_pdf(quote_data: dict) -> bytes:
     totals_x = PAGE_W - MARGIN - 75
     totals_w_label = 40
     totals_w_value = 35
+    total_h = 7
 
     def total_row(label, value, bold=False, color=C_DARK, label_color=C_MID):
-        pdf.set_xy(totals_x, pdf.get_y())
-        pdf.set_font("Helvetica", "", 10)
-        set_color(*label_color)
-        pdf.cell(totals_w_label, 7, label, align="L")
-        pdf.set_font("Helvetica", "B" if bold else "", 10)
-        set_color(*color)
-        pdf.cell(totals_w_value, 7, value, align="R", ln=True)
+        canvas.ensure_space(total_h)
+        y = pdf.get_y()
+        canvas.font("", 10, label_color)
+        canvas.put(totals_x, y, totals_w_label, total_h, label)
+        canvas.font("B" if bold else "", 10, color)
+        canvas.put(totals_x + totals_w_label, y, totals_w_value, total_h, value, "R")
+        pdf.set_xy(MARGIN, y + total_h)
 
     total_row("Subtotal", _format_inr_pdf(quote_data.get("subtotal", 0)))
 
@@ -297,12 +431,11 @@ def generate_quote_pdf(quote_data: dict) -> bytes:
         total_row("Discount", f"-{_format_inr_pdf(discount)}", color=C_RED)
 
     tax_rate = quote_data.get("taxRate", 18)
-    total_row(f"Tax ({tax_rate}%)", _format_inr_pdf(quote_data.get("taxAmount", 0)))
+    total_row(_pdf_text(f"Tax ({tax_rate}%)"), _format_inr_pdf(quote_data.get("taxAmount", 0)))
 
     # Divider before grand total
-    pdf.set_draw_color(*C_LIGHT)
-    pdf.set_line_width(0.4)
-    pdf.line(totals_x, pdf.get_y() + 1, PAGE_W - MARGIN, pdf.get_y() + 1)
+    canvas.ensure_space(3 + total_h)
+    canvas.hline(pdf.get_y() + 1, x1=totals_x, thickness=0.4)
     pdf.ln(3)
     total_row("Total", _format_inr_pdf(quote_data.get("totalAmount", 0)), bold=True, color=C_DARK, label_color=C_DARK)
 
@@ -312,25 +445,27 @@ def generate_quote_pdf(quote_data: dict) -> bytes:
     terms = quote_data.get("terms") or ""
     notes = quote_data.get("notes") or ""
 
+    def text_block(title: str, body: str) -> None:
+        canvas.ensure_space(5 * 2)
+        canvas.font("B", 9, C_MID)
+        canvas.put(MARGIN, pdf.get_y(), USABLE_W, 5, title)
+        pdf.ln(5)
+        canvas.font("", 9, C_DARK)
+        for line in canvas.wrap(_pdf_text(_strip_html(body)), USABLE_W):
+            canvas.ensure_space(5)
+            canvas.put(MARGIN, pdf.get_y(), USABLE_W, 5, line)
+            pdf.ln(5)
+
     if terms or notes:
-        hr()
-        pdf.ln(2)
+        canvas.ensure_space(4)
+        canvas.hline(pdf.get_y())
+        pdf.ln(2 + 2)
 
         if terms:
-            pdf.set_font("Helvetica", "B", 9)
-            set_color(*C_MID)
-            pdf.cell(0, 5, "TERMS & CONDITIONS", ln=True)
-            pdf.set_font("Helvetica", "", 9)
-            set_color(*C_DARK)
-            pdf.multi_cell(0, 5, _strip_html(terms))
+            text_block("TERMS & CONDITIONS", terms)
             pdf.ln(4)
 
         if notes:
-            pdf.set_font("Helvetica", "B", 9)
-            set_color(*C_MID)
-            pdf.cell(0, 5, "NOTES", ln=True)
-            pdf.set_font("Helvetica", "", 9)
-            set_color(*C_DARK)
-            pdf.multi_cell(0, 5, _strip_html(notes))
+            text_block("NOTES", notes)
 
     return bytes(pdf.output())
@@ -0,0 +1,57 @@
+"""
+Background PDF rendering.
+
+fpdf2 rendering is CPU-bound, so it runs on a process pool
+(``PDF_RENDER_WORKERS`` processes; 0 falls back to a single thread for
+hosts that cannot start child processes) instead of on the event loop.
+
+Render jobs are scheduled on ``pdf_jobs`` (see ``background_jobs``): they
+start once the request's transaction commits, and jobs for the same quote
+run one after another, so the last committed change is rendered last.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from app.config import settings
+from app.utils.background_jobs import JobQueue
+from app.utils.pdf_generator import generate_quote_pdf
+
+_render_executor: Optional[Executor] = None
+
+
+def _get_executor() -> Executor:
+    global _render_executor
+    if _render_executor is None:
+        if settings.PDF_RENDER_WORKERS > 0:
+            # spawn: forking a process that runs an event loop and DB pool is unsafe
+            _render_executor = ProcessPoolExecutor(
+                max_workers=settings.PDF_RENDER_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            _render_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="pdf-render"
+            )
+    return _render_executor
+
+
+def shutdown_render_pool() -> None:
+    """Stop the render workers (called on application shutdown)."""
+    global _render_executor
+    if _render_executor is not None:
+        _render_executor.shutdown(wait=False, cancel_futures=True)
+        _render_executor = None
+
+
+async def render_quote_pdf(quote_data: Dict[str, Any]) -> bytes:
+    """Render a quote PDF on the render pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), generate_quote_pdf, quote_data)
+
+
+pdf_jobs = JobQueue("pdf")
@@ -96,8 +96,10 @@ def paginated_response(
     data: List[Any],
     page: int,
     limit: int,
-    total: int,
+    total: Optional[int],
     message: str = "Success",
+    next_cursor: Optional[str] = None,
+    total_estimated: bool = False,
 ) -> Dict[str, Any]:
     """
     Create a standardized paginated response.
@@ -106,8 +108,10 @@ def paginated_response(
         data: List of items for current page
         page: Current page number
         limit: Items per page
-        total: Total number of items across all pages
+        total: Total number of items across all pages (None when not counted)
         message: Success message
+        next_cursor: Keyset cursor of the next page (None on the last page)
+        total_estimated: Whether ``total`` is a planner estimate
         
     Returns:
         Dictionary with data and pagination metadata
@@ -122,17 +126,23 @@ def paginated_response(
                 "page": 1,
                 "limit": 20,
                 "total": 100,
-                "totalPages": 5
+                "totalPages": 5,
+                "nextCursor": "...",
+                "totalEstimated": false
             }
         }
     """
-    total_pages = (total + limit - 1) // limit if limit > 0 else 0
+    total_pages = None
+    if total is not None:
+        total_pages = (total + limit - 1) // limit if limit > 0 else 0
     
     pagination = PaginationMeta(
         page=page,
         limit=limit,
         total=total,
         total_pages=total_pages,
+        next_cursor=next_cursor,
+        total_estimated=total_estimated,
     )
     
     return success_response(
@@ -1,15 +1,134 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, Dict, FrozenSet, List, Optional, Set
 
-from sqlalchemy import text
+from sqlalchemy import Select, event, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.exceptions import ForbiddenException
 from app.models.user import User
+from app.models.user_hierarchy_closure import UserHierarchyClosure
 
 ADMIN_ROLES = ("admin", "superadmin")
 
+_STALE_KEY = "org_index_stale"
+
+
+class OrgHierarchyIndex:
+    """In-memory manager → subordinates closure over ``users.manager_id``.
+
+    The whole edge list is loaded once (one cheap scan of ``users``) and
+    each manager's transitive team is computed on first use and memoized,
+    so scoping is a dict lookup instead of a recursive CTE per call.
+
+    The index is dropped when AdminService changes a user's manager or
+    role (deferred until commit), and also expires after
+    ``ORG_INDEX_TTL_SECONDS`` so other worker processes pick up changes.
+    Each drop bumps a generation counter: a load or memoized team that
+    started before the drop serves only its own caller and is not kept.
+    """
+
+    def __init__(self, ttl_seconds: int = 300):
+        self.ttl_seconds = ttl_seconds
+        self._children: Optional[Dict[str, List[str]]] = None
+        self._teams: Dict[str, FrozenSet[str]] = {}
+        self._team_lists: Dict[str, List[str]] = {}
+        self._loaded_at = 0.0
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._children is not None
+            and time.monotonic() - self._loaded_at < self.ttl_seconds
+        )
+
+    async def _ensure_loaded(self, db: AsyncSession) -> Dict[str, List[str]]:
+        if self._is_fresh():
+            return self._children  # type: ignore[return-value]
+        async with self._lock:
+            if self._is_fresh():
+                return self._children  # type: ignore[return-value]
+            generation = self._generation
+            result = await db.execute(
+                text("SELECT id, manager_id FROM users WHERE manager_id IS NOT NULL")
+            )
+            children: Dict[str, List[str]] = defaultdict(list)
+            for uid, manager_id in result.all():
+                children[str(manager_id)].append(str(uid))
+            loaded = dict(children)
+            if generation == self._generation:
+                self._children = loaded
+                self._teams = {}
+                self._team_lists = {}
+                self._loaded_at = time.monotonic()
+        return loaded
+
+    def _closure(self, children: Dict[str, List[str]], user_id: str) -> FrozenSet[str]:
+        # Iterative DFS; the seen-set also guards against manager_id cycles
+        seen: Set[str] = {user_id}
+        stack = [user_id]
+        while stack:
+            for child in children.get(stack.pop(), ()):
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+        return frozenset(seen)
+
+    async def team_ids(self, user_id: str, db: AsyncSession) -> FrozenSet[str]:
+        """Return ``user_id`` plus all direct and indirect subordinates."""
+        children = await self._ensure_loaded(db)
+        current = children is self._children
+        team = self._teams.get(user_id) if current else None
+        if team is None:
+            team = self._closure(children, user_id)
+            if current:
+                self._teams[user_id] = team
+        return team
+
+    async def team_id_list(self, user_id: str, db: AsyncSession) -> List[str]:
+        """Same as ``team_ids`` as a list, for ``column.in_()`` filters."""
+        generation = self._generation
+        team = await self.team_ids(user_id, db)
+        current = generation == self._generation and self._children is not None
+        team_list = self._team_lists.get(user_id) if current else None
+        if team_list is None:
+            team_list = sorted(team - {user_id}) + [user_id]
+            if current:
+                self._team_lists[user_id] = team_list
+        return list(team_list)
+
+    def invalidate(self) -> None:
+        """Drop the index; the next lookup reloads it."""
+        self._generation += 1
+        self._children = None
+        self._teams = {}
+        self._team_lists = {}
+        self._loaded_at = 0.0
+
+    def invalidate_after_commit(self, db: AsyncSession) -> None:
+        """Drop the index once the session's transaction commits."""
+        db.sync_session.info[_STALE_KEY] = True
+
+
+org_index = OrgHierarchyIndex(ttl_seconds=settings.ORG_INDEX_TTL_SECONDS)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_org_index_on_commit(session: Session) -> None:
+    if session.info.pop(_STALE_KEY, False):
+        org_index.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_org_index_on_rollback(session: Session) -> None:
+    session.info.pop(_STALE_KEY, None)
+
 
 async def get_scoped_user_ids(
     user: User, db: AsyncSession
@@ -23,26 +142,32 @@ async def get_scoped_user_ids(
     if user.role in ADMIN_ROLES:
         return None
 
-    # Recursive CTE: find all subordinates at every level of the
-    # manager_id chain.  Works for any role — if the user has people
-    # assigned under them (directly or transitively) they see those
-    # records.  If not, the CTE simply returns nothing and the user
-    # sees only their own records.
-    result = await db.execute(
-        text("""
-            WITH RECURSIVE subordinates AS (
-                SELECT id FROM users WHERE manager_id = :uid
-                UNION ALL
-                SELECT u.id FROM users u
-                INNER JOIN subordinates s ON u.manager_id = s.id
-            )
-            SELECT id FROM subordinates
-        """),
-        {"uid": str(user.id)},
+    # Works for any role — if the user has people assigned under them
+    # (directly or transitively) they see those records.  If not, the
+    # team is just the user and they see only their own records.
+    return await org_index.team_id_list(str(user.id), db)
+
+
+def scoped_user_subquery(user: User) -> Optional[Select]:
+    """Return a ``SELECT descendant_id`` over the closure table, or None for unrestricted.
+
+    Use as ``column.in_(subquery)``: Postgres plans it as a semi-join on
+    one bound user id, however large the team is, instead of binding the
+    whole team as an IN-list.
+    """
+    if user.role in ADMIN_ROLES:
+        return None
+    return select(UserHierarchyClosure.descendant_id).where(
+        UserHierarchyClosure.ancestor_id == user.id
     )
-    team_ids: List[str] = [str(row[0]) for row in result.all()]
-    team_ids.append(str(user.id))
-    return team_ids
+
+
+def scope_filter(column: Any, user: User) -> Optional[Any]:
+    """Return ``column IN (<user's team>)`` as a semi-join, or None for unrestricted."""
+    subquery = scoped_user_subquery(user)
+    if subquery is None:
+        return None
+    return column.in_(subquery)
 
 
 async def enforce_scope(
@@ -54,8 +179,9 @@ async def enforce_scope(
     resource_name: str = "resource",
 ) -> None:
     """Raise ForbiddenException if user doesn't have access to this entity."""
-    scoped_ids = await get_scoped_user_ids(user, db)
-    if scoped_ids is not None:
-        entity_owner = getattr(entity, owner_field, None)
-        if entity_owner is None or str(entity_owner) not in [str(s) for s in scoped_ids]:
-            raise ForbiddenException(f"You don't have access to this {resource_name}")
+    if user.role in ADMIN_ROLES:
+        return
+    team = await org_index.team_ids(str(user.id), db)
+    entity_owner = getattr(entity, owner_field, None)
+    if entity_owner is None or str(entity_owner) not in team:
+        raise ForbiddenException(f"You don't have access to this {resource_name}")
@@ -0,0 +1,70 @@
+"""
+Incremental ZIP writer for streamed downloads.
+
+``zipfile`` writes data descriptors instead of seeking back when its target
+is not seekable, so the archive can be handed out piece by piece: ``add``
+returns the bytes for one member and ``close`` the central directory.  Only
+the member being added is held in memory.
+"""
+
+from __future__ import annotations
+
+import time
+import zipfile
+from typing import List
+
+
+class _Sink:
+    """Non-seekable file object that collects written bytes until drained."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self._offset = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._offset += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._offset
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ZipStreamWriter:
+    """Build a ZIP archive member by member without buffering the whole archive."""
+
+    def __init__(self, compression: int = zipfile.ZIP_STORED) -> None:
+        self._sink = _Sink()
+        self._zip = zipfile.ZipFile(self._sink, mode="w", compression=compression)
+        self._names: set[str] = set()
+
+    def _unique(self, name: str) -> str:
+        stem, dot, ext = name.rpartition(".")
+        if not dot:
+            stem, ext = name, ""
+        candidate, n = name, 1
+        while candidate in self._names:
+            n += 1
+            candidate = f"{stem} ({n}){dot}{ext}"
+        self._names.add(candidate)
+        return candidate
+
+    def add(self, name: str, data: bytes) -> bytes:
+        """Add a member (renamed if the name is taken) and return its archive bytes."""
+        info = zipfile.ZipInfo(self._unique(name), date_time=time.localtime()[:6])
+        info.compress_type = self._zip.compression
+        self._zip.writestr(info, data)
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        """Finish the archive and return the trailing central directory."""
+        self._zip.close()
+        return self._sink.drain()
@@ -3,7 +3,10 @@
 import asyncio
 import bcrypt
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.services.user_hierarchy_service import UserHierarchyService
+from app.utils.scoping import org_index
 
 
 def hash_password(password: str) -> str:
@@ -16,10 +19,12 @@ async def create_admin_users():
     # Connect to local database
     engine = create_async_engine("postgresql+asyncpg://localhost:5432/comprint_crm")
 
-    async with engine.begin() as conn:
+    async with AsyncSession(engine) as session, session.begin():
+        hierarchy = UserHierarchyService(session)
+
         # Create superadmin (full access to everything)
         superadmin_password = hash_password("superadmin123")
-        await conn.execute(
+        result = await session.execute(
             text(
                 """
             INSERT INTO users (email, password_hash, name, role, view_access, is_active)
@@ -29,6 +34,7 @@ async def create_admin_users():
                 role = EXCLUDED.role,
                 view_access = EXCLUDED.view_access,
                 is_active = EXCLUDED.is_active
+            RETURNING id, manager_id
         """
             ),
             {
@@ -40,11 +46,13 @@ async def create_admin_users():
                 "is_active": True,
             },
         )
+        # Scoping semi-joins on the closure table: every user needs its self-row
+        await hierarchy.add_user(*result.one())
         print("✓ Created/Updated Superadmin: superadmin@comprint.com / superadmin123")
 
         # Create admin (has both views but may have some restrictions in future)
         admin_password = hash_password("admin123")
-        await conn.execute(
+        result = await session.execute(
             text(
                 """
             INSERT INTO users (email, password_hash, name, role, view_access, is_active)
@@ -54,6 +62,7 @@ async def create_admin_users():
                 role = EXCLUDED.role,
                 view_access = EXCLUDED.view_access,
                 is_active = EXCLUDED.is_active
+            RETURNING id, manager_id
         """
             ),
             {
@@ -65,10 +74,11 @@ async def create_admin_users():
                 "is_active": True,
             },
         )
+        await hierarchy.add_user(*result.one())
         print("✓ Created/Updated Admin: admin@comprint.com / admin123")
 
         # Update existing admin@gmail.com to admin role
-        await conn.execute(
+        await session.execute(
             text(
                 """
             UPDATE users
@@ -79,9 +89,10 @@ async def create_admin_users():
             )
         )
         print("✓ Updated admin@gmail.com to admin role with both access")
+        org_index.invalidate_after_commit(session)
 
         # Display all admin users
-        result = await conn.execute(
+        result = await session.execute(
             text(
                 """
             SELECT email, name, role, view_access, is_active
@@ -0,0 +1,113 @@
+"""
+Benchmark BaseRepository.bulk_create / bulk_update against the per-row versions
+
+Inserts 1k / 10k / 100k throwaway products and then updates all of them, once
+with the previous per-row implementations (flush + one refresh per object,
+one UPDATE per row) and once with the set-based repository methods
+(INSERT ... RETURNING, UPDATE ... FROM (VALUES ...)).  Reports wall time and
+the number of statements sent to the database (round trips).
+
+Everything runs in one transaction that is rolled back, so nothing is
+persisted.
+
+Usage:
+    poetry run python scripts/benchmark_bulk_repository.py
+    poetry run python scripts/benchmark_bulk_repository.py --sizes 1000 10000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import event, update
+
+from app.database import async_session, engine
+from app.models.product import Product
+from app.repositories.base import BaseRepository
+
+
+class _StatementCounter:
+    """Counts statements executed on the engine (executemany counts once)."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args) -> None:
+        self.count += 1
+
+
+async def _legacy_bulk_create(session, items: list[dict]) -> list[Product]:
+    objs = [Product(**item) for item in items]
+    session.add_all(objs)
+    await session.flush()
+    for obj in objs:
+        await session.refresh(obj)
+    return objs
+
+
+async def _legacy_bulk_update(session, updates: list[dict]) -> int:
+    count = 0
+    for update_data in updates:
+        entity_id = update_data.pop("id")
+        result = await session.execute(
+            update(Product).where(Product.id == entity_id).values(**update_data)
+        )
+        count += result.rowcount
+    await session.flush()
+    return count
+
+
+async def _measure(counter: _StatementCounter, operation) -> tuple[float, int, object]:
+    counter.count = 0
+    start = time.perf_counter()
+    result = await operation
+    return time.perf_counter() - start, counter.count, result
+
+
+async def main(sizes: list[int]) -> None:
+    counter = _StatementCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+    print(f"{'rows':>8}  {'operation':<9} {'per-row':>22}  {'set-based':>22}")
+    async with async_session() as session:
+        try:
+            repo = BaseRepository(session, Product)
+            for size in sizes:
+                items = [
+                    {"name": f"Benchmark Product {i}", "category": "Benchmark", "base_price": i}
+                    for i in range(size)
+                ]
+                old_create = await _measure(counter, _legacy_bulk_create(session, items))
+                new_create = await _measure(counter, repo.bulk_create(items))
+
+                changes = [{"base_price": i + 1, "stock": i} for i in range(size)]
+                old_rows = [{"id": obj.id, **change} for obj, change in zip(old_create[2], changes)]
+                new_rows = [{"id": obj.id, **change} for obj, change in zip(new_create[2], changes)]
+                old_update = await _measure(counter, _legacy_bulk_update(session, old_rows))
+                new_update = await _measure(counter, repo.bulk_update(new_rows))
+                assert old_update[2] == new_update[2] == size
+
+                results = (("create", old_create, new_create), ("update", old_update, new_update))
+                for name, old, new in results:
+                    print(
+                        f"{size:>8}  {name:<9} "
+                        f"{old[0] * 1000:10.0f} ms {old[1]:>7} stmts  "
+                        f"{new[0] * 1000:10.0f} ms {new[1]:>7} stmts"
+                    )
+                session.expunge_all()
+        finally:
+            await session.rollback()
+    event.remove(engine.sync_engine, "before_cursor_execute", counter)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes))
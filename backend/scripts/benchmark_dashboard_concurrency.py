@@ -0,0 +1,95 @@
+"""
+Benchmark sequential vs. concurrent dashboard query groups
+
+Times DashboardService.get_dashboard_all and get_my_summary for one user with
+DASHBOARD_QUERY_CONCURRENCY=1 (every query in turn on the request session)
+and with each given concurrency (independent query groups spread over the
+request session and concurrency - 1 pooled connections; under NullPool,
+e.g. on Supabase, every level runs sequentially).  The payload cache is
+bypassed and both strategies must return the same payload.
+
+Read-only: run it against a seeded database (``seed_data.py`` followed by
+``rebuild_dashboard_rollups.py``).
+
+Usage:
+    poetry run python scripts/benchmark_dashboard_concurrency.py
+    poetry run python scripts/benchmark_dashboard_concurrency.py --email sales1@comprint.com
+    poetry run python scripts/benchmark_dashboard_concurrency.py --concurrency 2 4 8 --iterations 50
+"""
+
+import argparse
+import asyncio
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import select
+
+from app.config import settings
+from app.database import async_session, engine
+from app.models.user import User
+from app.services.dashboard_service import DashboardService
+
+
+async def _load_user(session, email: str | None) -> User:
+    stmt = select(User).where(User.is_active.is_(True))
+    if email:
+        stmt = stmt.where(User.email == email)
+    else:
+        stmt = stmt.where(User.role.in_(("admin", "superadmin"))).order_by(User.created_at)
+    user = (await session.execute(stmt.limit(1))).scalar_one_or_none()
+    if user is None:
+        raise SystemExit(f"No active user {email or 'with an admin role'}; run seed_data.py first")
+    return user
+
+
+async def _time(view, iterations: int) -> tuple[list[float], dict]:
+    payload = await view()  # warm up pool connections / plan cache
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await view()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples, payload
+
+
+def _summary(samples: list[float]) -> str:
+    p95 = sorted(samples)[min(len(samples) - 1, math.ceil(len(samples) * 0.95) - 1)]
+    return f"mean {statistics.mean(samples):8.2f} ms  p95 {p95:8.2f} ms"
+
+
+async def main(email: str | None, levels: list[int], iterations: int) -> None:
+    async with async_session() as session:
+        user = await _load_user(session, email)
+        service = DashboardService(session)
+        views = {
+            "all": lambda: service.get_dashboard_all(user),
+            "my-summary": lambda: service.get_my_summary(user),
+        }
+        print(f"user {user.email} ({user.role}), {iterations} runs each")
+        print(f"{'view':<11} {'concurrency':>11}  timings")
+        for name, view in views.items():
+            baseline = None
+            for level in [1, *levels]:
+                settings.DASHBOARD_QUERY_CONCURRENCY = level
+                samples, payload = await _time(view, iterations)
+                if baseline is None:
+                    baseline = payload
+                assert payload == baseline, f"{name} payload differs at concurrency {level}"
+                print(f"{name:<11} {level:>11}  {_summary(samples)}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--email", help="User whose dashboard is timed (default: first admin)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[4, 8])
+    parser.add_argument("--iterations", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(main(args.email, args.concurrency, args.iterations))
@@ -0,0 +1,105 @@
+"""
+Benchmark OFFSET vs. keyset (cursor) pagination of the leads list
+
+Inserts enough throwaway leads for 5000 pages inside a transaction, then
+times the leads list page query (same statement as
+LeadRepository.get_with_assigned) at page 1 and at page 5000:
+
+- offset: ORDER BY created_at DESC, id DESC OFFSET (page - 1) * limit
+- keyset: WHERE (created_at, id) < (cursor) ORDER BY created_at DESC, id DESC
+
+Run it after ``alembic upgrade head`` so the keyset indexes exist.  The
+transaction is rolled back at the end, so nothing is persisted.
+
+Usage:
+    poetry run python scripts/benchmark_keyset_pagination.py
+    poetry run python scripts/benchmark_keyset_pagination.py --pages 1 100 5000 --iterations 50
+"""
+
+import argparse
+import asyncio
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import select, text
+
+from app.database import async_session, engine
+from app.models.lead import Lead
+from app.models.user import User
+from app.repositories.lead_repository import LIST_KEYSET
+
+
+def _page_stmt():
+    return select(Lead, User.name.label("assigned_to_name")).outerjoin(
+        User, Lead.assigned_to == User.id
+    )
+
+
+async def _time(session, stmt, iterations: int) -> list[float]:
+    for _ in range(3):  # warm up plan cache / buffers
+        await session.execute(stmt)
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await session.execute(stmt)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _summary(samples: list[float]) -> str:
+    p95 = sorted(samples)[min(len(samples) - 1, math.ceil(len(samples) * 0.95) - 1)]
+    return f"mean {statistics.mean(samples):8.3f} ms  p95 {p95:8.3f} ms"
+
+
+async def main(pages: list[int], limit: int, iterations: int) -> None:
+    rows = max(pages) * limit
+    async with async_session() as session:
+        try:
+            await session.execute(
+                text(
+                    "INSERT INTO leads (company_name, stage, created_at) "
+                    "SELECT 'Benchmark Lead ' || g, 'New', now() - g * interval '1 second' "
+                    "FROM generate_series(1, :rows) AS g"
+                ),
+                {"rows": rows},
+            )
+            await session.execute(text("ANALYZE leads"))
+
+            print(f"{'page':>6}  {'strategy':<7} timings ({iterations} runs, {limit} rows/page)")
+            for page in pages:
+                offset_stmt = LIST_KEYSET.paginate(_page_stmt(), page, limit)
+                cursor = None
+                if page > 1:
+                    # The cursor a client holds after reading page - 1
+                    previous = LIST_KEYSET.paginate(_page_stmt(), page - 1, limit)
+                    _rows, cursor = LIST_KEYSET.split(
+                        (await session.execute(previous)).all(), limit
+                    )
+                keyset_stmt = LIST_KEYSET.paginate(_page_stmt(), page, limit, cursor)
+
+                a = [row[0].id for row in (await session.execute(offset_stmt)).all()]
+                b = [row[0].id for row in (await session.execute(keyset_stmt)).all()]
+                assert a == b, f"strategies disagree on page {page}"
+
+                for name, stmt in (("offset", offset_stmt), ("keyset", keyset_stmt)):
+                    samples = await _time(session, stmt, iterations)
+                    print(f"{page:>6}  {name:<7} {_summary(samples)}")
+        finally:
+            await session.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 5000])
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.pages, args.limit, args.iterations))
@@ -0,0 +1,94 @@
+"""
+Login-storm benchmark for password hashing
+
+Fires a burst of concurrent password verifications (the bcrypt part of a
+login) while a probe coroutine stands in for other API requests, ticking
+every few milliseconds and recording how late each tick is.  Runs twice:
+
+- inline: bcrypt.checkpw called directly on the event loop (old behaviour)
+- pool:   verify_password_async on the bounded hashing pool
+
+With the pool, probe p99 should stay near the tick interval regardless of
+the burst; inline, every tick waits behind a full bcrypt round.  No
+database is needed.
+
+Usage:
+    poetry run python scripts/benchmark_password_hashing.py
+    poetry run python scripts/benchmark_password_hashing.py --logins 100 --rounds 12
+"""
+
+import argparse
+import asyncio
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import bcrypt
+
+from app.config import settings
+from app.exceptions import ServiceUnavailableException
+from app.services.auth_service import _verify_password, verify_password_async
+
+PROBE_INTERVAL = 0.005  # seconds between probe "requests"
+
+
+async def _probe(stop: asyncio.Event, lags: list[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append((time.perf_counter() - start - PROBE_INTERVAL) * 1000)
+
+
+async def _inline_login(password: str, password_hash: str) -> bool:
+    return _verify_password(password, password_hash)
+
+
+async def _run(mode: str, logins: int, password_hash: str) -> None:
+    login = verify_password_async if mode == "pool" else _inline_login
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(stop, lags))
+    await asyncio.sleep(0.05)  # baseline ticks
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(login("password123", password_hash) for _ in range(logins)),
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await probe
+    rejected = sum(isinstance(r, ServiceUnavailableException) for r in results)
+    lags.sort()
+    p99 = lags[min(len(lags) - 1, math.ceil(len(lags) * 0.99) - 1)]  # nearest rank
+    print(
+        f"{mode:<7} burst {elapsed * 1000:8.1f} ms  "
+        f"probe ticks {len(lags):5d}  p50 lag {statistics.median(lags):7.2f} ms  "
+        f"p99 lag {p99:7.2f} ms  max {lags[-1]:7.2f} ms  rejected {rejected}"
+    )
+
+
+async def main(logins: int, rounds: int) -> None:
+    password_hash = bcrypt.hashpw(b"password123", bcrypt.gensalt(rounds=rounds)).decode()
+    print(
+        f"{logins} concurrent logins, bcrypt cost {rounds}, "
+        f"{settings.PASSWORD_HASH_WORKERS} hash workers, "
+        f"max pending {settings.PASSWORD_HASH_MAX_PENDING}"
+    )
+    await _run("inline", logins, password_hash)
+    await _run("pool", logins, password_hash)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=settings.BCRYPT_ROUNDS)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.rounds))
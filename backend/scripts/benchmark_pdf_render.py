@@ -0,0 +1,88 @@
+"""
+Micro-benchmark for quote PDF rendering
+
+Renders synthetic quotes with 1, 50 and 500 line items (HTML descriptions,
+terms and notes included) through generate_quote_pdf in this process and
+reports per-render latency.  No database is needed.
+
+Usage:
+    poetry run python scripts/benchmark_pdf_render.py
+    poetry run python scripts/benchmark_pdf_render.py --sizes 1 50 500 --iterations 20
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.utils.pdf_generator import generate_quote_pdf
+
+TERMS = (
+    "<p>1. Payment within <b>30 days</b> of invoice.</p>"
+    "<ul><li>Prices exclude freight &amp; insurance.</li>"
+    "<li>Delivery within 2&ndash;3 weeks of PO.</li></ul>"
+    "<p>2. Warranty as per manufacturer terms.</p>"
+)
+
+
+def _quote(line_items: int) -> dict:
+    return {
+        "id": "00000000-0000-0000-0000-000000000000",
+        "quoteNumber": "QT-0001",
+        "status": "sent",
+        "createdAt": "2026-01-15T10:00:00",
+        "validUntil": "2026-02-15",
+        "customerName": "Benchmark Industries Pvt Ltd",
+        "partnerName": "Benchmark Partner",
+        "subtotal": 125000 * line_items,
+        "discountAmount": 5000,
+        "taxRate": 18,
+        "taxAmount": 22500 * line_items,
+        "totalAmount": 147500 * line_items,
+        "terms": TERMS * 3,
+        "notes": "Quoted prices valid for the listed quantities only.",
+        "lineItems": [
+            {
+                "productName": f"Laptop Model {i} (16GB / 512GB SSD)",
+                "description": (
+                    f"<p>Business laptop, configuration {i}, with <b>3 year</b> "
+                    "onsite warranty and preinstalled OS</p>"
+                ),
+                "quantity": 5,
+                "unitPrice": 25000,
+                "lineTotal": 125000,
+            }
+            for i in range(line_items)
+        ],
+    }
+
+
+def main(sizes: list[int], iterations: int) -> None:
+    print(f"{'line items':>10}  {'size':>8}  timings ({iterations} renders)")
+    for size in sizes:
+        quote = _quote(size)
+        pdf = generate_quote_pdf(quote)  # warm up imports and font tables
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            generate_quote_pdf(quote)
+            samples.append((time.perf_counter() - start) * 1000)
+        p95 = sorted(samples)[max(0, int(len(samples) * 0.95) - 1)]
+        print(
+            f"{size:>10}  {len(pdf) / 1024:6.1f}KB  "
+            f"mean {statistics.mean(samples):8.2f} ms  p95 {p95:8.2f} ms  "
+            f"{1000 / statistics.mean(samples):7.1f} renders/s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 50, 500])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    main(args.sizes, args.iterations)
@@ -0,0 +1,119 @@
+"""
+Benchmark IN-list scoping vs. closure-table semi-join scoping
+
+Creates a throwaway manager with 10 / 100 / 1000 subordinates (and a few
+leads each) inside a transaction, then times the same scoped lead count
+with both strategies:
+
+- in-list:   leads.assigned_to IN (:id_1, ..., :id_n)
+- semi-join: leads.assigned_to IN (SELECT descendant_id
+                                   FROM user_hierarchy_closure
+                                   WHERE ancestor_id = :manager)
+
+The transaction is rolled back at the end, so nothing is persisted.
+
+Usage:
+    poetry run python scripts/benchmark_scoping.py
+    poetry run python scripts/benchmark_scoping.py --sizes 10 100 1000 --iterations 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import func, select, text
+
+from app.database import async_session, engine
+from app.models.lead import Lead
+from app.models.user import User
+from app.services.user_hierarchy_service import UserHierarchyService
+from app.utils.scoping import scope_filter
+
+LEADS_PER_USER = 5
+
+
+async def _create_team(session, size: int) -> tuple[User, list[str]]:
+    """Insert a manager with ``size`` direct reports and their leads."""
+    hierarchy = UserHierarchyService(session)
+    run = uuid.uuid4().hex[:8]
+    manager_id = uuid.uuid4()
+    rows = [{"id": manager_id, "email": f"bench-{run}-mgr@example.com", "mgr": None}]
+    rows += [
+        {"id": uuid.uuid4(), "email": f"bench-{run}-{i}@example.com", "mgr": manager_id}
+        for i in range(size)
+    ]
+    await session.execute(
+        text(
+            "INSERT INTO users (id, email, password_hash, name, role, manager_id) "
+            "VALUES (:id, :email, 'x', 'Benchmark User', 'sales', :mgr)"
+        ),
+        rows,
+    )
+    for row in rows:
+        await hierarchy.add_user(row["id"], row["mgr"])
+
+    await session.execute(
+        text(
+            "INSERT INTO leads (company_name, assigned_to, stage) "
+            "VALUES ('Benchmark Lead', :uid, 'New')"
+        ),
+        [{"uid": row["id"]} for row in rows for _ in range(LEADS_PER_USER)],
+    )
+
+    manager = User(id=manager_id, role="manager")
+    team_ids = [str(row["id"]) for row in rows]
+    return manager, team_ids
+
+
+async def _time(session, stmt, iterations: int) -> list[float]:
+    for _ in range(3):  # warm up plan cache / buffers
+        await session.execute(stmt)
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await session.execute(stmt)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _summary(samples: list[float]) -> str:
+    p95 = sorted(samples)[int(len(samples) * 0.95) - 1]
+    return f"mean {statistics.mean(samples):7.3f} ms  p95 {p95:7.3f} ms"
+
+
+async def main(sizes: list[int], iterations: int) -> None:
+    async with async_session() as session:
+        try:
+            print(f"{'subordinates':>12}  {'strategy':<10} timings ({iterations} runs)")
+            for size in sizes:
+                manager, team_ids = await _create_team(session, size)
+                base = select(func.count()).select_from(Lead)
+
+                in_list = base.where(Lead.assigned_to.in_(team_ids))
+                semi_join = base.where(scope_filter(Lead.assigned_to, manager))
+
+                a = (await session.execute(in_list)).scalar_one()
+                b = (await session.execute(semi_join)).scalar_one()
+                assert a == b, f"strategies disagree: {a} != {b}"
+
+                print(f"{size:>12}  {'in-list':<10} {_summary(await _time(session, in_list, iterations))}")
+                print(f"{size:>12}  {'semi-join':<10} {_summary(await _time(session, semi_join, iterations))}")
+        finally:
+            await session.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--iterations", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.iterations))
@@ -0,0 +1,138 @@
+"""
+Benchmark global search with and without the trigram indexes
+
+Inserts throwaway leads, deals, accounts, contacts and sales entries
+(1,000,000 of each by default) owned by one user inside a transaction, then
+times SearchService.search for each term twice:
+
+- trgm: the pg_trgm GIN indexes answer ``ILIKE '%term%'`` (bitmap scans)
+- seq:  ``enable_bitmapscan = off``, so every type is a sequential scan,
+  as it was before the indexes
+
+Run it after ``alembic upgrade head`` so the trigram indexes exist.  The
+transaction is rolled back at the end, so nothing is persisted.
+
+Usage:
+    poetry run python scripts/benchmark_search.py
+    poetry run python scripts/benchmark_search.py --rows 100000 --terms globex "north star" zzqx
+    poetry run python scripts/benchmark_search.py --email sales1@comprint.com --iterations 20
+"""
+
+import argparse
+import asyncio
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import select, text
+
+from app.database import async_session, engine
+from app.models.user import User
+from app.services.search_service import SearchService
+
+# "<word> <word> <n>": 256 distinct name prefixes, every row unique
+_NAME = (
+    "(ARRAY['Acme', 'Globex', 'Initech', 'Umbrella', 'Stark', 'Wayne', 'Hooli', 'Vandelay',"
+    " 'Soylent', 'Tyrell', 'Cyberdyne', 'Wonka', 'Gringotts', 'Nakatomi', 'Oscorp',"
+    " 'Aperture'])[1 + g % 16] || ' ' || "
+    "(ARRAY['Systems', 'Traders', 'Infotech', 'Solutions', 'Industries', 'Networks',"
+    " 'Logistics', 'Labs', 'Retail', 'Exports', 'Pharma', 'Foods', 'Motors', 'Energy',"
+    " 'North Star', 'Holdings'])[1 + (g / 16) % 16] || ' ' || g"
+)
+
+SEED_SQL = {
+    "leads": (
+        "INSERT INTO leads (company_name, contact_person, assigned_to) "
+        f"SELECT {_NAME}, 'Contact ' || g, :owner FROM generate_series(1, :rows) AS g"
+    ),
+    "deals": (
+        "INSERT INTO deals (title, company, owner_id) "
+        f"SELECT {_NAME}, 'Company ' || g, :owner FROM generate_series(1, :rows) AS g"
+    ),
+    "accounts": (
+        "INSERT INTO accounts (name, industry, owner_id) "
+        f"SELECT {_NAME}, 'IT', :owner FROM generate_series(1, :rows) AS g"
+    ),
+    "contacts": (
+        "INSERT INTO contacts (first_name, last_name, email, owner_id) "
+        f"SELECT {_NAME}, 'Person', 'c' || g || '@example.com', :owner "
+        "FROM generate_series(1, :rows) AS g"
+    ),
+    "sales_entries": (
+        "INSERT INTO sales_entries (customer_name, salesperson_id, amount, sale_date) "
+        f"SELECT {_NAME}, :owner, 1000, current_date FROM generate_series(1, :rows) AS g"
+    ),
+}
+
+
+async def _load_user(session, email: str | None) -> User:
+    stmt = select(User).where(User.is_active.is_(True))
+    if email:
+        stmt = stmt.where(User.email == email)
+    else:
+        stmt = stmt.where(User.role.in_(("admin", "superadmin"))).order_by(User.created_at)
+    user = (await session.execute(stmt.limit(1))).scalar_one_or_none()
+    if user is None:
+        raise SystemExit(f"No active user {email or 'with an admin role'}; run seed_data.py first")
+    return user
+
+
+async def _time(search, iterations: int) -> tuple[list[float], list]:
+    hits = await search()  # warm up plan cache / buffers
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await search()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples, hits
+
+
+def _summary(samples: list[float]) -> str:
+    p95 = sorted(samples)[min(len(samples) - 1, math.ceil(len(samples) * 0.95) - 1)]
+    return f"mean {statistics.mean(samples):9.2f} ms  p95 {p95:9.2f} ms"
+
+
+async def main(email: str | None, rows: int, terms: list[str], iterations: int) -> None:
+    async with async_session() as session:
+        try:
+            user = await _load_user(session, email)
+            for table, sql in SEED_SQL.items():
+                start = time.perf_counter()
+                await session.execute(text(sql), {"owner": user.id, "rows": rows})
+                await session.execute(text(f"ANALYZE {table}"))
+                print(f"seeded {rows:,} {table} in {time.perf_counter() - start:.1f} s")
+
+            service = SearchService(session)
+            print(f"\nuser {user.email} ({user.role}), {iterations} runs each")
+            print(f"{'term':<14} {'plan':<5} {'hits':>4}  timings")
+            for term in terms:
+                baseline = None
+                for plan in ("trgm", "seq"):
+                    flag = "on" if plan == "trgm" else "off"
+                    await session.execute(text(f"SET LOCAL enable_bitmapscan = {flag}"))
+                    samples, hits = await _time(
+                        lambda: service.search(term, user, limit=20), iterations
+                    )
+                    if baseline is None:
+                        baseline = hits
+                    assert hits == baseline, f"plans disagree on {term!r}"
+                    print(f"{term:<14} {plan:<5} {len(hits):>4}  {_summary(samples)}")
+        finally:
+            await session.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--email", help="User who searches (default: first admin)")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows per searched table")
+    parser.add_argument("--terms", nargs="+", default=["globex", "north star", "zzqx"])
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.email, args.rows, args.terms, args.iterations))
@@ -0,0 +1,223 @@
+"""
+Replay the hot repository queries with EXPLAIN (ANALYZE, BUFFERS)
+
+Runs the scoped list, kanban, stats, my-summary and search code paths for one user
+through a session that records every statement, then explains each recorded
+statement with its real bind parameters and prints the scans it used
+(index name or Seq Scan), the shared buffers hit/read and the execution time.
+
+``--no-seqscan`` sets ``enable_seqscan = off`` for the transaction: on a
+small development database the planner rightly prefers a sequential scan,
+and this shows whether an index can serve the query shape at all.
+
+Read-only: everything runs in one transaction that is rolled back.  Run it
+after ``alembic upgrade head`` against a seeded database.
+
+Usage:
+    poetry run python scripts/explain_hot_queries.py
+    poetry run python scripts/explain_hot_queries.py --email sales1@comprint.com
+    poetry run python scripts/explain_hot_queries.py --no-seqscan --only leads deals
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.config import settings
+from app.database import async_session, engine
+from app.models.account import Account
+from app.models.calendar_event import CalendarEvent
+from app.models.contact import Contact
+from app.models.deal import Deal
+from app.models.lead import Lead
+from app.models.partner import Partner
+from app.models.sales_entry import SalesEntry
+from app.models.task import Task
+from app.models.user import User
+from app.repositories.account_repository import AccountRepository
+from app.repositories.calendar_event_repository import CalendarEventRepository
+from app.repositories.contact_repository import ContactRepository
+from app.repositories.deal_repository import DealRepository
+from app.repositories.lead_repository import LeadRepository
+from app.repositories.partner_repository import PartnerRepository
+from app.repositories.sales_entry_repository import SalesEntryRepository
+from app.repositories.task_repository import TaskRepository
+from app.services.dashboard_service import DashboardService
+from app.services.search_service import SearchService
+from app.utils.scoping import ADMIN_ROLES, scope_filter
+
+
+class _ExplainAnalyze(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Any):
+        self.statement = statement
+
+
+@compiles(_ExplainAnalyze)
+def _compile_explain(element: _ExplainAnalyze, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + compiler.process(
+        element.statement, **kw
+    )
+
+
+class _RecordingSession:
+    """Session proxy that records every executed statement."""
+
+    def __init__(self, session):
+        self._session = session
+        self.statements: list[tuple[Any, Any]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    async def execute(self, statement, params=None, **kwargs):
+        self.statements.append((statement, params))
+        return await self._session.execute(statement, params, **kwargs)
+
+
+def _cases(user: User) -> dict:
+    """Query groups keyed by name: callables replaying the code path on a session."""
+
+    def scoped(column) -> list | None:
+        scope = scope_filter(column, user)
+        return [scope] if scope is not None else None
+
+    return {
+        "leads": [
+            lambda db: LeadRepository(db).get_with_assigned(filters=scoped(Lead.assigned_to)),
+            lambda db: LeadRepository(db).get_kanban_page(
+                "New", filters=scoped(Lead.assigned_to)
+            ),
+            lambda db: LeadRepository(db).get_stats(filters=scoped(Lead.assigned_to)),
+        ],
+        "deals": [
+            lambda db: DealRepository(db).get_with_names(filters=scoped(Deal.owner_id)),
+            lambda db: DealRepository(db).get_kanban_page(
+                "Proposal", filters=scoped(Deal.owner_id)
+            ),
+            lambda db: DealRepository(db).get_pipeline_stats(filters=scoped(Deal.owner_id)),
+        ],
+        "tasks": [
+            lambda db: TaskRepository(db).get_with_names(filters=scoped(Task.assigned_to)),
+            lambda db: TaskRepository(db).get_stats(filters=scoped(Task.assigned_to)),
+        ],
+        "sales": [
+            lambda db: SalesEntryRepository(db).get_with_names(
+                filters=scoped(SalesEntry.salesperson_id)
+            ),
+            lambda db: SalesEntryRepository(db).get_summary(
+                filters=scoped(SalesEntry.salesperson_id)
+            ),
+        ],
+        "partners": [
+            lambda db: PartnerRepository(db).get_with_assigned(
+                filters=scoped(Partner.assigned_to)
+            ),
+        ],
+        "accounts": [
+            lambda db: AccountRepository(db).get_with_owner(filters=scoped(Account.owner_id)),
+            lambda db: ContactRepository(db).get_with_names(filters=scoped(Contact.owner_id)),
+        ],
+        "calendar": [
+            lambda db: CalendarEventRepository(db).get_with_owner(
+                filters=scoped(CalendarEvent.owner_id)
+            ),
+        ],
+        "my-summary": [lambda db: DashboardService(db).get_my_summary(user)],
+        "search": [lambda db: SearchService(db).search("tech", user)],
+    }
+
+
+async def _load_user(session, email: str | None) -> User:
+    if email:
+        stmt = select(User).where(User.email == email)
+    else:
+        # The non-admin user with the most leads: a scope the indexes must serve
+        stmt = (
+            select(User)
+            .join(Lead, Lead.assigned_to == User.id)
+            .where(User.is_active.is_(True), User.role.notin_(ADMIN_ROLES))
+            .group_by(User.id)
+            .order_by(func.count().desc())
+        )
+    user = (await session.execute(stmt.limit(1))).scalar_one_or_none()
+    if user is None:
+        raise SystemExit(f"No user {email or 'with assigned leads'}; run seed_data.py first")
+    return user
+
+
+def _scans(node: dict) -> list[str]:
+    """Scan nodes of a plan tree, e.g. 'Index Scan using ix_... on leads'."""
+    scans = []
+    if "Relation Name" in node:
+        scan = f"{node['Node Type']}"
+        if "Index Name" in node:
+            scan += f" using {node['Index Name']}"
+        scans.append(f"{scan} on {node['Relation Name']}")
+    for child in node.get("Plans", []):
+        scans.extend(_scans(child))
+    return scans
+
+
+async def _explain(session, statement, params) -> dict:
+    plan = (await session.execute(_ExplainAnalyze(statement), params)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]
+
+
+async def main(email: str | None, only: list[str] | None, no_seqscan: bool) -> None:
+    settings.DASHBOARD_QUERY_CONCURRENCY = 1  # keep every query on the recorded session
+    seq_scans = 0
+    async with async_session() as session:
+        try:
+            if no_seqscan:
+                await session.execute(text("SET LOCAL enable_seqscan = off"))
+            user = await _load_user(session, email)
+            print(f"user {user.email} ({user.role})")
+            for name, calls in _cases(user).items():
+                if only and name not in only:
+                    continue
+                recorder = _RecordingSession(session)
+                for call in calls:
+                    await call(recorder)
+                print(f"\n== {name} ({len(recorder.statements)} statements)")
+                for i, (statement, params) in enumerate(recorder.statements, 1):
+                    plan = await _explain(session, statement, params)
+                    top = plan["Plan"]
+                    print(
+                        f"  #{i:<2} {plan['Execution Time']:8.2f} ms  "
+                        f"buffers hit {top.get('Shared Hit Blocks', 0)} "
+                        f"read {top.get('Shared Read Blocks', 0)}"
+                    )
+                    for scan in _scans(top):
+                        flag = "!" if scan.startswith("Seq Scan") else " "
+                        seq_scans += flag == "!"
+                        print(f"     {flag} {scan}")
+        finally:
+            await session.rollback()
+    await engine.dispose()
+    print(f"\n{seq_scans} sequential scan(s) flagged with '!'")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--email", help="User whose scope is replayed (default: top lead owner)")
+    parser.add_argument("--only", nargs="+", help="Query groups to run (default: all)")
+    parser.add_argument(
+        "--no-seqscan", action="store_true", help="Disable sequential scans for the transaction"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.email, args.only, args.no_seqscan))
@@ -0,0 +1,58 @@
+"""
+Garbage-collect stored files nothing references any more
+
+Runs two passes:
+
+1. quote PDFs: ``file_uploads`` rows under ``quotes/`` that no
+   ``quotes.pdf_url`` points at (left by rolled-back renders or workers that
+   exited before releasing a replaced PDF)
+2. blobs: ``file_blobs`` rows and files under UPLOAD_DIR whose content hash
+   no ``file_uploads`` row references
+
+Anything created or used within the grace period is kept, so uploads and
+renders in progress are never touched.  Safe to run from cron.
+
+Usage:
+    poetry run python scripts/gc_file_storage.py
+    poetry run python scripts/gc_file_storage.py --grace-seconds 86400
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.config import settings
+from app.database import async_session, engine
+from app.services.quote_service import QuoteService
+from app.utils.storage import collect_orphaned_blobs
+
+
+async def main(grace_seconds: int) -> None:
+    async with async_session() as session:
+        pdfs = await QuoteService(session).collect_orphaned_pdfs(grace_seconds)
+        await session.commit()
+    print(f"✓ Deleted {pdfs} orphaned quote PDFs")
+
+    for backend, stats in (await collect_orphaned_blobs(grace_seconds)).items():
+        print(
+            f"✓ {backend}: reclaimed {stats['blobs']} blobs "
+            f"({stats['bytes'] / 1_048_576:.1f} MB)"
+        )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--grace-seconds",
+        type=int,
+        default=settings.STORAGE_GC_GRACE_SECONDS,
+        help="Keep files created or used more recently (default: STORAGE_GC_GRACE_SECONDS)",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.grace_seconds))
@@ -0,0 +1,117 @@
+"""
+Convert legacy base64 file_uploads rows to the binary storage backends
+
+Rows written before the storage backends existed hold their content as
+base64 TEXT in ``file_uploads.data``.  This script decodes them one row at
+a time, writes the bytes to the target backend (``db`` = ``file_blobs``
+BYTEA rows, ``fs`` = files under UPLOAD_DIR, both keyed by SHA-256),
+points the row at the blob, and clears ``data``.  Each row is converted in
+its own transaction, so the script can be interrupted and re-run safely.
+
+Usage:
+    poetry run python scripts/migrate_file_storage.py                 # STORAGE_BACKEND
+    poetry run python scripts/migrate_file_storage.py --backend fs
+    poetry run python scripts/migrate_file_storage.py --dry-run
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import text
+
+from app.config import settings
+from app.database import engine
+from app.utils.storage import BACKEND_DB, BACKEND_FS, get_backend
+
+_PENDING_IDS = """
+SELECT id FROM file_uploads
+WHERE storage_backend = 'base64' AND id > :after
+ORDER BY id
+LIMIT :limit
+"""
+
+_UPDATE = """
+UPDATE file_uploads
+SET storage_backend = :storage_backend,
+    storage_key = :content_hash,
+    content_hash = :content_hash,
+    size_bytes = :size_bytes,
+    data = NULL,
+    updated_at = NOW()
+WHERE id = :id AND storage_backend = 'base64'
+"""
+
+
+async def _convert_row(file_id: int, backend: str, dry_run: bool) -> int:
+    async with engine.begin() as conn:
+        encoded = (
+            await conn.execute(
+                text("SELECT data FROM file_uploads WHERE id = :id FOR UPDATE"),
+                {"id": file_id},
+            )
+        ).scalar_one()
+        content = base64.b64decode(encoded)
+        del encoded
+        if dry_run:
+            return len(content)
+
+        content_hash = hashlib.sha256(content).hexdigest()
+        target = get_backend(backend)
+        if not await target.exists(content_hash):
+            await target.write(content_hash, content)
+        await conn.execute(
+            text(_UPDATE),
+            {
+                "id": file_id,
+                "storage_backend": backend,
+                "content_hash": content_hash,
+                "size_bytes": len(content),
+            },
+        )
+        return len(content)
+
+
+async def main(backend: str, batch_size: int, dry_run: bool) -> None:
+    converted = 0
+    total_bytes = 0
+    after = 0
+    while True:
+        async with engine.connect() as conn:
+            ids = (
+                await conn.execute(text(_PENDING_IDS), {"after": after, "limit": batch_size})
+            ).scalars().all()
+        if not ids:
+            break
+        for file_id in ids:
+            total_bytes += await _convert_row(file_id, backend, dry_run)
+            converted += 1
+        after = ids[-1]
+        print(f"   {converted} files, {total_bytes / 1_048_576:.1f} MB")
+
+    verb = "Would convert" if dry_run else "Converted"
+    print(f"✓ {verb} {converted} files ({total_bytes / 1_048_576:.1f} MB) to '{backend}'")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--backend",
+        choices=[BACKEND_DB, BACKEND_FS],
+        default=settings.STORAGE_BACKEND,
+        help="Target storage backend (default: STORAGE_BACKEND)",
+    )
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Decode and count rows without writing"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.backend, args.batch_size, args.dry_run))
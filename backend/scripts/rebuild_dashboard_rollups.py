@@ -0,0 +1,53 @@
+"""
+Rebuild / verify the dashboard rollup tables
+
+The dashboard reads sales and pipeline aggregates from ``sales_daily_rollups``
+and ``pipeline_rollups``.  They are maintained incrementally by the write
+paths; this script recomputes them from the raw tables or checks them
+for drift.
+
+Usage:
+    poetry run python scripts/rebuild_dashboard_rollups.py           # rebuild
+    poetry run python scripts/rebuild_dashboard_rollups.py --check   # verify only
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import async_session, engine
+from app.services.dashboard_rollup_service import DashboardRollupService
+
+
+async def main(check_only: bool) -> int:
+    async with async_session() as session:
+        service = DashboardRollupService(session)
+        if check_only:
+            report = await service.check_consistency()
+            print(json.dumps(report, indent=2))
+            exit_code = 0 if report["consistent"] else 1
+        else:
+            counts = await service.rebuild()
+            await session.commit()
+            for table, rows in counts.items():
+                print(f"✓ Rebuilt {table}: {rows} rows")
+            exit_code = 0
+    await engine.dispose()
+    return exit_code
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Compare the rollups against the raw tables without modifying them",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.check)))
@@ -49,6 +49,7 @@ from app.models import (
     Role,
 )
 from app.config import settings
+from app.services.user_hierarchy_service import UserHierarchyService
 
 # Database setup
 engine = create_async_engine(settings.DATABASE_URL, echo=False)
@@ -905,6 +906,10 @@ async def seed_database():
             events = await create_calendar_events(session, users, count=40)
             templates = await create_email_templates(session, users, count=10)
 
+            # Users were inserted directly, so derive the scoping closure table
+            await session.flush()
+            await UserHierarchyService(session).rebuild()
+
             # Commit all changes
             await session.commit()
 